@@ -115,9 +115,10 @@ setup(
     extras_require={  # Optional
         'dev': ['sphinx', 'sphinx_rtd_theme', 'sphinx-click', 'numpydoc',
                 'asv'],
-        'test': ['pytest', 'pytest-cov', 'tox', 'coverage', 'flake8',
-                 'epubcheck>=0.4'],
-        'termcolor': ['termcolor']  # MIT license
+        'test': ['pytest', 'pytest-cov', 'pytest-xdist>=3.2', 'tox',
+                 'coverage', 'flake8', 'epubcheck>=0.4'],
+        'termcolor': ['termcolor'],  # MIT license
+        'xxhash': ['xxhash'],  # 2-clause BSD license
     },
     scripts=['scripts/dm', ],
     entry_points={
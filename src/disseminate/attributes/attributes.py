@@ -1,6 +1,8 @@
 """
 Classes and methods to manage tag attributes
 """
+from sys import intern
+
 import regex
 
 from .. import settings
@@ -120,13 +122,19 @@ class Attributes(dict):
               objects.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
-        for string in filter(lambda x: isinstance(x, str), args):
-            self.load(string)
+        if args:
+            # Parse the attribute strings. Empty strings, like the attributes
+            # of most tags, have nothing to parse.
+            for string in args:
+                if string and isinstance(string, str):
+                    self.load(string)
 
-        # Remove strings (and None) from args
-        args = tuple(filter(lambda x: not isinstance(x, str) and x is not None,
-                            args))
+            # Remove strings (and None) from args
+            args = tuple(x for x in args
+                         if not isinstance(x, str) and x is not None)
 
         super().__init__(*args, **kwargs)
 
@@ -174,8 +182,10 @@ class Attributes(dict):
         for m in re_attrs.finditer(s):
             d = m.groupdict()
             if d.get('key', None) and d.get('value', None):
-                # Put the key-value pair in the attributes dict
-                attrs.append((d['key'], d['value'].strip('"').strip("'")))
+                # Put the key-value pair in the attributes dict. The keys are
+                # interned since the same keys recur between tags.
+                attrs.append((intern(d['key']),
+                              d['value'].strip('"').strip("'")))
 
             elif d.get('position', None):
                 value = d['position'].strip("'").strip('"')
@@ -360,30 +370,26 @@ class Attributes(dict):
     def strip(self, sep=settings.attribute_target_sep):
         """Replace the entries in this attributes dict without the
         target-specific terminators."""
+        # Find the keys without target-specific terminators
+        keys = list(self.keys())
+        stripped = [strip_attr(key, sep=sep) for key in keys]
+
+        # Nothing needs to be done if none of the keys have target-specific
+        # terminators, which is the case for most attributes
+        stripped_keys = {stripped_key
+                         for key, stripped_key in zip(keys, stripped)
+                         if stripped_key != key}
+        if not stripped_keys:
+            return None
+
         # Make a copy and reset this dict
         cp = self.copy()
         self.clear()
 
-        # Get all the keys to copy over
-        keys = list(cp.keys())
-
-        # Find target-specific terminators from keys.
-        stripped_keys = set()
-        for key in keys:
-            stripped_key = strip_attr(key, sep=sep)
-            if stripped_key != key:
-                stripped_keys.add(stripped_key)
-
-        # Remove keys that have target-specific entries
-        keys = [k for k in keys if k not in stripped_keys]
-
-        for key in keys:
-            stripped_key = strip_attr(key, sep=sep)
-
-            if key == stripped_key:
-                # use the key, if it hasn't been changed
-                self[key] = cp[key]
-            else:
+        # Copy over the entries, except those for keys that have
+        # target-specific entries
+        for key, stripped_key in zip(keys, stripped):
+            if key not in stripped_keys:
                 self[stripped_key] = cp[key]
 
     def filter(self, attrs=None, target=None,
@@ -436,6 +442,11 @@ class Attributes(dict):
         >>> attrs.filter(attrs='tgt')
         Attributes{'tgt': 'default'}
         """
+        # Empty attributes dicts, like those for most tags, have nothing to
+        # filter
+        if not self:
+            return Attributes()
+
         target = target.strip('.') if isinstance(target, str) else target
 
         # Setup the returned attributes dict
@@ -445,17 +456,21 @@ class Attributes(dict):
         attrs = ([attrs] if isinstance(attrs, str) or
                  isinstance(attrs, PositionalValue)
                  else attrs)  # wrap strings
-        attrs = (list(self.keys())
-                 if attrs is None else attrs)  # populate empty attrs
-        attrs = uniq(attrs)  # general attrs
-
-        if not sort_by_attrs:
-            # Sort the attrs so that they follow the same order as keys in
-            # this dict. This ensures the results of filter are deterministic
-            # and not random, if the attrs are an unordered iterable, like a
-            # set
-            order = {k: num for num, k in enumerate(self.keys())}
-            attrs = sorted(attrs, key=lambda x: order.get(x, len(order)))
+
+        if attrs is None:
+            # Populate empty attrs. The keys of this dict are already unique
+            # and in order
+            attrs = list(self.keys())
+        else:
+            attrs = uniq(attrs)  # general attrs
+
+            if not sort_by_attrs:
+                # Sort the attrs so that they follow the same order as keys in
+                # this dict. This ensures the results of filter are
+                # deterministic and not random, if the attrs are an unordered
+                # iterable, like a set
+                order = {k: num for num, k in enumerate(self.keys())}
+                attrs = sorted(attrs, key=lambda x: order.get(x, len(order)))
 
         # Find keys to remove
         if target is not None:
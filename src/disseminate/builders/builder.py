@@ -4,12 +4,14 @@ Objects to manage builds
 import logging
 import pathlib
 from abc import ABCMeta
+from functools import lru_cache
 from string import Formatter
 from distutils.spawn import find_executable
 
 import pathvalidate
 
-from .executor import executor, run, runtime_error, runtime_success
+from .executor import (executor, run, runtime_error, runtime_success,
+                       wait_running)
 from .utils import generate_outfilepath, generate_mock_parameters
 from .exceptions import BuildError
 from ..signals import signal
@@ -19,10 +21,24 @@ from ..paths import TargetPath
 from .. import settings
 
 
+@lru_cache(maxsize=64)
+def parse_format(format_string):
+    """Parse a format string into a tuple of (literal_text, field_name,
+    format_spec, conversion) items.
+
+    The results are cached since builder actions are class attributes, and
+    the same actions are formatted for each builder run.
+    """
+    return tuple(Formatter().parse(format_string))
+
+
 class CustomFormatter(Formatter):
     """A custom formatter class for preparing actions into command-line
     arguments."""
 
+    def parse(self, format_string):
+        return parse_format(format_string)
+
     def get_field(self, field_name, args, kwargs):
         field_value, field_name = super().get_field(field_name, args, kwargs)
         if isinstance(field_value, list) or isinstance(field_value, tuple):
@@ -39,6 +55,9 @@ class CustomFormatter(Formatter):
         return str(f).strip('-*`')
 
 
+formatter = CustomFormatter()
+
+
 class Builder(metaclass=ABCMeta):
     """A build for an output file.
 
@@ -232,18 +251,22 @@ class Builder(metaclass=ABCMeta):
         if self.missing_parameters:
             return "missing (parameters)"
 
+        # If a process is open and isn't done, then a build is currently in
+        # process. This is checked before the build decision, which may need
+        # to hash the input and output files, since the status is polled
+        # while the process runs.
+        future = self.future
+        if future is not None and not future.done():
+            return "building"
+
         # If a build is not needed or the process is done, then the build is
         # done
         if not self.build_needed():
             return "done"
 
-        # If a process is open (self.open is not None), then a build is
-        # currently in process
+        # If a process was opened (self.future is not None), then check the
+        # result of the process
         if self.future is not None:
-            if not self.future.done():
-                # The process isn't done.
-                return "building"
-
             if self.future.cancelled():
                 return "cancelled"
 
@@ -430,8 +453,7 @@ class Builder(metaclass=ABCMeta):
             A tuple of the arguments to run in a process.
         """
         if isinstance(self.action, str):
-            fmt = CustomFormatter()
-            fmt_action = fmt.format(self.action, builder=self)
+            fmt_action = formatter.format(self.action, builder=self)
             return tuple(fmt_action.split())
         else:
             return tuple()
@@ -472,15 +494,24 @@ class Builder(metaclass=ABCMeta):
             used in conjunction with an environment to make sure a set of
             builds are completed or the build complete=True should be used.
         """
+        # The status is evaluated once after each command, and the last
+        # evaluated status is returned
+        status = self.status
         if complete:
             # Run while this builder is either ready to build or a build is
             # ongoing.
-            while self.status in {'building', 'ready'}:
-                self.run_cmd()
-        else:
-            if self.status in {'building', 'ready'}:
+            while status in {'building', 'ready'}:
                 self.run_cmd()
-        return self.status
+                status = self.status
+
+                # Wait for the process to finish before polling again
+                if status == 'building':
+                    wait_running([self.future])
+                    status = self.status
+        elif status in {'building', 'ready'}:
+            self.run_cmd()
+            status = self.status
+        return status
 
     @classmethod
     def find_builder_cls(cls, in_ext, out_ext=None, target=None,
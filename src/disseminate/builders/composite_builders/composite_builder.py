@@ -1,4 +1,5 @@
 from ..builder import Builder
+from ..executor import wait_running
 
 
 class CompositeBuilder(Builder):
@@ -95,6 +96,7 @@ class CompositeBuilder(Builder):
         if complete:
             while self.status in {'building', 'ready'}:
                 run_build_once(self)
+                self.wait_running()
         else:
             if self.status in {'building', 'ready'}:
                 run_build_once(self)
@@ -157,6 +159,19 @@ class CompositeBuilder(Builder):
         return [b.future for b in self.flatten(builder=builder)
                 if getattr(b, 'future', None) is not None]
 
+    def wait_running(self, timeout=None):
+        """Wait for the process of a subbuilder to finish.
+
+        This is called after a round of the build, which has already started
+        the subbuilders that are ready to build.
+
+        Parameters
+        ----------
+        timeout : Optional[float]
+            The maximum time (in seconds) to wait. If None, there is no limit.
+        """
+        wait_running(self.futures(), timeout=timeout)
+
     def print(self, level=1, max_level=None):
         """Print the builder and subbuilders"""
 
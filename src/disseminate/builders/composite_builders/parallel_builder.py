@@ -1,3 +1,5 @@
+import pathlib
+
 from .composite_builder import CompositeBuilder
 from ...paths.utils import find_file
 
@@ -85,11 +87,26 @@ class ParallelBuilder(CompositeBuilder):
             builder_cls = self.find_builder_cls(in_ext=in_ext, out_ext=out_ext,
                                                 target=target)
 
+        # Builds without input files, like rendered equations, have
+        # outfilepaths named from the hash of their parameters. Reuse an
+        # existing build for the same outfilepath so that the same content
+        # is only built once.
+        has_infilepaths = any(isinstance(p, pathlib.Path) for p in parameters)
+
         # Create the builder
         builder = builder_cls(env=self.env, parameters=parameters,
                               outfilepath=outfilepath, context=context,
                               target=target, **kwargs)
 
+        if not has_infilepaths:
+            outfilepath = builder.outfilepath
+            existing = next((sb for sb in self.subbuilders
+                             if type(sb) is builder_cls and
+                             outfilepath is not None and
+                             sb.outfilepath == outfilepath), None)
+            if existing is not None:
+                return existing
+
         self.subbuilders.append(builder)
 
         return builder
@@ -2,7 +2,7 @@
 The pool executor for running multiple functions at once.
 """
 import logging
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from multiprocessing import cpu_count
 from collections import namedtuple
 import subprocess
@@ -16,17 +16,45 @@ PopenResult = namedtuple('PopenResult', 'returncode args stdout stderr')
 
 
 def run(timeout, **kwargs):
-    """Run the command with the given arguments."""
+    """Run the command with the given arguments.
+
+    The output of the process is read while it runs so that processes with
+    more output than the pipe buffers, like LaTeX runs, don't block. A process
+    that doesn't finish within the timeout is killed.
+    """
     popen = subprocess.Popen(**kwargs, stdout=subprocess.PIPE,
                              stderr=subprocess.PIPE, bufsize=4096,)
-    popen.wait(timeout=timeout)
-    stdout, stderr = popen.communicate()
+    try:
+        stdout, stderr = popen.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        popen.kill()
+        popen.communicate()
+        raise
     return PopenResult(returncode=popen.returncode,
                        args=popen.args,
                        stdout=stdout.decode('latin1'),
                        stderr=stderr.decode('latin1'))
 
 
+def wait_running(futures, timeout=None):
+    """Wait until one of the running futures is done.
+
+    Builders poll their status until their processes are done. Waiting on
+    the running futures between polls, instead of polling continuously,
+    frees the interpreter for the other builds in the pool.
+
+    Parameters
+    ----------
+    futures : List[:obj:`concurrent.futures.Future`]
+        The futures for the processes of builders.
+    timeout : Optional[float]
+        The maximum time (in seconds) to wait. If None, there is no limit.
+    """
+    running = [future for future in futures if not future.done()]
+    if running:
+        wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+
+
 @staticmethod
 def runtime_success(future):
     """Test whether a future from a subprocess is successful."""
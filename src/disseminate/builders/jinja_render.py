@@ -3,6 +3,7 @@ A builder that renders a string to a file.
 """
 import pathlib
 import logging
+from collections import OrderedDict
 
 import jinja2
 import jinja2.meta
@@ -13,9 +14,16 @@ from .utils import generate_mock_parameters, generate_outfilepath
 from ..paths import SourcePath
 from ..paths.utils import find_file
 from ..utils.list import uniq
+from ..utils.string import fasthash
 from ..utils.classes import weakattr
 from .. import settings
 
+#: The jinja environment shared by JinjaRender builders
+_jinja_environment = None
+
+#: The selected jinja templates, keyed by the template filepath and target
+_templates = dict()
+
 
 def run(template, context, outfilepath, target):
     """Run the command with the given arguments."""
@@ -112,8 +120,14 @@ class JinjaRender(Builder):
         self.context = context
 
     def jinja_environment(self):
-        """The jinja environment."""
-        if getattr(self.env, '_jinja_environment', None) is None:
+        """The jinja environment.
+
+        The jinja environment is shared by all build environments so that
+        templates are only loaded and compiled once. Changed templates are
+        reloaded by the jinja environment.
+        """
+        global _jinja_environment
+        if _jinja_environment is None:
             # Create the loaders
             dl = jinja2.PackageLoader('disseminate', 'templates')
 
@@ -123,19 +137,29 @@ class JinjaRender(Builder):
                                      keep_trailing_newline=True,)
             env.filters['rewrite_path'] = rewrite_path
 
-            self.env._jinja_environment = env
-        return self.env._jinja_environment
+            _jinja_environment = env
+        return _jinja_environment
 
     def template(self):
         """Retrieve the template from the context"""
         context = self.context
-        # Get the template filepath and convert to a pathlib.Path
+        # Get the template filepath
         template_filepath = context.get('template', 'default')
-        template_filepath = pathlib.Path(template_filepath)
 
         # get the target extension without a period
         target = self.render_ext.strip('.')
 
+        # See if the template was already selected for this template filepath
+        # and target. Cached templates are used as long as their files
+        # haven't changed.
+        key = (str(template_filepath), target)
+        template = _templates.get(key)
+        if template is not None and template.is_up_to_date:
+            return template
+
+        # Convert the template filepath to a pathlib.Path
+        template_filepath = pathlib.Path(template_filepath)
+
         # create the list of template paths to search
         # path1. ex: 'default '/ 'html' / 'template' '.html'
         path1 = template_filepath / target / 'template'
@@ -147,12 +171,13 @@ class JinjaRender(Builder):
         # path3: ex: 'default/xhtml/toc.xhtml'
         path3 = template_filepath
 
-        templates = list(map(str, [path1, path2, path3]))
         # Get the Jinja2 environment
         jinja_env = self.jinja_environment()
 
         # Retrieve the template
-        template = jinja_env.get_or_select_template(templates)
+        template = jinja_env.get_or_select_template([str(path1), str(path2),
+                                                     str(path3)])
+        _templates[key] = template
         return template
 
     @property
@@ -280,6 +305,50 @@ class JinjaRender(Builder):
 
 # Utilities
 
+#: Cache of the names of templates referenced by a template, keyed by the
+#: fasthash of the template's source. The least recently used entries are
+#: removed when the cache exceeds _referenced_templates_maxsize.
+_referenced_templates = OrderedDict()
+_referenced_templates_maxsize = 64
+
+
+def referenced_templates(source, environment):
+    """Return the names of the templates referenced (extended, included or
+    imported) by a template's source.
+
+    Parsing the Jinja2 AST of a template is expensive, and the results are
+    cached by the hash of the template source so that unchanged templates are
+    only parsed once.
+
+    Parameters
+    ----------
+    source : str
+        The template source.
+    environment : :obj:`jinja2.Environment`
+        The jinja2 environment object
+
+    Returns
+    -------
+    names : Tuple[str]
+        The names of the referenced templates.
+    """
+    key = fasthash(source)
+    names = _referenced_templates.get(key)
+
+    if names is None:
+        # Produce a Jinja2 AST from the source and get the names of all
+        # parent templates
+        ast = environment.parse(source)
+        names = tuple(jinja2.meta.find_referenced_templates(ast))
+        _referenced_templates[key] = names
+
+        if len(_referenced_templates) > _referenced_templates_maxsize:
+            _referenced_templates.popitem(last=False)
+    else:
+        _referenced_templates.move_to_end(key)
+    return names
+
+
 def template_filepaths(template, environment):
     """Return a list of filepaths from a Jinja2 template object.
 
@@ -311,13 +380,11 @@ def template_filepaths(template, environment):
                                 subpath=template_filename.name))
 
     # Load the source code for the template using the loader
-    source = loader.get_source(environment, name)
-
-    # Produce a Jinja2 AST from the source
-    ast = environment.parse(source)
+    source, _, _ = loader.get_source(environment, name)
 
-    # Get a list of all parent template names from the AST
-    parent_names = list(jinja2.meta.find_referenced_templates(ast))
+    # Get a list of all parent template names
+    parent_names = referenced_templates(source=source,
+                                        environment=environment)
 
     # Convert the parent names to template file paths (render paths)
     # This is done by loading the parent template objects.
@@ -1,6 +1,8 @@
 """
 A scanner object to find implicit dependencies.
 """
+import os.path
+
 from ...paths import SourcePath, TargetPath
 from ...utils.classes import all_subclasses
 
@@ -97,22 +99,29 @@ class Scanner(object):
                 root = root / parameter.target
             subpath = parameter.subpath.parent
 
+            # The candidate paths are checked as strings, and a SourcePath is
+            # only created for the path of the file found.
+            root_str = str(root)
+            subpath_str = str(subpath)
+
             for stub in stubs:
                 # Strip leading slashes so that the stub is not an absolute
                 # path
                 stub = stub.strip('/')
 
-                test_paths = [SourcePath(project_root=root,
-                                         subpath=subpath / stub),
-                              SourcePath(project_root=root,
-                                         subpath=stub)]
-                valid_paths = [p for p in test_paths if p.is_file()]
+                test_subpaths = (os.path.join(subpath_str, stub), stub)
+                valid_subpaths = [s for s in test_subpaths
+                                  if os.path.isfile(os.path.join(root_str, s))]
 
                 # If no files are found, raise an exception
-                if not valid_paths and raise_error:
+                if not valid_subpaths and raise_error:
+                    test_paths = [SourcePath(project_root=root, subpath=s)
+                                  for s in test_subpaths]
                     msg = "Could not find the file '{}' in paths: '{}'"
                     raise FileNotFoundError(msg.format(stub, test_paths))
                 else:
-                    new_infilepaths.append(valid_paths[0])
+                    valid_path = SourcePath(project_root=root,
+                                            subpath=valid_subpaths[0])
+                    new_infilepaths.append(valid_path)
 
         return new_infilepaths
@@ -129,6 +129,7 @@ def build(document, complete=True):
     if complete:
         while root_builder.status in {'building', 'ready'}:
             root_builder.build(complete=False)
+            root_builder.wait_running()
     else:
         if root_builder.status in {'building', 'ready'}:
             root_builder.build(complete=False)
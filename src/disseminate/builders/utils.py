@@ -2,6 +2,7 @@
 Utilities for builders and environments
 """
 import pathlib
+from functools import lru_cache
 
 from .deciders.utils_hash import hash_items
 from ..paths import SourcePath, TargetPath
@@ -18,6 +19,34 @@ def sort_key(parameter):
         return str(parameter)
 
 
+@lru_cache(maxsize=128)
+def subpath_segments(subpath, strip_suffix=False):
+    """Split a subpath into its parent and filename segments.
+
+    The results are cached since the same document subpaths are split for
+    each set of mock parameters generated.
+
+    Parameters
+    ----------
+    subpath : :obj:`pathlib.Path`
+        The subpath to split.
+    strip_suffix : Optional[bool]
+        If True, remove the suffix from the filename.
+
+    Returns
+    -------
+    parent, filename : Tuple[:obj:`pathlib.Path`, str]
+        The parent directory and filename of the subpath.
+
+    Examples
+    --------
+    >>> subpath_segments(pathlib.Path('chapter1/test.dm'), strip_suffix=True)
+    (PosixPath('chapter1'), 'test')
+    """
+    subpath = subpath.with_suffix('') if strip_suffix else subpath
+    return subpath.parent, subpath.name
+
+
 def generate_mock_parameters(env, parameters, project_root=None, subpath=None,
                              ext=None, context=None, gen_hash=True):
     """Generate a mock set of parameters.
@@ -52,21 +81,26 @@ def generate_mock_parameters(env, parameters, project_root=None, subpath=None,
     project_root = (project_root or env.project_root)
 
     # Next get the subpath
+    strip_suffix = False
     if subpath is None:
         filepaths = [i for i in parameters if hasattr(i, 'subpath')]
+        strip_suffix = True
 
         if filepaths:
             # First check to see if any of the passed parameters have a subpath
-            subpath = filepaths[0].subpath.with_suffix('')
+            subpath = filepaths[0].subpath
         elif context is not None and 'src_filepath' in context:
             # Otherwise construct the filepath from the context's src_filepath
             src_filepath = context['src_filepath']
-            subpath = src_filepath.subpath.with_suffix('')
+            subpath = src_filepath.subpath
 
     # Split the subpath and filename, if available and these aren't
     # specified.
-    filename = getattr(subpath, 'name', None)
-    subpath = getattr(subpath, 'parent', None)
+    if subpath is not None:
+        subpath, filename = subpath_segments(subpath,
+                                             strip_suffix=strip_suffix)
+    else:
+        filename = None
 
     # Generate a hash
     if gen_hash:
@@ -146,6 +180,47 @@ def generate_outfilepath(env, parameters, target=None, append=None, ext=None,
     target_root = env.cache_path if use_cache else env.target_root
     media_path = env.media_path if use_media else None
 
+    return target_filepath(infilepath=infilepath, target_root=target_root,
+                           target=target, append=append, ext=ext,
+                           media_path=media_path)
+
+
+def target_filepath(infilepath, target_root, target=None, append=None,
+                    ext=None, media_path=None):
+    """Generate the target filepath for an infilepath.
+
+    Unlike :func:`generate_outfilepath`, this function only depends on its
+    arguments, and it doesn't need a build environment or document.
+
+    Parameters
+    ----------
+    infilepath : :obj:`pathlib.Path`
+        The input filepath. The subpath of source paths is used.
+    target_root : :obj:`pathlib.Path`
+        The target root directory for the target filepath.
+    target : Optional[str]
+        If specified, use the given target as a subdirectory in the
+        target_root.
+    append : Optional[str]
+        If specified, append the given string to the returned filename
+    ext : Optional[str]
+        If specified, return a filepath with the given extension.
+    media_path : Optional[:obj:`pathlib.Path`]
+        If specified, prepend the media_path to the subpath.
+
+    Returns
+    -------
+    target_filepath : :obj:`.paths.TargetPath`
+        The target filepath.
+
+    Examples
+    --------
+    >>> fp = target_filepath(SourcePath(project_root='src',
+    ...                                 subpath='sub1/index.dm'),
+    ...                      target_root='.', target='.html', ext='.html')
+    >>> fp
+    TargetPath('html/sub1/index.html')
+    """
     # Formulate the target
     if isinstance(target, str):
         target = target.strip('.')
@@ -101,21 +101,20 @@ class BaseContext(dict):
     def __init__(self, *args, **kwargs):
         super().__init__()
 
-        kwargs.update(*args)
+        # Collect the initial values from the positional and keyword arguments
+        # in a single dict
+        initial_values = kwargs
+        initial_values.update(*args)
 
         # Remove protected keys
-        for k in {'_parent_context', '_initial_values'}:
-            if k in kwargs:
-                del kwargs[k]
+        for k in ('_parent_context', '_initial_values'):
+            initial_values.pop(k, None)
 
         # Store the parent context
-        if 'parent_context' in kwargs:
-            parent = kwargs.get('parent_context', None)
-            del kwargs['parent_context']
-            self.parent_context = parent
+        if 'parent_context' in initial_values:
+            self.parent_context = initial_values.pop('parent_context')
 
         # Store the initial values
-        initial_values = dict(*args, **kwargs)
         self.initial_values = initial_values
 
         # Reset the dict with the default_context and parent_context values
@@ -1,4 +1,6 @@
 """Utilities for contexts."""
+from functools import lru_cache
+
 import regex
 
 from ..utils.string import str_to_dict
@@ -56,7 +58,28 @@ def load_from_string(string):
         # Get the header part of the string
         string = m.groupdict()['header']
 
-    # Parse the string
-    d = str_to_dict(string)
+    # Parse the string. A copy of the cached dict is returned so that the
+    # cached dict isn't modified.
+    d = dict(parse_header(string))
 
     return rest, d
+
+
+@lru_cache(maxsize=128)
+def parse_header(header):
+    """Parse a header string into a dict.
+
+    Headers are parsed each time a document or a template's context file is
+    loaded, and the parsed dicts are cached for unchanged header strings.
+
+    Parameters
+    ----------
+    header : str
+        The header string to parse.
+
+    Returns
+    -------
+    parsed_dict : dict
+        The parsed dict with keys and values as strings.
+    """
+    return str_to_dict(header)
@@ -2,6 +2,7 @@
 Classes and functions for rendering documents.
 """
 from shutil import rmtree
+from stat import S_ISREG
 from collections import OrderedDict
 import logging
 import pathlib
@@ -187,6 +188,13 @@ class Document(object):
         target_filepath : Union[:obj:`TargetPath <.paths.TargetPath>`, None]
             The target filepath.
         """
+        # The target filepath is taken directly from the document's target
+        # builder, when available, without emitting the find_builder signal.
+        # The builder's outfilepath isn't cached since it can be changed.
+        target = target if target.startswith('.') else '.' + target
+        builder = self.context.get('builders', dict()).get(target)
+        if builder is not None:
+            return builder.outfilepath
         return self.context.target_filepath(target=target)
 
     @property
@@ -298,9 +306,15 @@ class Document(object):
 
         return list(doc_dict.values())
 
-    def load_required(self):
+    def load_required(self, src_mtime=None):
         """Evaluate whether a load is required.
 
+        Parameters
+        ----------
+        src_mtime : Optional[float]
+            The modification time of the source file, if it has already been
+            retrieved. Otherwise, it is read from the source file.
+
         Returns
         -------
         load_required : bool
@@ -323,7 +337,8 @@ class Document(object):
 
         # 3. The mtime for the file is now later than the one stored in the
         #    context--i.e. the user saved the file.
-        src_mtime = self.src_filepath.stat().st_mtime
+        if src_mtime is None:
+            src_mtime = self.src_filepath.stat().st_mtime
         last_mtime = self.mtime
         if last_mtime is None or src_mtime > last_mtime:
             logging.debug("Load required for {}: The '{}' source file is "
@@ -360,19 +375,23 @@ class Document(object):
             True, if a sub-document was (re)loaded.
         """
         document_loaded = False
-        # Check to make sure the file exists
-        if not self.src_filepath.is_file():  # file must exist
+        # Check to make sure the file exists. The file's stat is retrieved
+        # once and used for the checks below.
+        try:
+            stat = self.src_filepath.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            stat = None
+        if stat is None or not S_ISREG(stat.st_mode):  # file must exist
             msg = "The source document '{}' must exist."
             raise exceptions.DocumentException(msg.format(self.src_filepath))
 
         # Load document if a load is required or forced
-        if self.load_required() or reload:
+        if reload or self.load_required(src_mtime=stat.st_mtime):
 
             # The document hasn't been loaded yet. Reset the flat
             self._succesfully_loaded = False
 
             # Check to make sure the file is reasonable
-            stat = self.src_filepath.stat()
             filesize = stat.st_size
             if filesize > settings.document_max_size:
                 msg = ("The source document '{}' has a file size ({} kB) "
@@ -383,8 +402,10 @@ class Document(object):
                                  max_filesize)
                 raise exceptions.DocumentException(msg)
 
-            # Emit the load signal
-            signals.document_onload.emit(document=self, context=self.context)
+            # Emit the load signal. The source file's mtime is passed so that
+            # the file isn't stat-ed again when the context is reset.
+            signals.document_onload.emit(document=self, context=self.context,
+                                         src_mtime=stat.st_mtime)
 
             # The document has been loaded
             self._succesfully_loaded = True
@@ -122,7 +122,15 @@ class DocumentContext(BaseContext):
         # Conduct the rest of the initializations, including the reset.
         super(DocumentContext, self).__init__(*args, **kwargs)
 
-    def reset(self):
+    def reset(self, src_mtime=None):
+        """Reset the context to its initial state.
+
+        Parameters
+        ----------
+        src_mtime : Optional[float]
+            The modification time of the document's source file, if it has
+            already been retrieved. Otherwise, it is read from the source file.
+        """
         super(DocumentContext, self).reset()
         # Make sure the following entries are present from the parent or
         # root context
@@ -139,8 +147,13 @@ class DocumentContext(BaseContext):
             self['doc_id'] = str(self['doc_id'])
 
         # set the document's mtime
-        if src_filepath.exists():
-            self['mtime'] = src_filepath.stat().st_mtime
+        if src_mtime is not None:
+            self['mtime'] = src_mtime
+        else:
+            try:
+                self['mtime'] = src_filepath.stat().st_mtime
+            except FileNotFoundError:
+                pass
 
         # The the root document, if it wasn't set already
         if self.get('root_document', None) is None:
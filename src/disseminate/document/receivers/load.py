@@ -1,6 +1,8 @@
 """
 A receiver to load the document's string in the document context
 """
+import os
+
 from ..signals import document_onload
 from ... import settings
 
@@ -8,8 +10,13 @@ from ... import settings
 @document_onload.connect_via(order=200)
 def load_document(document, **kwargs):
     """Load the document text file into the document context."""
-    # Load the string from the src_filepath,
-    string = document.src_filepath.read_text()
+    # Load the string from the src_filepath. The mtime is read from the open
+    # file so that it matches the loaded string, even if the file is saved
+    # while it's being loaded.
+    with open(document.src_filepath) as f:
+        string = f.read()
+        mtime = os.fstat(f.fileno()).st_mtime
+    document.context['mtime'] = mtime
 
     # Place the text of the string in the 'body' attribute of the
     # context (see settings.body_attr)
@@ -1,9 +1,11 @@
 """
 A receiver to process headers in a context
 """
-import regex
+from functools import lru_cache
 import pathlib
 
+import regex
+
 from ..signals import document_onload
 from ...context import BaseContext
 from ...context.utils import find_header_entries, load_from_string
@@ -47,20 +49,15 @@ def process_headers(context, **kwargs):
     #    templates. The template_name may be different from the header_context
     #    than the one specified in this context.
     template_name = header_context.get('template') or context.get('template')
-    template_paths = find_template_paths(template_name=template_name)
-
-    for template_path in list(template_paths):
-        template_paths += find_jinja2_parent_templates(template_path)
-    template_paths = uniq(template_paths)
+    template_paths, fps = find_template_context_paths(template_name)
+    template_paths = list(template_paths)
 
-    # Next, find the additional context files and load their context values.
+    # Next, load the context values from the additional context files.
     # These are done in *reverse* order because the parent templates are
     # listed last and the child templates listed first. The child template
     # values take precedence.
     template_context = BaseContext()
 
-    # Get the additional context filepaths in reverse order
-    fps = find_additional_context_filepaths(template_paths[::-1])
     for context_filepath in fps:
         template_context.load(context_filepath.read_text())
 
@@ -75,6 +72,38 @@ def process_headers(context, **kwargs):
     context.match_update(header_context, overwrite=True)
 
 
+@lru_cache(maxsize=32)
+def find_template_context_paths(template_name):
+    """Find the template paths and additional context filepaths for a
+    template name.
+
+    The template paths only depend on the template name, and these are cached
+    so that sub-documents using the same template as their parent document
+    do not search the template directories again.
+
+    Parameters
+    ----------
+    template_name : str
+        The name of the template. ex: books/tufte
+
+    Returns
+    -------
+    template_paths, context_filepaths : Tuple[Tuple[:obj:`pathlib.Path`], \
+        Tuple[:obj:`pathlib.Path`]]
+        The template path directories for the template and its parent
+        templates, and the additional context filepaths in reverse order.
+    """
+    template_paths = find_template_paths(template_name=template_name)
+
+    for template_path in list(template_paths):
+        template_paths += find_jinja2_parent_templates(template_path)
+    template_paths = uniq(template_paths)
+
+    # Get the additional context filepaths in reverse order
+    fps = find_additional_context_filepaths(template_paths[::-1])
+    return tuple(template_paths), tuple(fps)
+
+
 def find_template_paths(template_name):
     """Find template paths from a template name.
 
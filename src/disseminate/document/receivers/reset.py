@@ -5,12 +5,13 @@ from ..signals import document_onload, document_deleted
 
 
 @document_onload.connect_via(order=100)
-def reset_document(document, **kwargs):
+def reset_document(document, src_mtime=None, **kwargs):
     """Reset the context and managers for a document on load."""
     context = document.context or dict()
 
-    # Reset the context
-    context.reset()
+    # Reset the context. The source file's mtime is passed, if it was already
+    # retrieved by the document.
+    context.reset(src_mtime=src_mtime)
 
     return document
 
@@ -13,7 +13,8 @@ document_deleted = signal('document_deleted',
 document_onload = signal('document_onload',
                          doc="Signal sent when a document is loaded. "
                          "Receivers take a document or document context "
-                         "parameter.")
+                         "parameter, and the source file's mtime (src_mtime) "
+                         "is also passed.")
 
 document_build = signal('document_build',
                         doc="Signal sent when a document's targets are "
@@ -43,9 +43,12 @@ def tex_cmd(cmd, attributes='', formatted_content=None, indent=None):
         msg = "Cannot use the LaTeX command '{}'"
         raise TexFormatError(msg.format(cmd))
 
-    # Format the attributes
-    attributes = (Attributes(attributes) if isinstance(attributes, str) else
-                  attributes)
+    # Format the attributes. Empty attributes, like the default empty string,
+    # do not need to be parsed
+    if not attributes:
+        attributes = Attributes()
+    elif isinstance(attributes, str):
+        attributes = Attributes(attributes)
 
     # Get the required arguments
     if cmd in settings.tex_cmd_arguments:
@@ -123,9 +126,12 @@ def tex_env(env, attributes, formatted_content, min_newlines=False,
         msg = "Cannot use the LaTeX environment '{}'"
         raise TexFormatError(msg.format(env))
 
-    # Format the attributes
-    attributes = (Attributes(attributes) if isinstance(attributes, str) else
-                  attributes)
+    # Format the attributes. Empty attributes, like the default empty string,
+    # do not need to be parsed
+    if not attributes:
+        attributes = Attributes()
+    elif isinstance(attributes, str):
+        attributes = Attributes(attributes)
 
     # Get the required arguments
     # Get the required arguments
@@ -155,21 +161,19 @@ def tex_env(env, attributes, formatted_content, min_newlines=False,
         opts_str = ''
 
     # Add a leading and trailing new line to the formatted_content,
-    # if there isn't one
-    formatted_content = ('\n' + formatted_content
-                         if not formatted_content.startswith('\n') else
-                         formatted_content)
-    formatted_content = (formatted_content + '\n'
-                         if not formatted_content.endswith('\n') else
-                         formatted_content)
+    # if there isn't one. These are added when the environment is formatted
+    # so that the formatted_content is only copied once.
+    leading = '' if formatted_content.startswith('\n') else '\n'
+    trailing = ('' if not formatted_content or formatted_content.endswith('\n')
+                else '\n')
 
     # format the tex environment
-    tex_text = ("\\begin" + '{' + env + '}' +
-                reqs_str +
-                opts_str +
-                (' %' if min_newlines else '') +
-                formatted_content +
-                "\\end{" + env + "}")
+    tex_text = ''.join(("\\begin{", env, "}",
+                        reqs_str,
+                        opts_str,
+                        ' %' if min_newlines else '',
+                        leading, formatted_content, trailing,
+                        "\\end{", env, "}"))
 
     # Indent the text block, if specified
     if indent is not None:
@@ -1,8 +1,6 @@
 """
 Utilities for formatting html strings and text.
 """
-from itertools import groupby
-
 from lxml.builder import E, ElementMaker
 from lxml import etree
 from lxml.etree import Entity
@@ -265,33 +263,39 @@ def xhtml_list(*elements, attributes=None, listtype='ol', level=1,
     """
     method = 'xml' if method == 'xhtml' else method
 
-    current_elements = []
-    listlevel = elements[0][0] if elements else 0
-
-    _count = 0
-
-    # Setup a counter function for list levels. When a new list item is
-    # encountered, all sub items will receive the same number so that they're
-    # grouped together.
-    def counter(item):
-        nonlocal _count
-        if item[0] == listlevel:
-            _count += 1
-        return _count
-
-    # Go by each list item and its group of sublists
-    for is_same_list, group in groupby(elements, counter):
-        group = list(group)
-
-        # Add the parent list item
-        current_elements.append(group[0][1])
-
-        # If there are sub list items, add these as well
-        if group[1:]:
-            lst = xhtml_list(*group[1:], listtype=listtype, level=level + 1,
-                             target=target, method=method,
-                             pretty_print=pretty_print, inner=True)
-            current_elements.append(lst)
+    # Build the nested lists in a single pass using a stack of open lists.
+    # Each open list is a (listlevel, list_elements) tuple. A list item is
+    # added to the outermost open list with a matching listlevel, and the lists
+    # nested within it are closed. Otherwise, the list item starts a new sub
+    # list under the last list item of the innermost open list.
+    stack = [(elements[0][0] if elements else 0, [])]
+
+    def close_list():
+        """Close the innermost open list and add it to its parent list"""
+        sub_level = level + len(stack) - 1
+        _, sub_elements = stack.pop()
+        lst = xhtml_tag(name=listtype, formatted_content=sub_elements,
+                        attributes='', level=sub_level + 1, target=target,
+                        method=method, pretty_print=pretty_print)
+        stack[-1][1].append(lst)
+
+    for listlevel, element in elements:
+        index = next((i for i, (open_level, _) in enumerate(stack)
+                      if open_level == listlevel), None)
+
+        if index is None:
+            # Start a new sub list
+            stack.append((listlevel, [element]))
+        else:
+            # Close the sub lists and add the list item
+            while len(stack) > index + 1:
+                close_list()
+            stack[-1][1].append(element)
+
+    # Close the remaining sub lists
+    while len(stack) > 1:
+        close_list()
+    current_elements = stack[0][1]
 
     # Wrap current_elements in a list
     attributes = attributes if not inner else ''
@@ -65,12 +65,17 @@ class LabelManager(object):
     labels : Dict[Tuple[str,str], :obj:`Label <.label_manager.types.Label>`]
         A list of labels where the key is the (doc_id, label_id) and the values
         are the label objects.
+    version : int
+        A counter that is incremented whenever labels are added or removed.
+        This can be used to invalidate cached label lookups.
     """
 
     root_context = weakattr()
     labels = None
     collected_labels = None
     registered = False
+    version = 0
+    _label_ids = None
 
     def __init__(self, root_context):
         self.labels = OrderedDict()
@@ -118,6 +123,7 @@ class LabelManager(object):
                 del self.labels[key]
 
         self.registered = False
+        self.version += 1
 
     def add_label(self, id, kind, context, label_cls, *args, **kwargs):
         """Add a label.
@@ -170,6 +176,7 @@ class LabelManager(object):
         label = label_cls(doc_id=doc_id, id=label_id, kind=kind, order=None,
                           *args, **kwargs)
         self.labels[label_key] = label
+        self.version += 1
 
         return label
 
@@ -233,13 +240,18 @@ class LabelManager(object):
             return self.labels[(doc_id, label_id)]
 
         # Try to find the first label with a matching label_id, if no
-        # doc_id is specified
+        # doc_id is specified. The first label for each label_id is indexed
+        # and the index is rebuilt when the labels' version changes.
         if doc_id is None:
-            try:
-                return next(l for k, l in self.labels.items()
-                            if k[1] == label_id)
-            except StopIteration:
-                pass
+            if self._label_ids is None or self._label_ids[0] != self.version:
+                label_ids = dict()
+                for key, label in self.labels.items():
+                    label_ids.setdefault(key[1], label)
+                self._label_ids = (self.version, label_ids)
+
+            label = self._label_ids[1].get(label_id)
+            if label is not None:
+                return label
 
         # I give up! I can't find the label.
         msg = "Could not find a label with identifier '{}'"
@@ -317,19 +329,22 @@ class LabelManager(object):
 
         # Filter labels by doc_id.
         labels = self.labels.values()
-        if doc_id is not None:
-            labels = [label for label in labels if label.doc_id == doc_id]
-
-        # Filter labels by kind
-        returned_labels = []
-        if kinds:
-            for kind in kinds:
-                returned_labels += [label for label in labels
-                                    if kind in label.kind]
-        else:
-            returned_labels = labels
-
-        return returned_labels
+        if not kinds:
+            return ([label for label in labels if label.doc_id == doc_id]
+                    if doc_id is not None else labels)
+
+        # Filter labels by doc_id and kind in a single pass. Labels are
+        # bucketed by kind so that they're returned in the order of the kinds
+        # listed.
+        labels_by_kind = {kind: [] for kind in kinds}
+        for label in labels:
+            if doc_id is not None and label.doc_id != doc_id:
+                continue
+            for kind, kind_labels in labels_by_kind.items():
+                if kind in label.kind:
+                    kind_labels.append(label)
+
+        return [label for kind in kinds for label in labels_by_kind[kind]]
 
     def format_string(self, id, *keys, target=None):
         """Retrieve the formatted label string for a label.
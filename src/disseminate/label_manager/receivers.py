@@ -16,9 +16,12 @@ def reset_label_manager(context, **kwargs):
     document object.
     """
     # If no label manager is loaded, then this is the root context. Create a
-    # label manager
-    label_manager = context.setdefault('label_manager',
-                                       LabelManager(root_context=context))
+    # label manager. The label manager is only created when it's missing,
+    # rather than for each document loaded.
+    label_manager = context.get('label_manager', None)
+    if label_manager is None:
+        label_manager = LabelManager(root_context=context)
+        context['label_manager'] = label_manager
 
     # Remove labels for this document, so that new labels can be populated
     doc_id = context.get('doc_id', None)
@@ -27,13 +27,19 @@ def reorder_and_purge_labels_by_doc_id(labels, root_context):
         # Use the doc_ids from the labels themselves
         doc_ids = [label.doc_id for label in labels.values()]
 
+    # Map the doc_ids to their position so that each label's document order
+    # is a single lookup. The first occurrence of a doc_id sets its position.
+    doc_id_index = dict()
+    for i, doc_id in enumerate(doc_ids):
+        doc_id_index.setdefault(doc_id, i)
+
     # Remove labels that aren't listed in the doc_ids
-    filtered_labels = filter(lambda l: l.doc_id in doc_ids, labels.values())
+    filtered_labels = (label for label in labels.values()
+                       if label.doc_id in doc_id_index)
 
     # Sort filtered labels by doc_id
-    reordered_labels = sorted([(count, label)
-                               for count, label in enumerate(filtered_labels)],
-                              key=lambda k: (doc_ids.index(k[1].doc_id), k[0]))
+    reordered_labels = sorted(enumerate(filtered_labels),
+                              key=lambda k: (doc_id_index[k[1].doc_id], k[0]))
 
     # Repopulate the labels dict (which should be an ordered dict)
     labels.clear()
@@ -88,8 +94,8 @@ def register_orders(labels, root_context, **kwargs):
         reset_counts = dict()
 
     # Process labels with a kind listed.
-    filtered_labels = [label for label in labels.values()
-                       if label.kind is not None]
+    filtered_labels = (label for label in labels.values()
+                       if label.kind is not None)
     for label in filtered_labels:
 
         # Get the count for each of the kind items
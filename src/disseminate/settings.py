@@ -52,6 +52,11 @@ tag_max_depth = 30
 # converted files will always be updated
 convert_cache = True
 
+#: The hashlib algorithm for short text hashes, like tag hashes and caption
+#: ids. 'blake2b' is faster, but 'md5' is kept as the default so that
+#: previously generated ids and cached files are not changed.
+hash_algo = 'md5'
+
 #: The location in the target_root to store temporary cached files
 cache_path = '.cache'
 
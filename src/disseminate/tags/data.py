@@ -184,24 +184,25 @@ class DelimData(Data):
         self.process_tags()
 
         headers = self.processed_headers
-        tex = tex_cmd('toprule') + "\n"
+
+        # Collect the rows and rules of the table, and join these once
+        tex = [tex_cmd('toprule') + "\n"]
 
         if headers is not None:
-            tex += " & ".join([format_content(cell, 'tex_fmt',
-                                              mathmode=mathmode, level=level)
-                               for cell in headers]) + " \\\\\n"
-            tex += tex_cmd('midrule') + "\n"
+            tex.append(" & ".join([format_content(cell, 'tex_fmt',
+                                                  mathmode=mathmode,
+                                                  level=level)
+                                   for cell in headers]))
+            tex.append(" \\\\\n" + tex_cmd('midrule') + "\n")
 
-        rows = []
         for row in self.processed_rows:
-            str = " & ".join([format_content(cell, 'tex_fmt', level=level,
-                                                   mathmode=mathmode)
-                              for cell in row]) + " \\\\\n"
-            rows.append(str)
-        tex += "".join(rows)
+            tex.append(" & ".join([format_content(cell, 'tex_fmt', level=level,
+                                                  mathmode=mathmode)
+                                   for cell in row]))
+            tex.append(" \\\\\n")
 
-        tex += tex_cmd('bottomrule')
-        return tex
+        tex.append(tex_cmd('bottomrule'))
+        return ''.join(tex)
 
     def html_table(self, format_func='html_fmt', method='html', level=1,
                    **kwargs):
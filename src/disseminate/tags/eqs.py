@@ -46,9 +46,12 @@ class Eq(Img):
     #: to a file. This tag owns these sub-contexts.
     _target_context = None
 
+    #: The formatted tex for the equation and the key of the name, content,
+    #: attributes and block_equation that it was formatted from.
+    _tex = None
+
     def __init__(self, *args, block_equation=False, **kwargs):
         self.block_equation = block_equation
-        self._target_context = dict()
 
         super().__init__(*args, **kwargs)
 
@@ -67,15 +70,24 @@ class Eq(Img):
     def block_equation(self, value):
         self._block_equation = value
 
+    @property
+    def tex(self):
+        # The content of equations is converted to a string on creation, so
+        # the formatted tex only changes when the content, attributes or
+        # block_equation are changed. The tex is used for tex targets and
+        # for rendering the equation images for other targets.
+        key = (self.name, self.content, tuple(self.attributes.items()),
+               self.block_equation)
+        if self._tex is None or self._tex[0] != key:
+            self._tex = (key, self.tex_fmt())
+        return self._tex[1]
+
     def tex_fmt(self, content=None, attributes=None, mathmode=False,
                 **kwargs):
         # Retrieve unspecified arguments
         attributes = attributes or self.attributes
         content = content or self.content
 
-        # Determine the environment
-        env = attributes.get('env', target='.tex') or self.default_block_env
-
         # Add bold and color if specified
         if 'color' in attributes:
             content = tex_cmd(cmd='textcolor',
@@ -91,6 +103,10 @@ class Eq(Img):
             return content
         else:
             if self.block_equation:
+                # Determine the environment. This is only needed for block
+                # equations.
+                env = (attributes.get('env', target='.tex') or
+                       self.default_block_env)
                 return tex_env(env=env, attributes=attributes,
                                formatted_content=content, min_newlines=True)
             else:
@@ -115,6 +131,9 @@ class Eq(Img):
         else:
             attrs['class'] = 'eq'
 
+        if self._target_context is None:
+            self._target_context = dict()
+
         if context is None and method not in self._target_context:
             # Create a special context for this tag specifically. This tag
             # will own this context
@@ -28,8 +28,8 @@ class BaseFigure(Tag):
 
         # Transfer the label id ('id') to the caption, if available. First,
         # find the caption tag, if available
-        captions = [tag for tag in self.flatten(filter_tags=True)
-                    if isinstance(tag, Caption)]
+        captions = (tag for tag in self.flatten(filter_tags=True)
+                    if isinstance(tag, Caption))
 
         for caption in captions:
             # Transfer the 'id' to the caption (but only the first)
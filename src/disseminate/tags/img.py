@@ -2,11 +2,12 @@
 Image tags
 """
 import pathlib
+from collections import OrderedDict
 
 from .tag import Tag, TagError
 from .utils import xhtml_percentwidth, tex_percentwidth
 from ..signals import signal
-from ..paths.utils import find_files
+from ..paths.utils import find_file, find_files
 from ..formats import tex_cmd
 
 add_file = signal('add_file')
@@ -36,6 +37,8 @@ class Img(Tag):
         to be rendered first.
     img_filepath : str
         The path for the (source) image.
+    outfilepaths_maxsize : int
+        The maximum number of outfilepaths cached by add_file.
     """
 
     active = True
@@ -45,12 +48,12 @@ class Img(Tag):
 
     html_name = 'img'
     in_ext = None
+    outfilepaths_maxsize = 64
     _infilepath = None
     _outfilepaths = None
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._outfilepaths = dict()
+    _filtered_attributes = None
+    _dest_filepaths = None
+    _formatted_attributes = None
 
     def content_as_filepath(self, content=None, context=None):
         """Returns a filepath from the content, if it's a valid filepath,
@@ -73,13 +76,32 @@ class Img(Tag):
         content = content or self.content
         context = context or self.context
 
+        # See if the infilepath was already found for this content and
+        # context. This avoids checking the filesystem for paths that were
+        # already found.
+        key = (content, id(context))
+        if self._infilepath is not None and self._infilepath[0] == key:
+            return self._infilepath[1]
+
         # Move the contents to the infilepath attribute
-        if isinstance(content, pathlib.Path) and content.is_file():
-            return content
+        if isinstance(content, pathlib.Path):
+            if content.is_file():
+                self._infilepath = (key, content)
+                return content
         elif isinstance(content, str):
-            # Get the infilepath for the file
-            filepaths = find_files(content, context)
-            return filepaths[0] if filepaths else None
+            # Get the infilepath for the file. Single line contents, which
+            # are the most common, are probed directly.
+            string = content.strip()
+            if '\n' not in string:
+                filepath = find_file(string, context, raise_error=False)
+            else:
+                filepaths = find_files(string, context)
+                filepath = filepaths[0] if filepaths else None
+
+            # Cache found infilepaths
+            if filepath is not None:
+                self._infilepath = (key, filepath)
+            return filepath
 
         return None
 
@@ -114,28 +136,51 @@ class Img(Tag):
         BuildError
             If a builder could not be found for the builder
         """
-        # See if a cached path exists already. This can only be done if the
-        # content, attributes and context aren't specified because the
-        # values of this tag will be used for these parameters.
-        if all(i is None for i in (content, attributes, context)):
-            if target in self._outfilepaths:
-                return self._outfilepaths[target]
-            else:
-                can_cache = True
-        else:
-            can_cache = False
-
         # Retrieve the unspecified arguments
         content = content or self.content
         attrs = attributes or self.attributes
         context = context or self.context
 
+        # See if a cached path exists already. Paths are cached by the
+        # target, content, target-specific attributes and context so that
+        # repeated renders of the tag don't re-add the file. Only hashable
+        # (string or path) contents can be cached. The cache dicts are created
+        # when first needed.
+        if self._outfilepaths is None:
+            self._outfilepaths = OrderedDict()
+            self._filtered_attributes = dict()
+
+        # The target-specific attributes are cached for each target with a
+        # copy of the attributes they were filtered from, since attributes
+        # can be changed. Tags without attributes skip the filter.
+        if attrs:
+            filtered = self._filtered_attributes.get(target)
+            if filtered is not None and filtered[0] == attrs:
+                attrs = filtered[1]
+            else:
+                filtered = (dict(attrs), attrs.filter(target=target).totuple())
+                self._filtered_attributes[target] = filtered
+                attrs = filtered[1]
+        else:
+            attrs = ()
+
+        key = (target, content, attrs, id(context))
+        try:
+            outfilepath = self._outfilepaths.get(key)
+        except TypeError:
+            key = None
+            outfilepath = None
+
+        if outfilepath is not None:
+            self._outfilepaths.move_to_end(key)
+            return outfilepath
+
         # Prepare the parameters. Either their a filepath of the contents
         # or the contents themselves.
         content = (self.content_as_filepath(content=content,
                                             context=context) or
                    content)
-        parameters = [content] + list(attrs.filter(target=target).totuple())
+        parameters = [content, *attrs]
 
         # Use the content's filepath suffix as the in_ext, if a file has
         # been
@@ -149,51 +194,104 @@ class Img(Tag):
 
         outfilepath = outfilepaths[0]
 
-        # Cache the outfilepath, if possible
-        if can_cache:
-            self._outfilepaths[target] = outfilepath
+        # Cache the outfilepath, if possible, and remove the least recently
+        # used entry if the cache is full
+        if key is not None:
+            self._outfilepaths[key] = outfilepath
+            if len(self._outfilepaths) > self.outfilepaths_maxsize:
+                self._outfilepaths.popitem(last=False)
 
         return outfilepath
 
     def tex_fmt(self, content=None, attributes=None, context=None, **kwargs):
-        # Add the file dependency
-        outfilepath = self.add_file(target='.tex', content=content,
-                                    context=context, attributes=attributes)
-
-        # Format the width
-        attrs = attributes or self.attributes.copy()
-        attrs = tex_percentwidth(attrs, target='.tex')
-
-        # Get the filename for the file.
-        base = outfilepath.with_suffix('')
-        suffix = outfilepath.suffix
-
-        # If the filename has unicode characters, you need to detokenize them
-        # for latex to run correctly
-        try:
-            str(outfilepath).encode('ascii')
-        except UnicodeEncodeError:
-            base = tex_cmd(cmd='detokenize', formatted_content=str(base))
-
-        # Wrap this filename in curly braces, which is needed for paths with
-        # spaces and absolute paths
-        dest_filepath = "{{{base}}}{suffix}".format(base=base, suffix=suffix)
+        # See if the destination filepath has already been formatted. Like
+        # the add_file cache, this is only possible if the tag's own content,
+        # attributes and context are used.
+        can_cache = all(i is None for i in (content, attributes, context))
+        cache_key = ('.tex', id(self.context))
+        if self._dest_filepaths is None:
+            self._dest_filepaths = dict()
+            self._formatted_attributes = dict()
+        dest_filepath = (self._dest_filepaths.get(cache_key) if can_cache else
+                         None)
+
+        if dest_filepath is None:
+            # Add the file dependency
+            outfilepath = self.add_file(target='.tex', content=content,
+                                        context=context,
+                                        attributes=attributes)
+
+            # Get the filename for the file. The suffix is at the end of the
+            # path string, so the base is sliced from the string rather than
+            # creating a new path.
+            path_str = str(outfilepath)
+            suffix = outfilepath.suffix
+            base = path_str[:len(path_str) - len(suffix)]
+
+            # If the filename has unicode characters, you need to detokenize
+            # them for latex to run correctly
+            try:
+                path_str.encode('ascii')
+            except UnicodeEncodeError:
+                base = tex_cmd(cmd='detokenize', formatted_content=base)
+
+            # Wrap this filename in curly braces, which is needed for paths
+            # with spaces and absolute paths
+            dest_filepath = f"{{{base}}}{suffix}"
+
+            if can_cache:
+                self._dest_filepaths[cache_key] = dest_filepath
+
+        # Format the width. Bare images (ex: @img{path}) have no attributes,
+        # and these don't need to be formatted. The formatted attributes for
+        # this tag's own attributes are cached.
+        if attributes:
+            attrs = tex_percentwidth(attributes, target='.tex')
+        else:
+            attrs = self._formatted_attributes.get(cache_key)
+            if attrs is None:
+                attrs = self.attributes
+                attrs = (tex_percentwidth(attrs.copy(), target='.tex')
+                         if attrs else attrs)
+                self._formatted_attributes[cache_key] = attrs
 
         return tex_cmd(cmd='includegraphics', attributes=attrs,
-                       formatted_content=str(dest_filepath))
+                       formatted_content=dest_filepath)
 
     def html_fmt(self, content=None, attributes=None, context=None,
                  method='html', **kwargs):
-        # Add the file dependency
         target = '.' + method if not method.startswith('.') else method
-        outfilepath = self.add_file(target=target, content=content,
-                                    context=context, attributes=attributes)
-        url = outfilepath.get_url(context=self.context, target=target)
-
-        # Format the width and attributes
-        attrs = attributes or self.attributes.copy()
-        attrs = xhtml_percentwidth(attrs, target=target)
-        attrs['src'] = url
+
+        # See if the url has already been formatted for this target
+        can_cache = all(i is None for i in (content, attributes, context))
+        cache_key = (target, id(self.context))
+        if self._dest_filepaths is None:
+            self._dest_filepaths = dict()
+            self._formatted_attributes = dict()
+        url = self._dest_filepaths.get(cache_key) if can_cache else None
+
+        if url is None:
+            # Add the file dependency
+            outfilepath = self.add_file(target=target, content=content,
+                                        context=context,
+                                        attributes=attributes)
+            url = outfilepath.get_url(context=self.context, target=target)
+
+            if can_cache:
+                self._dest_filepaths[cache_key] = url
+
+        # Format the width and attributes. The formatted attributes for this
+        # tag's own attributes are cached.
+        attrs = (self._formatted_attributes.get(cache_key) if can_cache else
+                 None)
+
+        if attrs is None:
+            attrs = attributes or self.attributes.copy()
+            attrs = xhtml_percentwidth(attrs, target=target)
+            attrs['src'] = url
+
+            if can_cache:
+                self._formatted_attributes[cache_key] = attrs
 
         return super().html_fmt(content='', attributes=attrs, method=method,
                                 **kwargs)
@@ -231,6 +231,7 @@ class LabelTag(Tag):
 
     label_id = None
     label_manager = weakattr()
+    _processed_tags = None
 
     #: Do not convert typography characters. Conversion of typography
     #: characters might cause issues with matching the label id.
@@ -256,6 +257,37 @@ class LabelTag(Tag):
         if 'id' in self.attributes:
             del self.attributes['id']
 
+    def processed_tag(self, format_str, target=None):
+        """Create a tag from the label's format string.
+
+        The last tag created for each target is stored and reused until the
+        format string changes, like when the labels are renumbered.
+
+        Parameters
+        ----------
+        format_str : str
+            The format string for the label. ex: 'Fig. 1.'
+        target : Optional[str]
+            The target for the format string. ex: '.html'
+
+        Returns
+        -------
+        processed_tag : :obj:`Tag <.Tag>`
+            The tag with the processed format string.
+        """
+        context = self.context
+        key = (format_str, id(context))
+        if self._processed_tags is None:
+            self._processed_tags = dict()
+        cached = self._processed_tags.get(target)
+
+        if cached is None or cached[0] != key:
+            tag = Tag(name='label', content=format_str, attributes='',
+                      context=context)
+            cached = (key, tag)
+            self._processed_tags[target] = cached
+        return cached[1]
+
     def default_fmt(self, content=None, attributes=None):
         # Get the label tag format
         label_manager = self.label_manager
@@ -264,8 +296,7 @@ class LabelTag(Tag):
 
         if all(i is not None for i in (label_manager, label_id, context)):
             format_str = label_manager.format_string(id=self.label_id)
-            processed_tag = Tag(name='label', content=format_str,
-                                attributes='', context=context)
+            processed_tag = self.processed_tag(format_str)
             return content_to_str(processed_tag.content)
         else:
             return ''
@@ -281,8 +312,7 @@ class LabelTag(Tag):
                                                      target='.tex')
 
             # Process the tags and format the contents for tex
-            processed_tag = Tag(name='label', content=format_str,
-                                attributes='', context=context)
+            processed_tag = self.processed_tag(format_str, target='.tex')
             content = format_content(content=processed_tag.content,
                                      format_func='tex_fmt', level=level + 1,
                                      mathmode=mathmode)
@@ -305,8 +335,7 @@ class LabelTag(Tag):
 
             # Process the tags and format the contents for html (html_fmt) or
             # xhtml (xhtml_fmt)
-            processed_tag = Tag(name='label', content=format_str,
-                                attributes='', context=context)
+            processed_tag = self.processed_tag(format_str, target='.html')
             content = format_content(content=processed_tag.content,
                                      format_func=format_func, level=level + 1)
 
@@ -46,15 +46,15 @@ def set_navigation_labels(root_document):
         if target not in doc_ids_by_target:
             continue
         doc_ids = doc_ids_by_target[target]
+        positions = dict()
+        for i, doc_id in enumerate(doc_ids):
+            positions.setdefault(doc_id, i)
 
         for document in documents:
             doc_id = document.doc_id
 
             # Find this document's doc_id in the doc_ids_by_target
-            try:
-                position = doc_ids.index(doc_id)
-            except ValueError:
-                position = None
+            position = positions.get(doc_id)
 
             # See if the prev, next, curr links are avalaiable
             for name, rel in (('prev', - 1), ('curr', 0), ('next', 1)):
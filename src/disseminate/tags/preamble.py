@@ -13,6 +13,8 @@ class Authors(Tag):
     aliases = ('author',)
     active = True
 
+    _author_string = None
+
     def __init__(self, name, context, **kwargs):
         super(Authors, self).__init__(name=name, context=context, **kwargs)
 
@@ -28,16 +30,16 @@ class Authors(Tag):
         # Convert the author string to a list
         if isinstance(self.content, str):
             self.content = str_to_list(self.content)
+        elif not isinstance(self.content, list):
+            self.content = []
 
-    def author_string(self):
-        """Generate a formatted string listing the authors."""
-        # Convert to a list of strings
-        if isinstance(self.content, str):
-            author_lst = str_to_list(self.content)
-        elif isinstance(self.content, list):
-            author_lst = self.content
-        else:
-            return ''
+        # The content isn't changed after initialization, so the author string
+        # is formatted once
+        self._author_string = self._format_author_string()
+
+    def _format_author_string(self):
+        """Format a string listing the authors from the content list."""
+        author_lst = self.content
 
         # Convert to a list of authors
         if len(author_lst) == 0:
@@ -49,10 +51,14 @@ class Authors(Tag):
             others = author_lst[:-2]
 
             if len(author_lst) == 2:
-                return ', '.join(others) + ' and '.join(last_two)
+                return ' and '.join(last_two)
             else:
                 return ', '.join(others) + ', ' + ' and '.join(last_two)
 
+    def author_string(self):
+        """Generate a formatted string listing the authors."""
+        return self._author_string
+
     def tex_fmt(self, *args, **kwargs):
         return self.author_string()
 
@@ -65,19 +71,27 @@ class Authors(Tag):
 class Titlepage(Tag):
     """A titlepage tag."""
 
-    authors_tag = None
     active = True
 
+    _authors_tag = None
+    _html_cache = None
+
     def __init__(self, name, content, attributes, context):
         super(Titlepage, self).__init__(name, content, attributes, context)
+        self._html_cache = dict()
 
         # Setup the title tag
         self.title_tag = Title(name='title', content='', attributes='',
                                context=context)
 
-        # Setup the author tag
-        self.authors_tag = Authors(name='authors', content='',
-                                   attributes=tuple(), context=context)
+    @property
+    def authors_tag(self):
+        """The authors tag, which is created when first needed."""
+        if self._authors_tag is None:
+            self._authors_tag = Authors(name='authors', content='',
+                                        attributes=tuple(),
+                                        context=self.context)
+        return self._authors_tag
 
     @property
     def title(self):
@@ -96,6 +110,16 @@ class Titlepage(Tag):
 
     def html_fmt(self, content=None, attributes=None, format_func='html_fmt',
                  method='html', level=1, **kwargs):
+        # See if the html has already been rendered. The title's label may be
+        # renumbered when labels are added or removed, so the label manager's
+        # version is included in the key. Only html strings are cached, since
+        # html elements (level > 1) can only be placed in one parent element.
+        label_manager = self.context.get('label_manager', None)
+        key = (self.title, self.authors_tag.author_string(), format_func,
+               method, level, getattr(label_manager, 'version', None))
+        if key in self._html_cache:
+            return self._html_cache[key]
+
         title_tag = self.title_tag
         title_html = getattr(title_tag, format_func)(method=method,
                                                      level=level + 1)
@@ -103,9 +127,12 @@ class Titlepage(Tag):
         authors_html = getattr(authors_tag, format_func)(content=content,
                                                          method=method,
                                                          level=level + 1)
-        return xhtml_tag('div', attributes='class=title-page',
+        html = xhtml_tag('div', attributes='class=title-page',
                          formatted_content=[title_html, authors_html],
                          method=method, level=level)
+        if isinstance(html, str):
+            self._html_cache[key] = html
+        return html
 
     def tex_fmt(self, content=None, attributes=None, mathmode=False, level=1,
                 **kwargs):
@@ -1,18 +1,26 @@
 """
 Receivers for processing a tag's contents on tag creation.
 """
-import regex
+import re
+from functools import lru_cache
 
 from ..signals import tag_created
 from ..exceptions import TagError
 from ...utils.string import group_strings
 from ... import settings
 
-re_open_tag = regex.compile(settings.tag_prefix +  # tag character, '@'
-                            r'(?P<tag>[A-Za-z0-9][\w]*)'
-                            r'(?P<attributes>\[[^\]]+\])?'
-                            r'(?P<open>{)?')
-re_brace = regex.compile(r'[}{]')
+#: The open tag pattern. This simple pattern is matched by the standard
+#: library's re module, which scans text faster than the regex module. The
+#: content of tags without nested braces is matched directly.
+re_open_tag = re.compile(settings.tag_prefix +  # tag character, '@'
+                         r'(?P<tag>[A-Za-z0-9][\w]*)'
+                         r'(?P<attributes>\[[^\]]+\])?'
+                         r'(?:{(?P<content>[^{}]*)}|(?P<open>{))?')
+
+#: Strings shorter than this length have their tokens cached by
+#: tokenize_tags_cached. Longer strings, like the body of documents, are
+#: tokenized directly so that these are not kept in memory.
+tokenize_cache_max_length = 4096
 
 
 @tag_created.connect_via(order=200)
@@ -77,90 +85,167 @@ def parse_tags(content, context, tag_factory, level=1):
         msg = "Tag content in an unknown format. The tag contents are: {}"
         raise TagError(msg.format(content))
 
-    # The following only processes text
-    text = content
+    # The following only processes text. Strings without the tag prefix
+    # don't have tags, and these are returned without tokenizing them.
+    if settings.tag_prefix not in content:
+        return content
+
+    # Create the tags from the text tokens
+    tokens = (tokenize_tags_cached(content)
+              if len(content) < tokenize_cache_max_length else
+              tokenize_tags(content))
+
+    for token in tokens:
+        if type(token) is str:
+            new_content.append(token)
+            continue
+
+        tag_name, tag_attributes, tag_content = token
+        tag = tag_factory.tag(tag_name=tag_name,
+                              tag_content=tag_content,
+                              tag_attributes=tag_attributes,
+                              context=context, )
+        new_content.append(tag)
+
+    # Remove empty strings
+    group_strings(new_content)
+
+    # Simplify the new_content list
+    if len(new_content) == 1:
+        # Unwrap new_content if it's a list with only one item
+        new_content = new_content[0]
+    elif len(new_content) == 0:
+        # If the new_content list has no items, then just use an empty string
+        new_content = ''
+
+    return new_content
+
+
+def tokenize_tags(text):
+    """Split a string into text and tag tokens.
+
+    Parameters
+    ----------
+    text : str
+        The string to split into tokens.
+
+    Returns
+    -------
+    tokens : Tuple[Union[str, Tuple[str, Union[str, None], str]]]
+        The tokens. Text tokens are strings, and tag tokens are tuples of the
+        tag name, the tag attributes string (or None) and the tag content
+        string.
+
+    Raises
+    ------
+    TagError : :exc:`TagError <.exceptions.TagError>`
+        Raises an TagError if a tag's brace wasn't closed.
+
+    Examples
+    --------
+    >>> tokenize_tags("My @b{bold} text @br")
+    ('My ', ('b', None, 'bold'), ' text ', ('br', None, ''))
+    """
+    tokens = []
 
     # The parser starts at the start of the text string
     position = 0
 
     # find open tags
-    match_tag = re_open_tag.search(text[position:])
+    match_tag = re_open_tag.search(text, position)
 
     # Process the tag
     while match_tag:
-        # Add the text up to this tag the match start/end are relative to the
-        # truncated text[position:] string, so the match start position has
-        # to be offset when referencing the full 'text' string
-        match_tag_start = position + match_tag.start()
-        sofar = text[position:match_tag_start]  # the string up to this point
+        # Add the text up to this tag
+        sofar = text[position:match_tag.start()]  # the string up to this tag
         if sofar:  # only add the sofar string if it isn't an empty string
-            new_content.append(sofar)
+            tokens.append(sofar)
 
         # Push up the position to the end of the tag match
-        position += match_tag.end()
+        position = match_tag.end()
         start_position = position
 
         # Parse the tag contexts
-        d = match_tag.groupdict()
-        tag_name = d['tag']
-        tag_attributes = d['attributes']
-
-        # Find open and close braces and advance the position
-        # up until the match closing brace is found
-        brace_level = 1 if d['open'] is not None else 0
-        match = re_brace.search(text[position:])
-        while match and 0 < brace_level < 10:
-            # Increment or decrement the match
-            if match.group() == '}':
-                brace_level -= 1
-            elif match.group() == '{':
-                brace_level += 1
-
-            position += match.end()
-
-            # Get the next match
-            match = re_brace.search(text[position:])
-
-        # Raise an error if the brace wasn't closed
-        if brace_level > 0:
-            msg = "The tag '{}' was not closed."
-            raise TagError(msg.format(tag_name))
+        (tag_name, tag_attributes, tag_content,
+         tag_open) = match_tag.group('tag', 'attributes', 'content', 'open')
+
+        # Find the matching closing brace for tags with an open brace and
+        # nested braces, and advance the position past it
+        if tag_open is not None:
+            position = find_closing_brace(text, position)
+
+            # Raise an error if the brace wasn't closed
+            if position == -1:
+                msg = "The tag '{}' was not closed."
+                raise TagError(msg.format(tag_name))
 
         # Parse the ast for the tag's content
-        if d['open'] is None:
+        if tag_open is not None:
+            # Process the text within the tag's nested braces
+            tag_content = text[start_position:position - 1]
+
+        elif tag_content is None:
             # For tags with no open/close braces, then the content is empty
             tag_content = ''
 
-        else:
-            # Otherwise process the text within the tag's braces
-            inner_text = text[start_position:position - 1]
-
-            # Process the inner_text if it's more than the empty string
-            tag_content = inner_text if inner_text else ''
-
-        tag = tag_factory.tag(tag_name=tag_name,
-                              tag_content=tag_content,
-                              tag_attributes=tag_attributes,
-                              context=context, )
-        new_content.append(tag)
+        tokens.append((tag_name, tag_attributes, tag_content))
 
         # Find the next tag
-        match_tag = re_open_tag.search(text[position:])
+        match_tag = re_open_tag.search(text, position)
 
     # Add the remainer
     remainder = text[position:]
     if remainder:  # only add the remainder if it isn't an empty string
-        new_content.append(remainder)
+        tokens.append(remainder)
 
-    # Remove empty strings
-    group_strings(new_content)
+    return tuple(tokens)
 
-    # Simplify the new_content list
-    if len(new_content) == 1:
-        # Unwrap new_content if it's a list with only one item
-        new_content = new_content[0]
-    elif len(new_content) == 0:
-        # If the new_content list has no items, then just use an empty string
-        new_content = ''
 
-    return new_content
+def find_closing_brace(text, position, max_level=10):
+    """Find the closing brace that matches an open brace in a string.
+
+    The braces are found in a single pass with str.find, and the position of
+    the next open brace is kept until the scan passes it.
+
+    Parameters
+    ----------
+    text : str
+        The string to search for the closing brace.
+    position : int
+        The position in the string just after the open brace.
+    max_level : Optional[int]
+        The maximum level of nested braces.
+
+    Returns
+    -------
+    end : int
+        The position just after the matching closing brace, or -1 if the
+        brace wasn't closed or the maximum level of nested braces was reached.
+
+    Examples
+    --------
+    >>> find_closing_brace("@b{bold {text}} more", 3)
+    15
+    >>> find_closing_brace("@b{bold", 3)
+    -1
+    """
+    brace_level = 1
+    next_open = text.find('{', position)
+    while 0 < brace_level < max_level:
+        next_close = text.find('}', position)
+        if -1 < next_open and (next_close == -1 or next_open < next_close):
+            brace_level += 1
+            position = next_open + 1
+            next_open = text.find('{', position)
+        elif next_close > -1:
+            brace_level -= 1
+            position = next_close + 1
+        else:
+            break
+
+    return position if brace_level == 0 else -1
+
+
+#: A version of tokenize_tags that caches the tokens of strings. The tokens
+#: only depend on the string, and tags are still created for each token.
+tokenize_tags_cached = lru_cache(maxsize=1024)(tokenize_tags)
@@ -1,9 +1,16 @@
 """
 Calculate the hash for a tag's contents.
 """
+from functools import lru_cache
 
 from ..signals import tag_created
 from ...utils.string import hashtxt
+from ... import settings
+
+#: Strings shorter than this length have their hashes cached by
+#: hashtxt_cached. Longer strings are hashed directly so that these are not
+#: kept in memory.
+hash_cache_max_length = 4096
 
 
 @tag_created.connect_via(order=50)
@@ -11,5 +18,13 @@ def process_hash(tag, tag_factory, **kwargs):
     """A receiver to create a hash for the contents of tags."""
     content = tag.content
     if isinstance(content, str):
-        tag.hash = hashtxt(tag.content)
+        tag.hash = (hashtxt_cached(content, algorithm=settings.hash_algo)
+                    if len(content) < hash_cache_max_length else
+                    hashtxt(content))
     return tag
+
+
+#: A version of hashtxt that caches the hashes of strings. Tags often have
+#: the same contents, like empty tags and repeated terms or equations. The
+#: hash algorithm should be passed so that it's part of the cache key.
+hashtxt_cached = lru_cache(maxsize=1024)(hashtxt)
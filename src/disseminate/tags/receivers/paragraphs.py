@@ -1,6 +1,9 @@
 """
 Receivers for processing a tag's paragraphs on tag creation.
 """
+from sys import intern
+import re
+
 import regex
 
 from ..signals import tag_created
@@ -20,6 +23,23 @@ def process_paragraphs(tag, tag_factory, tag_base_cls, **kwargs):
 
 re_para = regex.compile(r'(?:\s*\n\s*\n\s*\n*)')
 
+#: A quick check for strings that may have paragraph breaks. The whitespace
+#: characters matched by the re module are a superset of those matched by the
+#: regex module, so strings that do not match do not have paragraph breaks.
+#: This check is much faster than splitting long strings with re_para.
+re_para_check = re.compile(r'\n[^\S\n]*\n')
+
+#: Strings shorter than this length from paragraphs are interned. Short
+#: strings, like the spaces and newlines between tags, recur throughout
+#: documents.
+intern_max_length = 32
+
+
+def is_empty_paragraph(sublist):
+    """Test whether a paragraph sublist only contains empty strings or
+    strings with space and newline characters."""
+    return all(isinstance(i, str) and not i.strip() for i in sublist)
+
 
 def group_paragraphs(elements):
     r"""Given a list, group the items into sublists based on strings with
@@ -32,6 +52,9 @@ def group_paragraphs(elements):
     .. note:: The function is idempotent. It will reprocess the generated AST
               and not make changes.
 
+    .. note:: Paragraph sublists with only empty strings or strings with space
+              and newline characters are not included in the returned list.
+
     Parameters
     ----------
     elements : Union[list, str]
@@ -53,37 +76,61 @@ def group_paragraphs(elements):
     # Wrap strings in a list
     elements = [elements] if isinstance(elements, str) else elements
 
+    # Elements that were already grouped only have paragraph sublists and
+    # items that are not included in paragraphs. These are returned without
+    # regrouping, but empty paragraph sublists are removed.
+    if all(isinstance(item, list) or
+           not getattr(item, 'include_paragraphs', True)
+           for item in elements):
+        if any(isinstance(item, list) and is_empty_paragraph(item)
+               for item in elements):
+            elements[:] = [item for item in elements
+                           if not (isinstance(item, list) and
+                                   is_empty_paragraph(item))]
+        return elements
+
     overall_list = []
     sublist = []
 
     for item in elements:
-
-        # Add non-string elements to the sublist
-        if not isinstance(item, str):
-            if (getattr(item, 'include_paragraphs', True) and
-               not isinstance(item, list)):
-                # Include in the paragraph sublist
-                sublist.append(item)
-            else:
+        # Plain strings, which are the most common items, are identified by
+        # their type. Only plain strings can be interned.
+        if type(item) is str:
+            can_intern = True
+        elif isinstance(item, str):
+            can_intern = False
+        else:
+            if (isinstance(item, list) or
+                    not getattr(item, 'include_paragraphs', True)):
                 # Do not include in paragraphs; create a new paragraph sublist
                 if sublist:
-                    overall_list.append(sublist)
+                    if not is_empty_paragraph(sublist):
+                        overall_list.append(sublist)
                     sublist = []
                 # Append this non-paragraph item to the overall list, outside
-                # of a paragraph sublist
-                overall_list.append(item)
+                # of a paragraph sublist. Empty paragraph sublists from a
+                # previous grouping are not included.
+                if not (isinstance(item, list) and is_empty_paragraph(item)):
+                    overall_list.append(item)
+            else:
+                # Include in the paragraph sublist
+                sublist.append(item)
             continue
 
         # At this point, item is a string. See if there a paragraph break in
         # the string.
-        pieces = re_para.split(item)
-
-        if len(pieces) == 1 and pieces[0]:
+        if re_para_check.search(item) is None:
             # In this case, no paragraph break was found. Just add the item
-            # to the sublist if it's not an empty string
-            sublist.append(pieces[0])
+            # to the sublist if it's not an empty string.
+            if item:
+                sublist.append(intern(item) if can_intern and
+                               len(item) < intern_max_length else item)
             continue
 
+        # Split the string and intern the short pieces
+        pieces = [intern(piece) if len(piece) < intern_max_length else piece
+                  for piece in re_para.split(item)]
+
         # In this case, multiple pieces were found. Make these into new
         # sublists
         for i, piece in enumerate(pieces):
@@ -93,11 +140,11 @@ def group_paragraphs(elements):
                 sublist.append(piece)
 
             if i != len(pieces) - 1:
-                if sublist:
+                if sublist and not is_empty_paragraph(sublist):
                     overall_list.append(sublist)
                 sublist = []
 
-    if sublist:
+    if sublist and not is_empty_paragraph(sublist):
         overall_list.append(sublist)
 
     elements.clear()
@@ -107,8 +154,10 @@ def group_paragraphs(elements):
 
 
 def clean_paragraphs(elements):
-    r"""Remove invalid paragraphs from the sublists in an ast created by
-    group_paragraphs.
+    r"""Remove invalid paragraphs from the sublists in an ast.
+
+    .. note:: The paragraph sublists created by group_paragraphs are already
+              cleaned.
 
     This function will:
 
@@ -144,8 +193,7 @@ def clean_paragraphs(elements):
         # Determine if item is a sublist with only empty strings or strings
         # with space and newline characters. If so, don't make a paragraph
         # with it, and skip it.
-        if (isinstance(item, list) and
-           all(isinstance(i, str) and not i.strip() for i in item)):
+        if isinstance(item, list) and is_empty_paragraph(item):
             continue
 
         new_elements.append(item)
@@ -182,34 +230,51 @@ def assign_paragraph_roles(elements, tag_base_cls):
 
     # Go over the paragraph sublists and determine whether the tags within
     # are inline or block
-    for sublist in filter(lambda x: isinstance(x, list), elements):
-        # Find all the tags in the sublist
-        sublist_tags = list(filter(lambda x: isinstance(x, tag_base_cls),
-                                   sublist))
-
-        # Find all strings without white space
-        sublist_string = [s for s in sublist
-                          if isinstance(s, str) and s.strip() != ""]
-
-        # Determine the number of tags and the number of total elements in
-        # the sublist
-        num_tags = len(sublist_tags)
-        num_elems = len(sublist)
-        num_nonempty_strings = len(sublist_string)
-
-        if num_tags == 1 and num_nonempty_strings == 0:
-            # If the number of tags and elements is 1, then tag is in its own
-            # block
-            sublist_tags[0].paragraph_role = 'block'
-        elif num_elems > 1:
-            # Otherwise the tags are inline with other elements in the
-            # paragraph.
-            for tag in sublist_tags:
-                tag.paragraph_role = 'inline'
+    for sublist in elements:
+        if isinstance(sublist, list):
+            assign_sublist_roles(sublist, tag_base_cls=tag_base_cls)
 
     return elements
 
 
+def assign_sublist_roles(sublist, tag_base_cls):
+    """Assign the 'paragraph_role' attribute for the tags in one paragraph
+    sublist.
+
+    Parameters
+    ----------
+    sublist : list
+        A paragraph sublist created by the group_paragraphs function.
+    tag_base_cls : :class:`Tag <.Tag>`
+        The base class for Tag objects.
+    """
+    # Find all the tags and count the strings without white space in the
+    # sublist in a single pass
+    sublist_tags = []
+    num_nonempty_strings = 0
+    for item in sublist:
+        if isinstance(item, str):
+            if not item.isspace() and item != "":
+                num_nonempty_strings += 1
+        elif isinstance(item, tag_base_cls):
+            sublist_tags.append(item)
+
+    # Determine the number of tags and the number of total elements in
+    # the sublist
+    num_tags = len(sublist_tags)
+    num_elems = len(sublist)
+
+    if num_tags == 1 and num_nonempty_strings == 0:
+        # If the number of tags and elements is 1, then tag is in its own
+        # block
+        sublist_tags[0].paragraph_role = 'block'
+    elif num_elems > 1:
+        # Otherwise the tags are inline with other elements in the
+        # paragraph.
+        for tag in sublist_tags:
+            tag.paragraph_role = 'inline'
+
+
 def process_paragraph_tags(element, context, tag_base_cls, p_cls):
     """Process the paragraphs for the contents of a tag.
 
@@ -241,18 +306,15 @@ def process_paragraph_tags(element, context, tag_base_cls, p_cls):
     if not any(isinstance(content, x) for x in (str, list)):
         return content
 
-    # Group the paragraphs into sublists
+    # Group the paragraphs into (cleaned) sublists
     group = group_paragraphs(content)
 
-    # Clean the paragraph sublist groups
-    clean_paragraphs(group)
-
-    # Assign the paragraph_role for tags within paragraph sublist groups
-    assign_paragraph_roles(group, tag_base_cls=tag_base_cls)
-
-    # Convert the sublists into paragraphs
+    # Assign the paragraph_role for tags within paragraph sublist groups and
+    # convert the sublists into paragraphs in a single pass
     for count, item in enumerate(group):
         if isinstance(item, list):
+            assign_sublist_roles(item, tag_base_cls=tag_base_cls)
+
             # If the item is a list with only 1 item, then isolate that one
             # item. The paragraph will then only contain that one item, rather
             # than have a list with one item.
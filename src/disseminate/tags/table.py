@@ -21,8 +21,8 @@ class BaseTable(Tag):
 
         # Transfer the label id ('id') to the caption, if available. First,
         # find the caption tag, if available
-        captions = [tag for tag in self.flatten(filter_tags=True)
-                    if isinstance(tag, Caption)]
+        captions = (tag for tag in self.flatten(filter_tags=True)
+                    if isinstance(tag, Caption))
 
         for caption in captions:
             # Transfer the 'id' to the caption (but only the first)
@@ -55,8 +55,8 @@ class BaseTable(Tag):
                 # Process the data in the table into a tabular environment
                 table_tex = item.tex_table(level=level + 1)
                 col_types = 'l' * item.num_cols
-                content_tex += tex_env('tabular', attributes=col_types,
-                                       formatted_content=table_tex)
+                content_tex.append(tex_env('tabular', attributes=col_types,
+                                           formatted_content=table_tex))
             elif isinstance(item, Tag):
                 # Process other tags like captions
                 content_tex.append(item.tex_fmt(level=level + 1))
@@ -1,6 +1,8 @@
 """
 Core classes and functions for tags.
 """
+from sys import intern
+
 from .exceptions import TagError
 from .signals import tag_created
 from ..formats import tex_env, tex_cmd, xhtml_tag
@@ -94,7 +96,8 @@ class Tag(object):
     paragraph_role = None
 
     def __init__(self, name, content, attributes, context):
-        self.name = name
+        # Tag names recur throughout documents, and these are interned
+        self.name = intern(name) if type(name) is str else name
         self.attributes = Attributes(attributes)
         self.content = content
         self.context = context
@@ -179,27 +182,10 @@ class Tag(object):
             The flattened list.
         """
         tag = tag if tag is not None else self
-        flattened_list = [tag]  # add the given tag to the list
-
-        # Process the tag's contents if present
-        if hasattr(tag, 'content'):
-            tag = tag.content
-
-        # Convert the AST to a list, if it isn't already
-        if not hasattr(tag, '__iter__'):
-            tag = [tag]
-
-        # Traverse the items and process each
-        for item in tag:
-            # Add the item to the ast
-            flattened_list.append(item)
 
-            # Process tag's sub tags or lists, if present
-            if (hasattr(item, 'content') and
-                (isinstance(item.content, list) or
-                 isinstance(item.content, Tag))):
-                flattened_list += self.flatten(tag=item.content,
-                                               filter_tags=filter_tags)
+        # Add the items to a single list, and filter the tags at the end
+        flattened_list = []
+        _flatten(tag, flattened_list)
 
         if filter_tags:
             flattened_list = [t for t in flattened_list if isinstance(t, Tag)]
@@ -344,6 +330,37 @@ class Tag(object):
                              **kwargs)
 
 
+def _flatten(tag, flattened_list):
+    """Add the given tag and all its sub-tags and elements to the
+    flattened_list.
+
+    See :meth:`Tag.flatten <.Tag.flatten>`.
+    """
+    flattened_list.append(tag)  # add the given tag to the list
+
+    # Process the tag's contents if present
+    if hasattr(tag, 'content'):
+        tag = tag.content
+
+    # Convert the AST to a list, if it isn't already
+    if not hasattr(tag, '__iter__'):
+        tag = [tag]
+
+    # Traverse the items and process each
+    for item in tag:
+        # Add the item to the ast
+        flattened_list.append(item)
+
+        # Strings, which are the most common items, have no sub-tags
+        if type(item) is str:
+            continue
+
+        # Process tag's sub tags or lists, if present
+        content = getattr(item, 'content', None)
+        if isinstance(content, list) or isinstance(content, Tag):
+            _flatten(content, flattened_list)
+
+
 class TagFactory(object):
     """Generates the appropriate tag for a given tag type.
 
@@ -1,12 +1,21 @@
 """
 Formatting of Table of Contents for documents
 """
+import sys
+
 from .headings import toc_levels as heading_toc_levels, Heading
 from .ref import Ref
 from .tag import Tag
 from . import exceptions
 from ..formats import xhtml_tag, xhtml_list
 
+#: The list level index for each heading kind
+heading_toc_level_index = {kind: i
+                           for i, kind in enumerate(heading_toc_levels)}
+
+#: The easylist item marker for tex TocRef entries
+toc_tex_item = "§"
+
 
 class TocError(Exception):
     """An error was encountered while processing a table of contents tag."""
@@ -31,7 +40,7 @@ class TocRef(Ref):
         tex_content = super().tex_fmt(content=content, attributes=attributes,
                                       mathmode=mathmode, cache=cache,
                                       level=level, **kwargs)
-        return "§" * list_level + " " + tex_content + "\n"
+        return f"{toc_tex_item * list_level} {tex_content}\n"
 
     def html_fmt(self, content=None, attributes=None, cache=None,
                  format_func='html_fmt', method='html', level=1, **kwargs):
@@ -84,9 +93,13 @@ class Toc(Tag):
     process_typography = False
 
     _ref_tags = None
+    _toc_kind_set = None
+    _labels_cache = None
+    _fmt_cache = None
 
     def __init__(self, name, content, attributes, context):
         super(Toc, self).__init__(name, content, attributes, context)
+        self._fmt_cache = dict()
 
         # Get the TOC's kind from the tag's content
         content = self.content
@@ -110,6 +123,19 @@ class Toc(Tag):
             self.header_tag = Heading(name='TOC', content='Table of Contents',
                                       attributes='nolabel', context=context)
 
+    @property
+    def toc_kind_set(self):
+        """The set of toc_kind entries for membership tests.
+
+        The set is recreated if the toc_kind is replaced.
+        """
+        toc_kind = self.toc_kind
+        if self._toc_kind_set is None or self._toc_kind_set[0] is not toc_kind:
+            entries = (toc_kind.split() if isinstance(toc_kind, str) else
+                       toc_kind)
+            self._toc_kind_set = (toc_kind, frozenset(entries))
+        return self._toc_kind_set[1]
+
     def get_labels(self):
         """Get the labels, ordering function and labeling type.
 
@@ -127,20 +153,33 @@ class Toc(Tag):
         # only for this document and its context from the 'get_labels_by_kind'
         # method of the label manager.
         context = self.context
-        doc_id = context.get('doc_id') if 'all' not in self.toc_kind else None
+        toc_kind_set = self.toc_kind_set
+        doc_id = context.get('doc_id') if 'all' not in toc_kind_set else None
         label_manager = self.context['label_manager']
 
-        labels = []
-        if 'heading' in self.toc_kind or 'headings' in self.toc_kind:
-            labels += label_manager.get_labels_by_kind(doc_id=doc_id,
-                                                       kinds='heading')
-        if 'document' in self.toc_kind or 'documents' in self.toc_kind:
-            labels += label_manager.get_labels_by_kind(doc_id=doc_id,
-                                                       kinds='document')
+        # See if the labels have been cached. The cache is valid so long as
+        # labels haven't been added to or removed from the label manager.
+        key = (tuple(self.toc_kind), context.get('doc_id'), id(label_manager),
+               label_manager.version)
+        if self._labels_cache is not None and self._labels_cache[0] == key:
+            label_manager.register()  # make sure label orders are current
+            return list(self._labels_cache[1])
+
+        # Fetch the labels for all kinds in a single query. Heading labels are
+        # listed before document labels.
+        kinds = []
+        if toc_kind_set & {'heading', 'headings'}:
+            kinds.append('heading')
+        if toc_kind_set & {'document', 'documents'}:
+            kinds.append('document')
+
+        labels = (label_manager.get_labels_by_kind(doc_id=doc_id,
+                                                   kinds=kinds)
+                  if kinds else [])
 
         # Now filter apply additional filters
         doc_id = context.get('doc_id')
-        if 'abbreviated' in self.toc_kind:
+        if 'abbreviated' in toc_kind_set:
             current_doc_id = None
             filtered_labels = []
 
@@ -158,67 +197,111 @@ class Toc(Tag):
             labels.clear()
             labels += filtered_labels
 
-        return labels
+        self._labels_cache = (key, labels)
+        return list(labels)
 
     @property
     def reference_tags(self):
         """This tag's TocRef tag items.
         """
-        labels = self.get_labels()
+        return [tag for label, tag in self.iter_reference_tags()]
+
+    def iter_reference_tags(self, labels=None):
+        """Iterate over the labels and TocRef tag items of this tag.
+
+        Parameters
+        ----------
+        labels : Optional[List[:obj:`.label_manager.types.Label`]]
+            The labels to create TocRef tags for. If not specified, the
+            labels from :meth:`get_labels` are used.
 
-        # Collect the created tags.
-        tags = []
+        Returns
+        -------
+        label_tags : Iterator[Tuple[:obj:`.label_manager.types.Label`, \
+            :obj:`TocRef <.TocRef>`]]
+            An iterator of labels and their TocRef tags.
+        """
+        labels = self.get_labels() if labels is None else labels
 
-        # Got through the labels and keep track of the levels
+        # Got through the labels and keep track of the levels. There are
+        # only a few distinct label kinds, so the tag names are created once
+        # per kind.
         current_level = 1
+        tag_names = dict()
+        attributes = self.attributes
+        context = self.context
         for label in labels:
+            kind = label.kind[-1]
+
             # Get the level for the label
-            if label.kind[-1] in heading_toc_levels:
-                level = heading_toc_levels.index(label.kind[-1])
-            else:
-                level = current_level
+            level = heading_toc_level_index.get(kind, current_level)
             current_level = level
 
-            # Create the tag and add it to the tags list
-            tag_name = 'toc-' + label.kind[-1]
+            # Create the tag
+            tag_name = tag_names.get(kind)
+            if tag_name is None:
+                tag_name = tag_names.setdefault(kind,
+                                                sys.intern('toc-' + kind))
             tag = TocRef(name=tag_name, content=label.id,
-                         attributes=self.attributes, context=self.context)
+                         attributes=attributes, context=context)
             tag.attributes['level'] = level
 
-            tags.append(tag)
+            yield label, tag
 
-        return tags
+    def _fmt_cache_key(self, *args):
+        """The key for the formatted toc in the _fmt_cache.
+
+        The formatted toc only changes when labels are added or removed, so the
+        key includes the label manager's version. Tag copies share the
+        _fmt_cache, so the key also includes the toc kind and context.
+        """
+        context = self.context
+        label_manager = context.get('label_manager', None)
+        return args + (tuple(self.toc_kind), id(context), id(label_manager),
+                       getattr(label_manager, 'version', None))
 
     def tex_fmt(self, content=None, attributes=None, mathmode=False, level=1,
                 **kwargs):
-        tags = list(self.reference_tags)
-        tags[0:0] = "\\ListProperties(Hide=2)\n"  # Add to front
-        return super().tex_fmt(content=tags, attributes=self.list_style)
+        # See if the tex has already been formatted
+        key = self._fmt_cache_key('tex', level)
+        if key in self._fmt_cache:
+            return self._fmt_cache[key]
+
+        tags = self.reference_tags
+        tags.insert(0, "\\ListProperties(Hide=2)\n")  # Add to front
+        tex = super().tex_fmt(content=tags, attributes=self.list_style)
+        self._fmt_cache[key] = tex
+        return tex
 
     def html_fmt(self, content=None, attributes=None, cache=None,
                  format_func='html_fmt', method='html', level=1, **kwargs):
-        tags = self.reference_tags
+        # See if the html has already been formatted. Only html strings are
+        # cached, since html elements (level > 1) can only be placed in one
+        # parent element.
+        key = self._fmt_cache_key('html', format_func, method, level)
+        if key in self._fmt_cache:
+            return self._fmt_cache[key]
+
         elements = []
 
         root_document = self.context.root_document
         documents_by_id = (root_document.documents_by_id(recursive=True)
                            if root_document is not None else None)
 
-        # Get the labels
-        labels = self.get_labels()
-        labels_by_id = {label.id: label for label in labels}
-
-        for tag in tags:
-            listlevel = tag.attributes['level']
-            label = labels_by_id.get(tag.label_id, None)
+        cache = dict() if cache is None else cache
+        cache['documents_by_id'] = documents_by_id
 
-            cache = dict() if cache is None else cache
+        # Format the tags and their labels in a single pass
+        tag_level = level + 1
+        for label, tag in self.iter_reference_tags():
             cache['label'] = label
-            cache['documents_by_id'] = documents_by_id
 
             func = getattr(tag, format_func)
-            tag_html = func(cache=cache, method=method, level=level + 1)
-            elements.append((listlevel, tag_html))
+            tag_html = func(cache=cache, method=method, level=tag_level)
+            elements.append((tag.attributes['level'], tag_html))
 
-        return xhtml_list(*elements, attributes='class="toc"',
+        html = xhtml_list(*elements, attributes='class="toc"',
                           listtype=self.html_name, method=method, level=level)
+        if isinstance(html, str):
+            self._fmt_cache[key] = html
+        return html
@@ -31,8 +31,9 @@ def content_to_str(content, target='.txt', **kwargs):
     format_func = ('default_fmt' if target == 'txt' else
                    '_'.join((target, 'fmt')))  # ex: tex_fmt
 
-    return ''.join(format_content(content=content, format_func=format_func,
-                                  **kwargs))
+    content = format_content(content=content, format_func=format_func,
+                             **kwargs)
+    return content if type(content) is str else ''.join(content)
 
 
 def format_content(content, format_func, **kwargs):
@@ -54,8 +55,12 @@ def format_content(content, format_func, **kwargs):
     # Wrap content in a list and increment level
     content = [content] if not isinstance(content, list) else content
 
-    content = [getattr(i, format_func)(**kwargs)
-               if hasattr(i, format_func) else i for i in content]
+    # Strings are the most common items, and these are passed through with a
+    # fast type check
+    content = [i if type(i) is str else
+               getattr(i, format_func)(**kwargs)
+               if hasattr(i, format_func) else i
+               for i in content]
     return content[0] if len(content) == 1 else content
 
 
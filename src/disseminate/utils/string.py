@@ -2,19 +2,89 @@
 String manipulation operations.
 """
 import hashlib
+from functools import lru_cache
 from itertools import groupby
+from sys import intern
 
 import regex
 from slugify import slugify  # noqa: F401
 
 from .. import settings
 
+try:
+    from xxhash import xxh3_64_intdigest
+except ImportError:  # xxhash is optional
+    xxh3_64_intdigest = None
 
-def hashtxt(text, truncate=10):
-    """Creates a hash from the given text."""
+
+def hashtxt(text, truncate=10, algorithm=None):
+    """Creates a hash from the given text.
+
+    Parameters
+    ----------
+    text : Union[str, bytes]
+        The text to hash.
+    truncate : Optional[int]
+        If specified, truncate the hex digest to this number of characters.
+    algorithm : Optional[str]
+        The hashlib algorithm to use. If not specified, the
+        settings.hash_algo is used. With 'blake2b', the digest is generated
+        directly at the truncated size.
+
+    Returns
+    -------
+    hash : str
+        The hex digest of the text.
+    """
+    text = text if isinstance(text, bytes) else text.encode()
+    algorithm = algorithm or settings.hash_algo
+
+    if algorithm == 'blake2b' and truncate is not None and 0 < truncate <= 128:
+        # blake2b digests can be generated at the needed size, between 1 and
+        # 64 bytes. There are 2 hex characters per byte. Other truncate values
+        # use the full digest.
+        digest_size = (truncate + 1) // 2
+        return hashlib.blake2b(text,
+                               digest_size=digest_size).hexdigest()[:truncate]
+
+    # Use the named constructor for the algorithm, if available, which is
+    # faster than hashlib.new
+    constructor = (getattr(hashlib, algorithm)
+                   if algorithm in hashlib.algorithms_guaranteed else None)
+    digest = (constructor(text) if constructor is not None else
+              hashlib.new(algorithm, text)).hexdigest()
+    return digest if truncate is None else digest[:truncate]
+
+
+def fasthash(text):
+    """Creates a fast, non-cryptographic hash from the given text.
+
+    The hash is meant for in-memory cache keys only, and it should not be
+    used for ids or cached files since it depends on whether the optional
+    xxhash package is installed.
+
+    Parameters
+    ----------
+    text : Union[str, bytes]
+        The text to hash.
+
+    Returns
+    -------
+    hash : int
+        The 64-bit hash of the text.
+
+    Examples
+    --------
+    >>> fasthash('test') == fasthash(b'test')
+    True
+    >>> fasthash('test') == fasthash('test2')
+    False
+    """
     text = text if isinstance(text, bytes) else text.encode()
-    return (hashlib.md5(text).hexdigest() if truncate is None else
-            hashlib.md5(text).hexdigest()[:truncate])
+    if xxh3_64_intdigest is not None:
+        return xxh3_64_intdigest(text)
+    return int.from_bytes(hashlib.blake2b(text, digest_size=8).digest(),
+                          'little')
 
 
 def titlelize(string, truncate=True, capitalize=False):
@@ -276,6 +346,9 @@ def find_basestring(strings):
     return base
 
 
+_re_newlines_split = regex.compile(r'\s*\n\s*')
+
+
 def str_to_list(string):
     """Parse a string into a list.
 
@@ -309,8 +382,9 @@ def str_to_list(string):
     if len(pieces_semicolon) > 1:
         return [piece.strip() for piece in pieces_semicolon]
 
-    pieces_newline = [piece.strip() for piece in string.split('\n')]
-    pieces_newline = list(filter(bool, pieces_newline))  # remove empty items
+    # Split on newlines. Blank lines and the whitespace around pieces are
+    # consumed by the regex
+    pieces_newline = _re_newlines_split.split(string.strip())
 
     if len(pieces_newline) > 1:
         return pieces_newline
@@ -373,7 +447,14 @@ def str_to_dict(string, strip_quotes=True):
     current_spaces = None
 
     for line in lines:
-        m = _re_entry.match(line)
+        # Lines indented past the current entry belong to the current entry,
+        # and these do not need to be matched as new entries
+        indent = len(line) - len(line.lstrip())
+        if (current_spaces is not None and indent > current_spaces and
+                line[indent:indent + 1] != ':'):
+            m = None
+        else:
+            m = _re_entry.match(line)
 
         # Workup the line. Strip leading spaces from the line.
         if current_spaces is not None:
@@ -388,7 +469,9 @@ def str_to_dict(string, strip_quotes=True):
             # as the last entry.
             group_dict = m.groupdict()
             space_level = len(group_dict['space_level'])
-            key = group_dict['key'].strip()
+            # Keys are interned since the same keys are parsed from the
+            # headers of many documents and looked up in contexts.
+            key = intern(group_dict['key'].strip())
             value = group_dict['value']
 
             if current_spaces is not None and space_level > current_spaces:
@@ -466,6 +549,42 @@ _re_macro = regex.compile(r"(?P<macro>" +
                           r"({\s*})?"  # match empty curly brackets
                           )
 
+#: Strings shorter than this length have their macro tokens cached by
+#: macro_tokens_cached.
+macro_cache_max_length = 4096
+
+
+def macro_tokens(s):
+    """Split a string into the text before each macro and the macros.
+
+    Parameters
+    ----------
+    s : str
+        The string to split.
+
+    Returns
+    -------
+    tokens, remainder : Tuple[Tuple[Tuple[str, str, str]], str]
+        The tokens for each macro are a tuple of the text before the macro,
+        the macro and the full match for the macro. The remainder is the text
+        after the last macro.
+
+    Examples
+    --------
+    >>> macro_tokens("@b{Fig. @label.number}. ")
+    ((('', '@b', '@b'), ('{Fig. ', '@label.number', '@label.number')), '}. ')
+    """
+    tokens = []
+    position = 0
+    for m in _re_macro.finditer(s):
+        tokens.append((s[position:m.start()], m.group('macro'), m.group()))
+        position = m.end()
+    return tuple(tokens), s[position:]
+
+
+#: A version of macro_tokens that caches the tokens of strings.
+macro_tokens_cached = lru_cache(maxsize=1024)(macro_tokens)
+
 
 def replace_macros(s, *dicts):
     """Replace the macros and return a processed string.
@@ -494,15 +613,14 @@ def replace_macros(s, *dicts):
         Raises a MacroNotFound exception if a macro was included, but it could
         not be found.
     """
-    # Replace the values
-    def _substitute(m):
-        # Get the string for the match
-        # ex: macro = '@friend.name'
-        d = m.groupdict()
-        macro = d['macro']
+    # Track whether macros were replaced in a substitution pass
+    replaced = False
 
+    # Replace the values
+    def _substitute_macro(macro, match):
+        nonlocal replaced
         # Split at periods
-        # ex: pieces = ['@friend', 'name']
+        # ex: macro = '@friend.name', pieces = ['@friend', 'name']
         pieces = macro.split('.')
 
         # See if the first piece corresponds to an entry in kwargs
@@ -525,17 +643,37 @@ def replace_macros(s, *dicts):
         # Convert obj and the remaining pieces to a string
         if obj is None:
             # no match found. Return the match
-            return m.group()
+            return match
         else:
             # match(es) found, replace with the string
+            replaced = True
             return str(obj) + ''.join('.' + piece for piece in pieces)
 
+    def _substitute(m):
+        return _substitute_macro(m.group('macro'), m.group())
+
     # Return a string with the dicts substituted. Keep substituting until
-    # all dicts are replaced or the string is no longer changing
-    s, num_subs = _re_macro.subn(_substitute, s)
+    # all dicts are replaced or the string is no longer changing. The matches
+    # include tags, which aren't replaced, and a string that had no macros
+    # replaced doesn't need to be substituted again. Strings without the tag
+    # prefix, like most formatted labels, have no macros left to match.
+
+    # The first substitution of short strings, like label format strings,
+    # uses the cached macro tokens of the string
+    if len(s) < macro_cache_max_length:
+        tokens, remainder = macro_tokens_cached(s)
+        num_subs = len(tokens)
+        if num_subs:
+            s = ''.join([text + _substitute_macro(macro, match)
+                         for text, macro, match in tokens]) + remainder
+    else:
+        s, num_subs = _re_macro.subn(_substitute, s)
+
     last_num_subs = 0
-    while num_subs > 0 and num_subs > last_num_subs:
+    while (replaced and num_subs > 0 and num_subs > last_num_subs and
+           settings.tag_prefix in s):
         last_num_subs = num_subs
+        replaced = False
         s, num_subs = _re_macro.subn(_substitute, s)
 
     return s
@@ -1,6 +1,8 @@
 """
 Test the attributes functions
 """
+import sys
+
 from disseminate.attributes import Attributes
 from disseminate.utils.types import (PositionalValue, FloatPositionalValue,
                                      IntPositionalValue, StringPositionalValue)
@@ -44,6 +46,9 @@ def test_attributes_init():
     attrs = Attributes(None)
     assert len(attrs) == 0
 
+    attrs = Attributes('')
+    assert len(attrs) == 0
+
     # 4. Test with dicts
     attrs = Attributes({'test': 'class'})
     assert attrs == {'test': 'class'}
@@ -54,6 +59,9 @@ def test_attributes_init():
     attrs = Attributes((('test', 'class'),))
     assert attrs == {'test': 'class'}
 
+    attrs = Attributes('one=1', None, {'test': 'class'}, two=2)
+    assert attrs == {'one': '1', 'test': 'class', 'two': 2}
+
     # 5. Test positionals with quoted spaces
     attrs = Attributes('one "{my second positional}"')
     assert attrs['one'] == StringPositionalValue
@@ -67,6 +75,15 @@ def test_attributes_init():
     assert attrs['positional}'] == StringPositionalValue
 
 
+def test_attributes_interned_keys():
+    """Test that the keys parsed from attribute strings are interned."""
+    key = ''.join(['wid', 'th'])
+    attrs = Attributes('width=100% ' + key + '.tex=50%')
+
+    assert list(attrs.keys()) == ['width', 'width.tex']
+    assert list(attrs.keys())[0] is sys.intern(key)
+
+
 def test_attributes_copy():
     """Test the copy method of Attributes classes."""
 
@@ -193,6 +210,14 @@ def test_attributes_strip():
     assert attrs['class'] == 'specific'
     assert attrs['two'] == StringPositionalValue
 
+    # 2. Test attributes without target-specific terminators, which are not
+    #    changed
+    attrs = Attributes('class=basic two width=30%')
+    attrs.strip()
+    assert list(attrs.items()) == [('class', 'basic'),
+                                   ('two', StringPositionalValue),
+                                   ('width', '30%')]
+
 
 def test_attributes_filter():
     """Test the filter method of Attributes classes."""
@@ -275,6 +300,13 @@ def test_attributes_filter():
     assert 'one' in filtered_attrs
     assert '{http://link.org/}type' in filtered_attrs
 
+    # 7. Test empty attributes. A new attributes dict is returned
+    attrs = Attributes()
+    filtered_attrs = attrs.filter(attrs=('src',), target='.html')
+    assert filtered_attrs == Attributes()
+    assert isinstance(filtered_attrs, Attributes)
+    assert filtered_attrs is not attrs
+
 
 def test_attributes_filter_order():
     """Test the ordering of attributes for the filter method."""
@@ -155,6 +155,32 @@ def test_parallelbuilder_add_build_render(env):
     assert '<svg' in outfilepath.read_text()
 
 
+def test_parallelbuilder_add_build_render_reused(env):
+    """Test the ParallelBuilder add_build method with render builders for the
+    same content."""
+    # Add the render fields into the context
+    Tag = namedtuple('Tag', 'tex')
+    env.context['body'] = Tag(tex='my body')
+
+    # 1. Test the builds for the same content. The first build is reused.
+    parallel_builder = ParallelBuilder(env, target='html')
+    builder1 = parallel_builder.add_build(parameters=['.render', 'y=x'],
+                                          context=env.context)
+    builder2 = parallel_builder.add_build(parameters=['.render', 'y=x'],
+                                          context=env.context)
+
+    assert builder1 is builder2
+    assert parallel_builder.subbuilders == [builder1]
+
+    # 2. Test the build for different content
+    builder3 = parallel_builder.add_build(parameters=['.render', 'y=2x'],
+                                          context=env.context)
+
+    assert builder3 is not builder1
+    assert builder3.outfilepath != builder1.outfilepath
+    assert parallel_builder.subbuilders == [builder1, builder3]
+
+
 def test_parallelbuilder_add_build_missing(env):
     """Test the ParallelBuilder add_build method with missing file types"""
     tmpdir = env.context['target_root']
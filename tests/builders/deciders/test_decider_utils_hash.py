@@ -21,11 +21,11 @@ def test_hash_items_simple_strings():
     assert hash_items('one', b'two') == 'cf5ee7b5ea1bc2b55af82075798f5f54'
 
 
-def test_hash_items_txt_files(tmpdir):
+def test_hash_items_txt_files(tmp_path):
     """Test the hash_items function with text files"""
-    p1 = pathlib.Path(tmpdir) / 'file1.txt'
-    p2 = pathlib.Path(tmpdir) / 'file2.txt'
-    p3 = pathlib.Path(tmpdir) / 'file3.txt'
+    p1 = tmp_path / 'file1.txt'
+    p2 = tmp_path / 'file2.txt'
+    p3 = tmp_path / 'file3.txt'
 
     p1.write_text('one')
     p2.write_text('one')
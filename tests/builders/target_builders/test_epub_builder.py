@@ -14,6 +14,9 @@ ex3_root = pathlib.Path('tests') / 'builders' / 'examples' / 'ex3'
 ex3_srcdir = ex3_root / 'src'
 ex6_root = pathlib.Path('tests') / 'builders' / 'examples' / 'ex6'
 
+# A mock tag for the body of a document with an 'xhtml' format
+Tag = namedtuple('Tag', 'xhtml')
+
 
 def test_epub_builder_find_or_create_xhtml_builders(doctree):
     """Test the find_or_create_xhtml_builders EpubBuilder method."""
@@ -189,8 +192,7 @@ def test_epub_builder_simple1(env):
                                 subpath='test.xhtml')
 
     # 1. Setup the builder without an outfilepath
-    tag = namedtuple('tag', 'xhtml')
-    context['body'] = tag(xhtml="My body")  # expects {{ body.tex }}
+    context['body'] = Tag(xhtml="My body")  # expects {{ body.tex }}
 
     builder = EpubBuilder(env, context=context)
 
@@ -219,14 +221,12 @@ def test_epub_builder_simple1(env):
     assert builder.status == 'done'
 
 
-def test_epub_builder_simple_doc_build(load_example):
+def test_epub_builder_simple_doc_build(built_example):
     """Test a build of a simple document with the EPubBuilder."""
     # 1. example 1: tests/builders/examples/ex3
-    doc = load_example(ex3_srcdir / 'dummy.dm', cp_src=True)
+    doc = built_example(ex3_srcdir / 'dummy.dm')
     target_root = doc.target_root
 
-    doc.build()
-
     # Check the copied and built files
     tgt_filepath = TargetPath(target_root=target_root, target='epub',
                               subpath='dummy.epub')
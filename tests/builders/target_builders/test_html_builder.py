@@ -19,6 +19,9 @@ ex4_root = pathlib.Path('tests') / 'builders' / 'examples' / 'ex4'
 ex5_root = pathlib.Path('tests') / 'builders' / 'examples' / 'ex5'
 ex8_root = pathlib.Path('tests') / 'builders' / 'examples' / 'ex8'
 
+# A mock tag for the body of a document with a 'html' format
+Tag = namedtuple('Tag', 'html')
+
 
 def test_html_builder_setup_html(env):
     """Test the setup of a HtmlBuilder when 'html' is listed as a target
@@ -135,8 +138,7 @@ def test_html_builder_simple(env):
     # 1. Setup the builder with an outfilepath
     target_filepath = TargetPath(target_root=tmpdir, target='html',
                                  subpath='test.html')
-    tag = namedtuple('tag', 'html')
-    context['body'] = tag(html="My body")  # expects {{ body.html }}
+    context['body'] = Tag(html="My body")  # expects {{ body.html }}
 
     builder = HtmlBuilder(env, context=context, outfilepath=target_filepath)
 
@@ -204,14 +206,12 @@ def test_html_builder_simple_doc(load_example, html_update_version):
     assert builder.status == 'done'
 
 
-def test_html_builder_simple_doc_build(load_example):
+def test_html_builder_simple_doc_build(built_example):
     """Test a build for a simple document."""
     # 1. example 1: tests/builders/examples/example3
-    doc = load_example(ex3_srcdir / 'dummy.dm')
+    doc = built_example(ex3_srcdir / 'dummy.dm')
     target_root = doc.context['target_root']
 
-    doc.build()
-
     # Check the copied and built files
     tgt_filepath = TargetPath(target_root=target_root, target='html',
                               subpath='dummy.html')
@@ -235,8 +235,7 @@ def test_html_builder_inherited(env):
     #    is needed
     target_filepath = TargetPath(target_root=tmpdir, target='html',
                                  subpath='test.html')
-    tag = namedtuple('tag', 'html')
-    context['body'] = tag(html="My body")  # expects {{ body.html }}
+    context['body'] = Tag(html="My body")  # expects {{ body.html }}
     context['template'] = 'books/tufte'
 
     builder = HtmlBuilder(env, context=context, outfilepath=target_filepath)
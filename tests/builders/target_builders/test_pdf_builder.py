@@ -2,8 +2,12 @@
 Test the PdfBuilder
 """
 import pathlib
+import shutil
 from collections import namedtuple
 
+import pytest
+
+from disseminate.builders.builder import Builder
 from disseminate.builders.target_builders.pdf_builder import PdfBuilder
 from disseminate.paths import TargetPath
 
@@ -12,199 +16,179 @@ from disseminate.paths import TargetPath
 ex3_root = pathlib.Path('tests') / 'builders' / 'examples' / 'ex3'
 ex3_srcdir = ex3_root / 'src'
 
-
-def test_pdf_builder_setup_pdf_in_targets(env):
-    """Test the setup of a PdfBuilder when 'pdf' (but not 'tex') is listed as
-    a target in the context['targets']"""
-    context = env.context
+# A mock tag for the body of a document with a 'tex' format
+Tag = namedtuple('Tag', 'tex')
+
+
+@pytest.fixture(scope='module')
+def ex3_src(tmp_path_factory):
+    """A copy of the example 3 source directory, which is copied once for the
+    tests in this module. The tests do not modify the source files."""
+    src_dir = tmp_path_factory.mktemp('ex3') / 'src'
+    shutil.copytree(ex3_srcdir, src_dir)
+    return src_dir
+
+
+def make_pdflatex_available(monkeypatch):
+    """Make the Pdflatex builder available, even if pdflatex is not installed,
+    until the monkeypatch is undone.
+
+    The setup tests only create builders, so they do not need a latex
+    installation.
+    """
+    monkeypatch.setitem(Builder._active, 'Pdflatex', True)
+    monkeypatch.setattr(Builder, '_available_builders', dict())
+
+
+@pytest.fixture
+def pdflatex_available(monkeypatch):
+    """Make the Pdflatex builder available for a test. The cached active and
+    available builders are restored after the test."""
+    make_pdflatex_available(monkeypatch)
+
+
+@pytest.fixture(scope='module')
+def setup_env(request):
+    """The module_env shared by the PdfBuilder setup tests.
+
+    The environment's document creates a PdfBuilder, so the Pdflatex builder
+    is made available while the module_env is created. The setup tests only
+    create builders, and each test resets the targets and builders entries
+    of the context it uses.
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        make_pdflatex_available(monkeypatch)
+        return request.getfixturevalue('module_env')
+
+
+@pytest.fixture(scope='module')
+def expected_paths(setup_env):
+    """The target paths expected for the PdfBuilder setup tests, which are
+    created once for the setup_env."""
+    target_root = setup_env.context['target_root']
+    cache_root = target_root / '.cache'
+    return {
+        'tex': TargetPath(target_root=target_root, target='tex',
+                          subpath='test.tex'),
+        'cache_tex': TargetPath(target_root=cache_root, target='tex',
+                                subpath='test.tex'),
+        'pdf': TargetPath(target_root=target_root, target='pdf',
+                          subpath='test.pdf'),
+        'cache_pdf': TargetPath(target_root=cache_root, target='pdf',
+                                subpath='test.pdf'),
+        'final_pdf': TargetPath(target_root=target_root, target='pdf',
+                                subpath='final.pdf'),
+    }
+
+
+def builder_snapshot(builder):
+    """A dict with the setup state of a builder for comparisons."""
+    return {'cls': builder.__class__.__name__,
+            'target': builder.target,
+            'use_cache': builder.use_cache,
+            'parameters': builder.parameters,
+            'outfilepath': builder.outfilepath}
+
+
+@pytest.mark.parametrize('targets, tex_use_cache, pdf_use_cache', [
+    # 'pdf' (but not 'tex') is listed in the targets, so the tex file is
+    # placed in the cache directory, but the final pdf file is not
+    ({'pdf'}, True, False),
+    # 'pdf' and 'tex' are listed in the targets, so neither the tex file nor
+    # the final pdf file are placed in the cache directory
+    ({'pdf', 'tex'}, False, False),
+    # Neither 'pdf' nor 'tex' are listed in the targets, so both are placed
+    # in the cache directory
+    (set(), True, True),
+], ids=['pdf', 'pdf_tex', 'not_in_targets'])
+def test_pdf_builder_setup(pdflatex_available, setup_env, expected_paths,
+                           targets, tex_use_cache, pdf_use_cache):
+    """Test the setup of a PdfBuilder with different context['targets']"""
+    # The setup_env is shared by the setup tests, which only create builders.
+    # The targets and builders entries of the context are reset by each test.
+    context = setup_env.context
     src_filepath = context['src_filepath']
-    target_root = context['target_root']
 
-    # 1. Setup the builder without an outfilepath.  In this case, 'tex' is not
-    #    listed in the targets but 'pdf is, so the outfilepath will *not*
-    #    be in the cache directory
-    context['targets'] -= {'tex'}
-    context['targets'] |= {'pdf'}
+    # 1. Setup the builder without an outfilepath.
+    context['targets'] -= {'tex', 'pdf'}
+    context['targets'] |= targets
     context['builders'].clear()  # Reset the builders
 
-    target_tex_filepath = TargetPath(target_root=target_root / '.cache',
-                                     target='tex', subpath='test.tex')
-    target_cache_pdf_filepath = TargetPath(target_root=target_root / '.cache',
-                                           target='pdf', subpath='test.pdf')
-    target_pdf_filepath = TargetPath(target_root=target_root,
-                                     target='pdf', subpath='test.pdf')
-    builder = PdfBuilder(env, context=context)
+    target_tex_filepath = expected_paths['cache_tex' if tex_use_cache else
+                                         'tex']
+    target_cache_pdf_filepath = expected_paths['cache_pdf']
+    target_pdf_filepath = expected_paths['cache_pdf' if pdf_use_cache else
+                                         'pdf']
+    builder = PdfBuilder(setup_env, context=context)
 
     # check the build
     assert context['builders']['.pdf'] == builder  # builder in context
     assert not target_pdf_filepath.exists()
     assert len(builder.subbuilders) == 3
 
-    # 1. Check the TexBuilder
+    # Check the subbuilders: the TexBuilder, the tex2pdf conversion build and
+    # the copy build to the final pdf directory
+    pdf_builder_cls = builder.subbuilders[1].__class__.__name__
+    assert pdf_builder_cls in {'Latexmk', 'Pdflatex'}
+    assert [builder_snapshot(b) for b in builder.subbuilders] == [
+        {'cls': 'TexBuilder', 'target': 'tex', 'use_cache': tex_use_cache,
+         'parameters': ["build 'TexBuilder'", src_filepath],
+         'outfilepath': target_tex_filepath},
+        {'cls': pdf_builder_cls, 'target': 'pdf', 'use_cache': True,
+         'parameters': [target_tex_filepath],
+         'outfilepath': target_cache_pdf_filepath},
+        {'cls': 'Copy', 'target': 'pdf', 'use_cache': False,
+         'parameters': [target_cache_pdf_filepath],
+         'outfilepath': target_pdf_filepath},
+    ]
+
     tex_builder = builder.subbuilders[0]
-    assert tex_builder.__class__.__name__ == 'TexBuilder'
-    assert tex_builder.use_cache
-    assert tex_builder.target == 'tex'
-    assert tex_builder.use_cache
     assert len(tex_builder.subbuilders[1].parameters) > 0
     assert tex_builder.subbuilders[1].outfilepath == target_tex_filepath
-    assert tex_builder.parameters == ["build 'TexBuilder'", src_filepath]
-    assert tex_builder.outfilepath == target_tex_filepath
-
-    # 2. Check the tex2pdf conversion build
-    pdf_builder = builder.subbuilders[1]
-    assert pdf_builder.__class__.__name__ in {'Latexmk', 'Pdflatex'}
-    assert pdf_builder.use_cache
-    assert pdf_builder.target == 'pdf'
-    assert pdf_builder.parameters == [target_tex_filepath]
-    assert pdf_builder.outfilepath == target_cache_pdf_filepath
-
-    # 3. Check the copy build to the final pdf directory
-    copy_builder = builder.subbuilders[2]
-    assert copy_builder.__class__.__name__ == 'Copy'
-    assert not copy_builder.use_cache
-    assert copy_builder.target == 'pdf'
-    assert copy_builder.parameters == [target_cache_pdf_filepath]
-    assert copy_builder.outfilepath == target_pdf_filepath
 
     assert builder.parameters == ["build 'PdfBuilder'", src_filepath]
     assert builder.outfilepath == target_pdf_filepath
-    assert not builder.use_cache
+    assert builder.use_cache == pdf_use_cache
 
     assert builder.build_needed()
     assert builder.status == 'ready'
 
 
-def test_pdf_builder_setup_pdf_tex_in_targets(env):
-    """Test the setup of a PdfBuilder when 'pdf' and 'tex' are listed as a
-    target in the context['targets']"""
-    context = env.context
+def test_pdf_builder_setup_outfilepath(pdflatex_available, setup_env,
+                                       expected_paths):
+    """Test the setup of a PdfBuilder with an outfilepath when 'pdf' and 'tex'
+    are listed as a target in the context['targets']"""
+    context = setup_env.context
     src_filepath = context['src_filepath']
-    target_root = context['target_root']
 
-    # 2. Setup the builder without an outfilepath.  In this case, 'tex' and
-    #    'pdf' are listed in the targets , so the outfilepaths will *not*
-    #    be in the cache directory
     context['targets'] |= {'tex'}
     context['targets'] |= {'pdf'}
     context['builders'].clear()  # Reset the builders
 
-    target_tex_filepath = TargetPath(target_root=target_root,
-                                     target='tex', subpath='test.tex')
-    target_cache_pdf_filepath = TargetPath(target_root=target_root / '.cache',
-                                           target='pdf', subpath='test.pdf')
-    target_pdf_filepath = TargetPath(target_root=target_root,
-                                     target='pdf', subpath='test.pdf')
-    builder = PdfBuilder(env, context=context)
-
-    # check the build
-    assert context['builders']['.pdf'] == builder  # builder in context
-    assert not target_pdf_filepath.exists()
-    assert len(builder.subbuilders) == 3
-
-    assert builder.subbuilders[0].__class__.__name__ == 'TexBuilder'
-    assert builder.subbuilders[0].target == 'tex'
-    assert not builder.subbuilders[0].use_cache
-    assert builder.subbuilders[0].parameters == ["build 'TexBuilder'",
-                                                 src_filepath]
-    assert builder.subbuilders[0].outfilepath == target_tex_filepath
-
-    assert (builder.subbuilders[1].__class__.__name__
-            in {'Latexmk', 'Pdflatex'})
-    assert builder.subbuilders[1].target == 'pdf'
-    assert builder.subbuilders[1].parameters == [target_tex_filepath]
-    assert builder.subbuilders[1].outfilepath == target_cache_pdf_filepath
-
-    copy_builder = builder.subbuilders[2]
-    assert copy_builder.__class__.__name__ == 'Copy'
-    assert copy_builder.target == 'pdf'
-    assert copy_builder.parameters == [target_cache_pdf_filepath]
-    assert copy_builder.outfilepath == target_pdf_filepath
-
-    assert builder.parameters == ["build 'PdfBuilder'", src_filepath]
-    assert builder.outfilepath == target_pdf_filepath
-
-    assert builder.build_needed()
-    assert builder.status == 'ready'
-
-    # 3. Setup the builder with an outfilepath
-    target_pdf_filepath = TargetPath(target_root=target_root,
-                                     target='pdf', subpath='final.pdf')
-    builder = PdfBuilder(env, context=context, outfilepath=target_pdf_filepath)
-
-    # check the build
-    assert not target_pdf_filepath.exists()
-    assert len(builder.subbuilders) == 3
-
-    assert builder.subbuilders[0].__class__.__name__ == 'TexBuilder'
-    assert builder.subbuilders[0].target == 'tex'
-    assert not builder.subbuilders[0].use_cache
-    assert builder.subbuilders[0].parameters == ["build 'TexBuilder'",
-                                                 src_filepath]
-    assert builder.subbuilders[0].outfilepath == target_tex_filepath
-
-    assert (builder.subbuilders[1].__class__.__name__
-            in {'Latexmk', 'Pdflatex'})
-    assert builder.subbuilders[1].target == 'pdf'
-    assert builder.subbuilders[1].parameters == [target_tex_filepath]
-    assert builder.subbuilders[1].outfilepath == target_cache_pdf_filepath
-
-    copy_builder = builder.subbuilders[2]
-    assert copy_builder.__class__.__name__ == 'Copy'
-    assert copy_builder.target == 'pdf'
-    assert copy_builder.parameters == [target_cache_pdf_filepath]
-    assert copy_builder.outfilepath == target_pdf_filepath
-
-    assert builder.parameters == ["build 'PdfBuilder'", src_filepath]
-    assert builder.outfilepath == target_pdf_filepath
-
-    assert builder.build_needed()
-    assert builder.status == 'ready'
-
-
-def test_pdf_builder_setup_not_in_targets(env):
-    """Test setuop of a PdfBuilder when 'tex' and 'pdf' are not listed as a
-    target in the context['targets'] """
-    context = env.context
-    src_filepath = context['src_filepath']
-    target_root = context['target_root']
-
-    # 1. Setup the builder without an outfilepath
-    context['targets'] -= {'tex'}
-    context['targets'] -= {'pdf'}
-    context['builders'].clear()  # Reset the builders
-
-    target_tex_filepath = TargetPath(target_root=target_root / '.cache',
-                                     target='tex', subpath='test.tex')
-    target_cache_pdf_filepath = TargetPath(target_root=target_root / '.cache',
-                                           target='pdf', subpath='test.pdf')
-    target_pdf_filepath = TargetPath(target_root=target_root / '.cache',
-                                     target='pdf', subpath='test.pdf')
-    builder = PdfBuilder(env, context=context)
+    target_tex_filepath = expected_paths['tex']
+    target_cache_pdf_filepath = expected_paths['cache_pdf']
+    # 1. Setup the builder with an outfilepath
+    target_pdf_filepath = expected_paths['final_pdf']
+    builder = PdfBuilder(setup_env, context=context,
+                         outfilepath=target_pdf_filepath)
 
     # check the build
-    assert context['builders']['.pdf'] == builder  # builder in context
     assert not target_pdf_filepath.exists()
     assert len(builder.subbuilders) == 3
 
-    assert builder.subbuilders[0].__class__.__name__ == 'TexBuilder'
-    assert builder.subbuilders[0].target == 'tex'
-    assert builder.subbuilders[0].use_cache
-    assert builder.subbuilders[0].parameters == ["build 'TexBuilder'",
-                                                 src_filepath]
-    assert builder.subbuilders[0].outfilepath == target_tex_filepath
-
-    assert (builder.subbuilders[1].__class__.__name__ in
-            {'Latexmk', 'Pdflatex'})
-    assert builder.subbuilders[1].target == 'pdf'
-    assert builder.subbuilders[1].parameters == [target_tex_filepath]
-    assert builder.subbuilders[1].outfilepath == target_cache_pdf_filepath
-
-    copy_builder = builder.subbuilders[2]
-    assert copy_builder.__class__.__name__ == 'Copy'
-    assert copy_builder.target == 'pdf'
-    assert copy_builder.parameters == [target_cache_pdf_filepath]
-    assert copy_builder.outfilepath == target_pdf_filepath
+    pdf_builder_cls = builder.subbuilders[1].__class__.__name__
+    assert pdf_builder_cls in {'Latexmk', 'Pdflatex'}
+    assert [builder_snapshot(b) for b in builder.subbuilders] == [
+        {'cls': 'TexBuilder', 'target': 'tex', 'use_cache': False,
+         'parameters': ["build 'TexBuilder'", src_filepath],
+         'outfilepath': target_tex_filepath},
+        {'cls': pdf_builder_cls, 'target': 'pdf', 'use_cache': True,
+         'parameters': [target_tex_filepath],
+         'outfilepath': target_cache_pdf_filepath},
+        {'cls': 'Copy', 'target': 'pdf', 'use_cache': False,
+         'parameters': [target_cache_pdf_filepath],
+         'outfilepath': target_pdf_filepath},
+    ]
 
     assert builder.parameters == ["build 'PdfBuilder'", src_filepath]
     assert builder.outfilepath == target_pdf_filepath
@@ -213,6 +197,7 @@ def test_pdf_builder_setup_not_in_targets(env):
     assert builder.status == 'ready'
 
 
+@pytest.mark.latex
 def test_pdf_builder_simple_pdf(env):
     """Test a simple build with the PdfBuilder with pdf target"""
     context = env.context
@@ -226,8 +211,7 @@ def test_pdf_builder_simple_pdf(env):
                               subpath='test.pdf')
     tex_filepath = TargetPath(target_root=target_root, target='tex',
                               subpath='test.tex')
-    tag = namedtuple('tag', 'tex')
-    context['body'] = tag(tex="My body")  # expects {{ body.tex }}
+    context['body'] = Tag(tex="My body")  # expects {{ body.tex }}
 
     builder = PdfBuilder(env, context=context)
 
@@ -253,6 +237,7 @@ def test_pdf_builder_simple_pdf(env):
     assert builder.status == 'done'
 
 
+@pytest.mark.latex
 def test_pdf_builder_simple_tex_pdf(env):
     """Test a simple build with the PdfBuilder with tex and pdf targets"""
     context = env.context
@@ -264,8 +249,7 @@ def test_pdf_builder_simple_tex_pdf(env):
                               subpath='test.pdf')
     tex_filepath = TargetPath(target_root=target_root, target='tex',
                               subpath='test.tex')
-    tag = namedtuple('tag', 'tex')
-    context['body'] = tag(tex="My body")  # expects {{ body.tex }}
+    context['body'] = Tag(tex="My body")  # expects {{ body.tex }}
 
     builder = PdfBuilder(env, context=context)
 
@@ -291,10 +275,11 @@ def test_pdf_builder_simple_tex_pdf(env):
     assert builder.status == 'done'
 
 
-def test_pdf_builder_simple_doc(load_example):
+@pytest.mark.latex
+def test_pdf_builder_simple_doc(load_example, ex3_src):
     """Test a simple build with the PdfBuilder."""
     # 1. example 1: tests/builders/examples/ex3
-    doc = load_example(ex3_srcdir / 'dummy.dm', cp_src=True)
+    doc = load_example(ex3_src / 'dummy.dm')
     env = doc.context['environment']
 
     # Setup the builder
@@ -325,10 +310,11 @@ def test_pdf_builder_simple_doc(load_example):
     assert builder.status == 'done'
 
 
-def test_pdf_builder_simple_doc_build(load_example):
+@pytest.mark.latex
+def test_pdf_builder_simple_doc_build(load_example, ex3_src):
     """Test a build of a simple document with the PdfBuilder."""
     # 1. example 1: tests/builders/examples/ex3
-    doc = load_example(ex3_srcdir / 'dummy.dm', cp_src=True)
+    doc = load_example(ex3_src / 'dummy.dm')
     target_root = doc.target_root
 
     doc.build()
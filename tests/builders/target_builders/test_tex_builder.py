@@ -11,6 +11,9 @@ from disseminate.paths import SourcePath, TargetPath
 ex3_root = pathlib.Path('tests') / 'builders' / 'examples' / 'ex3'
 ex3_srcdir = ex3_root / 'src'
 
+# A mock tag for the body of a document with a 'tex' format
+Tag = namedtuple('Tag', 'tex')
+
 
 def test_tex_builder_setup_in_targets(env):
     """Test the setup of a TexBuilder when 'tex' is listed as a target
@@ -103,8 +106,7 @@ def test_tex_builder_simple(env):
     #    is needed
     target_filepath = TargetPath(target_root=tmpdir, target='tex',
                                  subpath='test.tex')
-    tag = namedtuple('tag', 'tex')
-    context['body'] = tag(tex="My body")  # expects {{ body.tex }}
+    context['body'] = Tag(tex="My body")  # expects {{ body.tex }}
 
     builder = TexBuilder(env, context=context, outfilepath=target_filepath)
 
@@ -159,14 +161,12 @@ def test_tex_builder_simple_doc(load_example):
     assert builder.status == 'done'
 
 
-def test_tex_builder_simple_doc_build(load_example):
+def test_tex_builder_simple_doc_build(built_example):
     """Test a document build with the TexBuilder."""
     # 1. example 1: tests/builders/examples/ex3
-    doc = load_example(ex3_srcdir / 'dummy.dm', cp_src=True)
+    doc = built_example(ex3_srcdir / 'dummy.dm')
     target_root = doc.target_root
 
-    doc.build()
-
     # Check the built files
     key = pathlib.Path('tests/builders/examples/ex3/dummy.tex')
     tgt_filepath = TargetPath(target_root=target_root, target='tex',
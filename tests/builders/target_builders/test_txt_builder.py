@@ -11,6 +11,9 @@ from disseminate.paths import TargetPath
 ex3_root = pathlib.Path('tests') / 'builders' / 'examples' / 'ex3'
 ex3_srcdir = ex3_root / 'src'
 
+# A mock tag for the body of a document with a 'txt' format
+Tag = namedtuple('Tag', 'txt')
+
 
 def test_txt_builder_setup_in_targets(env):
     """Test the setup of a TxtBuilder when 'txt' is listed as a target
@@ -103,8 +106,7 @@ def test_txt_builder_simple(env):
     #    is needed
     target_filepath = TargetPath(target_root=tmpdir, target='txt',
                                  subpath='test.txt')
-    tag = namedtuple('tag', 'txt')
-    context['body'] = tag(txt="My body")  # expects {{ body.tex }}
+    context['body'] = Tag(txt="My body")  # expects {{ body.tex }}
 
     builder = TxtBuilder(env, context=context, outfilepath=target_filepath)
 
@@ -159,14 +161,12 @@ def test_txt_builder_simple_doc(load_example):
     assert builder.status == 'done'
 
 
-def test_txt_builder_simple_doc_build(load_example):
+def test_txt_builder_simple_doc_build(built_example):
     """Test a render of a simple document with the TxtBuilder."""
     # 1. example 1: tests/builders/examples/ex3
-    doc = load_example(ex3_srcdir / 'dummy.dm', cp_src=True)
+    doc = built_example(ex3_srcdir / 'dummy.dm')
     target_root = doc.target_root
 
-    doc.build()
-
     # Check the copied and built files
     tgt_filepath = TargetPath(target_root=target_root, target='txt',
                               subpath='dummy.txt')
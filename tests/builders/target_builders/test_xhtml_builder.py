@@ -5,6 +5,10 @@ from disseminate.builders.target_builders.xhtml_builder import XHtmlBuilder
 from disseminate.paths import SourcePath, TargetPath
 
 
+# A mock tag for the body of a document with an 'xhtml' format
+Tag = namedtuple('Tag', 'xhtml')
+
+
 def test_xhtml_builder_setup(env):
     """Test the setup of a HtmlBuilder when 'xhtml' is not listed as a target
     in the context['targets']"""
@@ -68,8 +72,7 @@ def test_xhtml_builder_simple(env):
     cache_path = env.cache_path
 
     # 1. Setup the builder with an outfilepath
-    tag = namedtuple('tag', 'xhtml')
-    context['body'] = tag(xhtml="My body")  # expects {{ body.html }}
+    context['body'] = Tag(xhtml="My body")  # expects {{ body.html }}
 
     builder = XHtmlBuilder(env, context=context, use_cache=True)
 
@@ -1,6 +1,11 @@
 """
 Tests with the code Builder functionality
 """
+import os
+import shutil
+import time
+from concurrent.futures import Future
+
 import pytest
 
 from disseminate.builders.builder import Builder
@@ -9,7 +14,12 @@ from disseminate.paths import SourcePath, TargetPath
 from disseminate.signals import signal, signals
 
 
-def test_builder_creation(env):
+# Paths for examples
+ex1_root = 'tests/builders/examples/ex1'
+ex10_root = 'tests/builders/examples/ex10'
+
+
+def test_builder_creation(module_env):
     """Test the creation of builders and ensure that they can take arbitrary
     arguments"""
     # The environment (env) is required
@@ -17,82 +27,79 @@ def test_builder_creation(env):
         Builder()
 
     # Other options are allowed (but ignored)
-    Builder(env, extra=1)
+    Builder(module_env, extra=1)
 
 
-def test_builder_filepaths(env):
+def test_builder_filepaths(module_env):
     """Test the Builder filepaths using a concrete builder (PdfCrop)"""
 
     # 1. Try an example without specifying parameters or outfilepath.
-    pdfcrop = PdfCrop(env=env)
+    pdfcrop = PdfCrop(env=module_env)
     assert pdfcrop.parameters == []
     assert (pdfcrop.outfilepath ==
-            env.target_root / 'media' / 'd41d8cd98f00_crop.pdf')
+            module_env.target_root / 'media' / 'd41d8cd98f00_crop.pdf')
 
     # 2. Try an example with specifying an infilepath but no outfilepath. By
     #    default, use_cache is False so the product is placed in the
     #     arget_root
-    infilepath = SourcePath(project_root='tests/builders/examples/ex1',
-                            subpath='sample.pdf')
-    outfilepath = TargetPath(target_root=env.target_root,
+    infilepath = SourcePath(project_root=ex1_root, subpath='sample.pdf')
+    outfilepath = TargetPath(target_root=module_env.target_root,
                              subpath='media/sample_crop.pdf')
-    pdfcrop = PdfCrop(parameters=infilepath, env=env)
+    pdfcrop = PdfCrop(parameters=infilepath, env=module_env)
     assert pdfcrop.parameters == [infilepath]
     assert pdfcrop.outfilepath == outfilepath
 
     # 3. Try an example with specifying an infilepath but no outfilepath.
     #    This time, use a document target
-    infilepath = SourcePath(project_root='tests/builders/examples/ex1',
-                            subpath='sample.pdf')
-    outfilepath = TargetPath(target_root=env.target_root,
+    outfilepath = TargetPath(target_root=module_env.target_root,
                              target='html',
                              subpath='media/sample_crop.pdf')
-    pdfcrop = PdfCrop(parameters=infilepath, target='html', env=env)
+    pdfcrop = PdfCrop(parameters=infilepath, target='html', env=module_env)
     assert pdfcrop.parameters == [infilepath]
     assert pdfcrop.outfilepath == outfilepath
 
     # 5. Try an example with specifying an outfilepath
-    outfilepath = TargetPath(target_root=env.context['target_root'],
+    outfilepath = TargetPath(target_root=module_env.context['target_root'],
                              subpath='sample_crop.pdf')
     pdfcrop = PdfCrop(parameters=infilepath, outfilepath=outfilepath,
-                      env=env)
+                      env=module_env)
     assert pdfcrop.parameters == [infilepath]
     assert pdfcrop.outfilepath == outfilepath
 
 
-def test_builder_filepaths_unusual_filenames(env):
+def test_builder_filepaths_unusual_filenames(module_env):
     """Test the builder filepaths with unusual filenames."""
-    project_root = 'tests/builders/examples/ex10'
+    project_root = ex10_root
 
     # 1. Start with a usual filename
     usual_filepath = SourcePath(project_root=project_root, subpath='usual.txt')
-    builder = Builder(env=env, parameters=[usual_filepath])
+    builder = Builder(env=module_env, parameters=[usual_filepath])
     assert builder.infilepaths == [usual_filepath]
 
     # 2. Try a filename with extra dots
     usual_filepath = SourcePath(project_root=project_root,
                                 subpath='unusual.2.txt')
-    builder = Builder(env=env, parameters=[usual_filepath])
+    builder = Builder(env=module_env, parameters=[usual_filepath])
     assert builder.infilepaths == [usual_filepath]
 
     # 3. Try a filename with unicode characters
     usual_filepath = SourcePath(project_root=project_root,
                                 subpath='unusual_čísla.txt')
-    builder = Builder(env=env, parameters=[usual_filepath])
+    builder = Builder(env=module_env, parameters=[usual_filepath])
     assert builder.infilepaths == [usual_filepath]
 
 
-def test_builder_get_parameter(env):
+def test_builder_get_parameter(module_env):
     """Test the Builder get_parameter method."""
-    builder = Builder(env=env, parameters=[('test', 'value'), 1])
+    builder = Builder(env=module_env, parameters=[('test', 'value'), 1])
 
     assert builder.get_parameter('test') == 'value'
     assert builder.get_parameter(1) is None
 
 
-def test_builder_parameters_from_signals(env):
+def test_builder_parameters_from_signals(module_env):
     """Test the parameters_from_signals functionality for builders."""
-    builder = Builder(env=env, parameters=[('test', 'value'), 1])
+    builder = Builder(env=module_env, parameters=[('test', 'value'), 1])
 
     assert builder.parameters == [('test', 'value'), 1]
 
@@ -163,14 +170,23 @@ def test_builder_status(env):
     assert not builder.build_needed()
     assert builder.status == 'done'
 
+    # 6. A builder with a running process is building, even if its output
+    #    file is up to date
+    builder.future = Future()
+    assert builder.status == 'building'
+
+    builder.future.set_result(None)
+    assert builder.status == 'done'
+
 
-def test_run_cmd_args(env):
+def test_run_cmd_args(module_env):
     """Test the run_cmd_args method"""
 
     # 1. Test a basic example
     infilepath = SourcePath(project_root='', subpath='sample.pdf')
     targetpath = TargetPath(target_root='', subpath='out.pdf')
-    builder = Builder(env=env, parameters=infilepath, outfilepath=targetpath)
+    builder = Builder(env=module_env, parameters=infilepath,
+                      outfilepath=targetpath)
     builder.action = ("My test with {builder.infilepaths} and "
                       "{builder.outfilepath}")
     assert builder.run_cmd_args() == ('My', 'test', 'with', 'sample.pdf',
@@ -180,7 +196,8 @@ def test_run_cmd_args(env):
     #    a filename
     infilepath = SourcePath(project_root='', subpath='-unsafe')
     targetpath = TargetPath(target_root='', subpath='out.pdf')
-    builder = Builder(env=env, parameters=infilepath, outfilepath=targetpath)
+    builder = Builder(env=module_env, parameters=infilepath,
+                      outfilepath=targetpath)
     builder.action = ("test -safe {builder.parameters} and "
                       "-outputfile={builder.outfilepath}")
     assert builder.run_cmd_args() == ('test', '-safe', 'unsafe', 'and',
@@ -190,8 +207,7 @@ def test_run_cmd_args(env):
 def test_builder_build(env):
     """Test the Builder build method"""
 
-    infilepath = SourcePath(project_root='tests/builders/examples/ex1',
-                            subpath='sample.pdf')
+    infilepath = SourcePath(project_root=ex1_root, subpath='sample.pdf')
     targetpath = TargetPath(target_root=env.context['target_root'],
                             subpath='sample_crop.pdf')
 
@@ -220,18 +236,24 @@ def test_builder_build(env):
     assert subbuilder.was_run
 
 
-def test_builder_md5decision(env, wait):
+def test_builder_md5decision(env):
     """Test the Builder with the Md5Decision."""
 
     tmpdir = env.context['target_root']
     infilepath = SourcePath(project_root=tmpdir, subpath='in.txt')
     targetpath = TargetPath(target_root=tmpdir, subpath='out.txt')
 
-    # 1. Test a  copy with a command run by build
+    # 1. Test a  copy run by build. The copy is run in-process, rather than
+    #    with an external command, but the builder still uses the
+    #    Md5Decision to decide whether a build is needed
     class CopyCmd(Builder):
-        action = 'cp {builder.infilepaths} {builder.outfilepath}'
+        action = 'copy'
         priority = 1000
-        required_execs = ('cp',)
+        required_execs = tuple()
+
+        def run_cmd(self, *args):
+            shutil.copyfile(self.infilepaths[0], self.outfilepath)
+            self.build_needed(reset=True)
 
     cp = CopyCmd(env=env, parameters=infilepath, outfilepath=targetpath)
 
@@ -251,6 +273,12 @@ def test_builder_md5decision(env, wait):
     assert targetpath.exists()
     assert infilepath.read_text() == targetpath.read_text()
     assert status == 'done'
+
+    # Set the file mtimes in the past so that the files written next are
+    # newer, without waiting for the filesystem's mtime resolution
+    now = time.time()
+    os.utime(infilepath, (now - 10, now - 10))
+    os.utime(targetpath, (now - 5, now - 5))
     mtime = targetpath.stat().st_mtime
 
     # Try running the build again. The output file should not be modified
@@ -260,7 +288,6 @@ def test_builder_md5decision(env, wait):
     assert targetpath.stat().st_mtime == mtime
 
     # 2. Try modifying the contents of the infile
-    wait()
     infilepath.write_text('infile text2')
     cp = CopyCmd(env=env, parameters=infilepath, outfilepath=targetpath)
 
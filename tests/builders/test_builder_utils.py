@@ -5,8 +5,9 @@ import pathlib
 import os.path
 
 from disseminate.builders.utils import (sort_key, generate_mock_parameters,
-                                        generate_outfilepath)
-from disseminate.paths import SourcePath
+                                        generate_outfilepath,
+                                        target_filepath)
+from disseminate.paths import SourcePath, TargetPath
 
 
 ex6_root = pathlib.Path('tests') / 'builders' / 'examples' / 'ex6'
@@ -151,3 +152,29 @@ def test_generate_outfilepath(env):
     fp = generate_outfilepath(env=env, parameters=[str(infilepath)],
                               use_cache=False, use_media=True)
     assert fp is None
+
+
+def test_target_filepath(tmp_path):
+    """Test the target_filepath function without a build environment."""
+    target_root = TargetPath(target_root=tmp_path)
+
+    # 1. Test a document target filepath
+    infilepath = SourcePath(project_root='src', subpath='dummy.dm')
+    fp = target_filepath(infilepath=infilepath, target_root=target_root,
+                         target='.html', ext='.html')
+    assert isinstance(fp, TargetPath)
+    assert fp.target_root == target_root
+    assert fp.target == pathlib.Path('html')
+    assert fp.subpath == pathlib.Path('dummy.html')
+
+    # 2. Test a document target filepath in a sub-directory
+    infilepath = SourcePath(project_root='src', subpath='sub1/index.dm')
+    fp = target_filepath(infilepath=infilepath, target_root=target_root,
+                         target='html', ext='.html')
+    assert fp.target == pathlib.Path('html')
+    assert fp.subpath == pathlib.Path('sub1') / 'index.html'
+
+    # 3. Test a target filepath with a media path
+    fp = target_filepath(infilepath=infilepath, target_root=target_root,
+                         ext='.png', media_path='media')
+    assert fp == target_root / 'media' / 'sub1' / 'index.png'
@@ -14,14 +14,14 @@ ex5_root = pathlib.Path('tests') / 'builders' / 'examples' / 'ex5'
 ex6_root = pathlib.Path('tests') / 'builders' / 'examples' / 'ex6'
 
 
-def test_environment_setup1(tmpdir):
+def test_environment_setup1(tmp_path):
     """Test the setup of an environment using example1"""
     # 1. tests/builders/examples/ex3/
     # ├── dummy.dm
     # ├── dummy.html
     # └── dummy.tex
     src_filepath = SourcePath(project_root=ex3_srcdir, subpath='dummy.dm')
-    env = Environment(src_filepath=src_filepath, target_root=tmpdir)
+    env = Environment(src_filepath=src_filepath, target_root=tmp_path)
     cache_path = env.cache_path
 
     target_builders = set(env.collect_target_builders())
@@ -54,24 +54,27 @@ def test_environment_setup1(tmpdir):
     assert epub_builders
 
     # Check the paths
-    tp_html = TargetPath(target_root=tmpdir, target='html',
+    tp_html = TargetPath(target_root=tmp_path, target='html',
                          subpath='dummy.html')
     assert html_builders[0].outfilepath == tp_html
 
-    tp_tex = TargetPath(target_root=tmpdir, target='tex', subpath='dummy.tex')
+    tp_tex = TargetPath(target_root=tmp_path, target='tex',
+                        subpath='dummy.tex')
     assert tex_builders[0].outfilepath == tp_tex
 
-    tp_pdf = TargetPath(target_root=tmpdir, target='pdf', subpath='dummy.pdf')
+    tp_pdf = TargetPath(target_root=tmp_path, target='pdf',
+                        subpath='dummy.pdf')
     assert pdf_builders[0].outfilepath == tp_pdf
 
-    tp_txt = TargetPath(target_root=tmpdir, target='txt', subpath='dummy.txt')
+    tp_txt = TargetPath(target_root=tmp_path, target='txt',
+                        subpath='dummy.txt')
     assert txt_builders[0].outfilepath == tp_txt
 
     tp_xhtml = TargetPath(target_root=cache_path, target='xhtml',
                           subpath='dummy.xhtml')
     assert xhtml_builders[0].outfilepath == tp_xhtml
 
-    tp_epub = TargetPath(target_root=tmpdir, target='epub',
+    tp_epub = TargetPath(target_root=tmp_path, target='epub',
                          subpath='dummy.epub')
     assert epub_builders[0].outfilepath == tp_epub
 
@@ -82,7 +85,7 @@ def test_environment_simple_build1(load_example, html_update_version):
     # ├── dummy.dm
     # ├── dummy.html
     # └── dummy.tex
-    # Copy the source file to the tmpdir
+    # Copy the source file to the tmp_path
     root_doc = load_example(ex3_srcdir / 'dummy.dm', cp_src=True)
     target_root = root_doc.target_root
     env = root_doc.context['environment']
@@ -0,0 +1,42 @@
+"""
+Tests for the builder executor
+"""
+import sys
+import subprocess
+from time import sleep
+
+import pytest
+
+from disseminate.builders.executor import executor, run, wait_running
+
+
+def test_executor_run():
+    """Test the run function."""
+
+    # 1. Test a process with more output than the pipe buffer
+    args = (sys.executable, '-c', 'print("x" * 200000)')
+    result = run(args=args, timeout=10)
+    assert result.returncode == 0
+    assert len(result.stdout.strip()) == 200000
+
+    # 2. Test a process that times out
+    args = (sys.executable, '-c', 'import time; time.sleep(10)')
+    with pytest.raises(subprocess.TimeoutExpired):
+        run(args=args, timeout=0.1)
+
+
+def test_executor_wait_running():
+    """Test the wait_running function."""
+
+    # 1. Test futures that are running
+    futures = [executor.submit(sleep, 0.05), executor.submit(sleep, 0.2)]
+    wait_running(futures)
+    assert futures[0].done()
+    assert not futures[1].done()
+
+    # 2. Test futures that are already done
+    wait_running(futures)
+    assert all(future.done() for future in futures)
+
+    # 3. Test without futures
+    wait_running([])
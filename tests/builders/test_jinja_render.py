@@ -2,12 +2,16 @@
 Test the render builder
 """
 import pathlib
+from collections import OrderedDict
 
 import jinja2
 import pytest
 
+from disseminate.builders import jinja_render
 from disseminate.builders.jinja_render import (JinjaRender, template_filepaths,
-                                               context_filepaths)
+                                               context_filepaths,
+                                               referenced_templates,
+                                               _templates)
 from disseminate.tags import Tag
 from disseminate.paths import TargetPath
 
@@ -277,6 +281,32 @@ def test_jinja_render(env):
     assert render_build.status == 'done'
 
 
+def test_jinja_render_shared_environment(env, module_env):
+    """Test that the jinja environment is shared between build
+    environments."""
+    render1 = JinjaRender(env, context=env.context, render_ext='.html')
+    render2 = JinjaRender(module_env, context=module_env.context,
+                          render_ext='.html')
+
+    assert env is not module_env
+    assert render1.jinja_environment() is render2.jinja_environment()
+    assert render1.template() is render2.template()
+
+
+def test_jinja_render_cached_template(env):
+    """Test that the selected templates are cached by template and target."""
+    context = env.context
+    render_html = JinjaRender(env, context=context, render_ext='.html')
+    render_tex = JinjaRender(env, context=context, render_ext='.tex')
+
+    template = render_html.template()
+    key = ('default', 'html')
+    assert _templates[key] is template
+    assert render_html.template() is template
+    assert render_tex.template() is not template
+    assert template.filename.endswith('default/html/template.html')
+
+
 def test_template_filepaths(jinja2_env):
     """Test the template_filepaths function."""
 
@@ -298,6 +328,31 @@ def test_template_filepaths(jinja2_env):
                             'tex/template.tex')
 
 
+def test_referenced_templates(jinja2_env, monkeypatch):
+    """Test the referenced_templates function."""
+    source = ("{% extends 'default/tex/template.tex' %}"
+              "{% include 'default/tex/toc.tex' %}")
+
+    # 1. Test the parsed referenced templates
+    names = referenced_templates(source, environment=jinja2_env)
+    assert names == ('default/tex/template.tex', 'default/tex/toc.tex')
+
+    # 2. Test that the template source isn't parsed again
+    def parse(*args, **kwargs):
+        raise AssertionError("The template source was parsed again")
+
+    monkeypatch.setattr(jinja2_env, 'parse', parse)
+    assert referenced_templates(source, environment=jinja2_env) == names
+
+    # 3. Test that the cache is bounded
+    monkeypatch.undo()
+    monkeypatch.setattr(jinja_render, '_referenced_templates', OrderedDict())
+    monkeypatch.setattr(jinja_render, '_referenced_templates_maxsize', 2)
+    for i in range(3):
+        referenced_templates(source + str(i), environment=jinja2_env)
+    assert len(jinja_render._referenced_templates) == 2
+
+
 def test_context_filepaths(jinja2_env):
     """Test the context_filepaths function."""
 
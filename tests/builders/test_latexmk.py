@@ -1,6 +1,8 @@
 """
 Test the Latexmk builder.
 """
+import pytest
+
 from disseminate.builders.builder import Builder
 from disseminate.builders.latexmk import Latexmk
 from disseminate.paths import SourcePath, TargetPath
@@ -97,6 +99,7 @@ def test_latexmk_setup_outfilepath(env):
     assert latexmk.outfilepath == outfilepath
 
 
+@pytest.mark.latex
 def test_latexmk_simple(env):
     """A simple build for Latexmk."""
     target_root = env.context['target_root']
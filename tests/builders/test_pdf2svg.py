@@ -3,6 +3,8 @@ Test the Pdf2svg builder
 """
 import pathlib
 
+import pytest
+
 from disseminate.builders.pdf2svg import Pdf2svg, Pdf2SvgCropScale
 from disseminate.builders.pdfcrop import PdfCrop
 from disseminate.builders.scalesvg import ScaleSvg
@@ -18,6 +20,7 @@ def test_pdf2svg_with_find_builder_cls():
     assert builder_cls.__name__ == "Pdf2SvgCropScale"
 
 
+@pytest.mark.svg
 def test_pdf2svg_build_with_outfilepath(env, is_svg):
     """Test the Pdf2svg builder."""
     # 1. Test example with the infilepath and outfilepath specified.
@@ -45,6 +48,7 @@ def test_pdf2svg_build_with_outfilepath(env, is_svg):
     assert is_svg(outfilepath)
 
 
+@pytest.mark.svg
 def test_pdf2svg_pdfcrop_with_outfilepath(env, svg_dims):
     """Test the Pdf2svg builder with a PdfCrop subbuilder."""
 
@@ -108,6 +112,7 @@ def test_pdf2svg_pdfcrop_with_outfilepath(env, svg_dims):
     assert svg_dims(outfilepath, width='30.7pt', height='30.0pt', abs=1.0)
 
 
+@pytest.mark.svg
 def test_pdf2svg_pdfcrop_without_outfilepath(env, svg_dims):
     """Test the Pdf2svg builder with a PdfCrop subbuilder."""
 
@@ -140,6 +145,7 @@ def test_pdf2svg_pdfcrop_without_outfilepath(env, svg_dims):
     assert svg_dims(outfilepath, width='30.7pt', height='30.0pt', abs=1.0)
 
 
+@pytest.mark.svg
 def test_pdf2svg_scalesvg_with_outfilepath(env, svg_dims):
     """Test the Pdf2svg builder with a ScaleSvg subbuilder."""
 
@@ -203,6 +209,7 @@ def test_pdf2svg_scalesvg_with_outfilepath(env, svg_dims):
     assert svg_dims(outfilepath, width='164', height='146', abs=1.0)
 
 
+@pytest.mark.svg
 def test_pdf2svg_scalesvg_without_outfilepath(env, svg_dims):
     """Test the Pdf2svg builder with a ScaleSvg subbuilder."""
 
@@ -1,6 +1,8 @@
 """
 Test the Pdflatex builder.
 """
+import pytest
+
 from disseminate.builders.pdflatex import Pdflatex
 from disseminate.paths import SourcePath, TargetPath
 
@@ -30,6 +32,7 @@ def test_pdflatex_setup(env):
     assert pdflatex.outfilepath == outfilepath
 
 
+@pytest.mark.latex
 def test_pdflatex_simple(env):
     """A simple build for Pdflatex."""
     target_root = env.context['target_root']
@@ -1,6 +1,8 @@
 """
 Test the PdfRender builder.
 """
+import pytest
+
 from disseminate.builders.pdfrender import PdfRender
 from disseminate.paths import TargetPath
 from disseminate.tags import Tag
@@ -203,6 +205,7 @@ def test_pdfrender_chain_subbuilders(env):
     assert pdfrender.outfilepath == outfilepath
 
 
+@pytest.mark.latex
 def test_pdfrender_simple(env):
     """Test a simple build with the PdfRender builder."""
     target_root = env.context['target_root']
@@ -8,22 +8,32 @@ from disseminate.builders.scalesvg import ScaleSvg
 from disseminate.paths import SourcePath, TargetPath
 
 
-def test_scalesvg_build_with_outfilepath(env, svg_dims):
-    """Test the ScaleSvg builder with the outfilepath specified."""
-
-    # 1. Test example with the infilepath and outfilepath specified.
+@pytest.fixture(scope='module')
+def pdf2svg_output(module_env, tmp_path_factory):
+    """The example svg converted by Pdf2svg, which is created once for the
+    tests in this module."""
     infilepath = SourcePath(project_root='tests/builders/examples/ex1',
                             subpath='sample.pdf')
-    outfilepath = TargetPath(target_root=env.context['target_root'],
+    outfilepath = TargetPath(target_root=tmp_path_factory.mktemp('pdf2svg'),
                              subpath='sample.svg')
-    pdf2svg = Pdf2svg(parameters=infilepath, env=env)
+    pdf2svg = Pdf2svg(parameters=infilepath, outfilepath=outfilepath,
+                      env=module_env)
 
     # Create the example svg
     assert pdf2svg.build(complete=True) == 'done'
+    return pdf2svg.outfilepath
+
+
+@pytest.mark.svg
+def test_scalesvg_build_with_outfilepath(env, svg_dims, pdf2svg_output):
+    """Test the ScaleSvg builder with the outfilepath specified."""
+
+    # 1. Test example with the infilepath and outfilepath specified.
+    outfilepath = TargetPath(target_root=env.context['target_root'],
+                             subpath='sample.svg')
 
     # Create the Scalesvg
-    infilepath2 = pdf2svg.outfilepath
-    scalesvg = ScaleSvg(parameters=[infilepath2, ('scale', 2)],
+    scalesvg = ScaleSvg(parameters=[pdf2svg_output, ('scale', 2)],
                         outfilepath=outfilepath, env=env)
 
     # Make sure scalesvg is available
@@ -43,22 +53,14 @@ def test_scalesvg_build_with_outfilepath(env, svg_dims):
     assert svg_dims(outfilepath, width='164', height='146', abs=0.3)
 
 
-def test_scalesvg_build_without_outfilepath(env):
+@pytest.mark.svg
+def test_scalesvg_build_without_outfilepath(env, pdf2svg_output):
     """Test the ScaleSvg builder without the outfilepath specified."""
 
     # 2. Test an example without an outfilepath specified. The use_cache is
     #    False so the outfilepath will be stored in the target_root
-    infilepath = SourcePath(project_root='tests/builders/examples/ex1',
-                            subpath='sample.pdf')
-    pdf2svg = Pdf2svg(parameters=infilepath, env=env)
-
-    # Create the example svg
-    assert pdf2svg.build(complete=True) == 'done'
-
-    # Create the Scalesvg
-    infilepath2 = pdf2svg.outfilepath
     outfilepath = env.target_root / 'media' / 'sample_scale.svg'
-    scalesvg = ScaleSvg(parameters=[infilepath2, ('scale', 2)], env=env)
+    scalesvg = ScaleSvg(parameters=[pdf2svg_output, ('scale', 2)], env=env)
 
     assert scalesvg.status == "ready"
     assert not outfilepath.exists()
@@ -69,8 +71,8 @@ def test_scalesvg_build_without_outfilepath(env):
 
     # 3. Test an example with an invalid scale value
     with pytest.raises(ValueError):  # no scale provided
-        scalesvg = ScaleSvg(parameters=pdf2svg.outfilepath, env=env)
+        scalesvg = ScaleSvg(parameters=pdf2svg_output, env=env)
 
     with pytest.raises(ValueError):  # wrong type specified
-        scalesvg = ScaleSvg(parameters=[pdf2svg.outfilepath, ('scale', 'a')],
+        scalesvg = ScaleSvg(parameters=[pdf2svg_output, ('scale', 'a')],
                             env=env)
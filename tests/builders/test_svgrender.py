@@ -3,6 +3,8 @@ Tests for the SvgRender builder.
 """
 import pathlib
 
+import pytest
+
 from disseminate.builders.svgrender import SvgRender
 from disseminate.tags import Tag
 from disseminate.paths import TargetPath
@@ -246,6 +248,7 @@ def test_svgrender_chain_subbuilders(env):
     assert svgrender.outfilepath == outfilepath
 
 
+@pytest.mark.svg
 def test_svgrender_simple(env):
     """Test a simple build with the SvgRender builder."""
     target_root = env.context['target_root']
@@ -281,6 +284,7 @@ def test_svgrender_simple(env):
     assert svgrender.status == 'ready'
 
 
+@pytest.mark.svg
 def test_svgrender_simple_without_outfilepath(env):
     """Test a simple build with the SvgRender builder without an
     outfilepath."""
@@ -335,6 +339,7 @@ def test_svgrender_simple_without_outfilepath(env):
     assert svgrender.status == 'done'
 
 
+@pytest.mark.svg
 def test_svgrender_simple_without_outfilepath_scale_crop(env):
     """Test a simple build with the SvgRender builder without an outfilepath
     and with scale and crop options."""
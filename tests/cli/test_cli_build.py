@@ -13,10 +13,9 @@ ex1_root = Path('tests') / 'document' / 'examples' / 'ex1'
 ex1_subpath = Path('dummy.dm')
 
 
-def test_cli_build_simple_document(tmpdir):
+def test_cli_build_simple_document(tmp_path):
     """Test the CLI build subcommand with a simple document."""
     # Setup the CLI runner and paths
-    tmpdir = Path(tmpdir)
     runner = CliRunner()
 
     # 1. Use 'tests/document/example1' as an example. It contains a single
@@ -25,35 +24,35 @@ def test_cli_build_simple_document(tmpdir):
     #    answer keys.
     result = runner.invoke(main, ['build', '-i',
                                   str(ex1_root / ex1_subpath),
-                                  '-o', str(tmpdir)])
+                                  '-o', str(tmp_path)])
 
     # Make sure the command was successfully run
     assert result.exit_code == 0
 
     # Check the generated files.
-    target_html = tmpdir / 'html' / 'dummy.html'
+    target_html = tmp_path / 'html' / 'dummy.html'
     assert target_html.is_file()
     assert target_html.stat().st_size > 0
 
-    target_tex = tmpdir / 'tex' / 'dummy.tex'
+    target_tex = tmp_path / 'tex' / 'dummy.tex'
     assert target_tex.is_file()
     assert target_tex.stat().st_size > 0
 
 
-# def test_cli_render_multiple_docs(tmpdir):
+# def test_cli_render_multiple_docs(tmp_path):
 #     """Test the CLI render subcommand with multiple root documents"""
 #     runner = CliRunner()
 #     # 2. Trying to render multiple projects with one output directory raises
 #     #    an error
 #     result = runner.invoke(main, ['render', '-i',
 #                                   'tests/document',
-#                                   '-o', str(tmpdir)])
+#                                   '-o', str(tmp_path)])
 #
 #     # Make sure the command was successfully run
 #     assert result.exit_code == 2
 #
 #     # 3. Test the same example, without an output directory specified.
-#     tmpdir2 = tmpdir / 'test2'
+#     tmpdir2 = tmp_path / 'test2'
 #     tmpdir2.mkdir()
 #     project_root = tmpdir2 / 'src'
 #     project_root.mkdir()
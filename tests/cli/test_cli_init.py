@@ -1,24 +1,22 @@
 """
 Tests for the 'init' CLI subcommand
 """
-import pathlib
-
 from click.testing import CliRunner
 
 from disseminate.cli import main
 from disseminate.cli.init import is_empty
 
 
-def test_cli_is_empty(tmpdir):
+def test_cli_is_empty(tmp_path):
     """Test the is_empty function"""
     # Check an empty directory
-    assert is_empty(tmpdir)
+    assert is_empty(tmp_path)
 
     # Make the directory non-empty
-    test_file = pathlib.Path(tmpdir) / 'test'
+    test_file = tmp_path / 'test'
     test_file.touch()
 
-    assert not is_empty(tmpdir)
+    assert not is_empty(tmp_path)
     assert not is_empty(test_file)
 
 
@@ -70,28 +68,27 @@ def test_cli_init_missing():
             "'books/missing' could not be found") in result.output
 
 
-def test_cli_init_clone(tmpdir):
+def test_cli_init_clone(tmp_path):
     """Test the CLI init subcommand to clone a project starter."""
-    tmpdir = pathlib.Path(tmpdir)
     runner = CliRunner()
 
     # Clone the project starter
-    assert is_empty(tmpdir)
+    assert is_empty(tmp_path)
     result = runner.invoke(main, ['init', 'books/tufte/textbook1', '-o',
-                                  tmpdir])
+                                  tmp_path])
     assert result.exit_code == 0
 
     # Check the cloned directory
-    assert not is_empty(tmpdir)
-    assert (tmpdir / 'src' / 'textbook.dm').is_file()
+    assert not is_empty(tmp_path)
+    assert (tmp_path / 'src' / 'textbook.dm').is_file()
 
     # Try it again. A prompt should show up to ask whether to write to a
     # non-empty directory
     result = runner.invoke(main, ['init', 'books/tufte/textbook1', '-o',
-                                  tmpdir])
+                                  tmp_path])
     assert result.exit_code == 0
 
     # Strip newlines
     output = " ".join(result.output.splitlines())
-    assert all(i in output for i in ("The directory", str(tmpdir.name),
+    assert all(i in output for i in ("The directory", str(tmp_path.name),
                                      "is not empty"))
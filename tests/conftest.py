@@ -72,19 +72,39 @@ def mocktag_cls():
     return MockTag
 
 
+@pytest.fixture(scope='function')
+def mockdoc_cls():
+    """Returns a mock Document class with the paths of a document.
+
+    The mock document avoids loading a document, with its filesystem
+    operations and target builders, for tests that only need an object with
+    the document's paths.
+    """
+    class MockDocument(object):
+        __slots__ = ('src_filepath', 'project_root', 'target_root',
+                     'targets', '__weakref__')
+
+        def __init__(self, src_filepath=None, target_root=None,
+                     targets=None):
+            self.src_filepath = src_filepath or SourcePath()
+            self.project_root = self.src_filepath.project_root
+            self.target_root = target_root or TargetPath()
+            self.targets = targets or dict()
+
+    return MockDocument
+
+
 @pytest.fixture
 def env_cls():
     """The build environment class"""
     return Environment
 
 
-@pytest.fixture
-def env(tmpdir):
-    """A build environment"""
+def _create_env(tmp_path):
+    """Create a build environment in the given tmp_path"""
     # Setup the paths
-    tmpdir = pathlib.Path(tmpdir)
-    target_root = TargetPath(target_root=tmpdir)
-    src_filepath = SourcePath(project_root=tmpdir, subpath='test.dm')
+    target_root = TargetPath(target_root=tmp_path)
+    src_filepath = SourcePath(project_root=tmp_path, subpath='test.dm')
     src_filepath.write_text("""
     ---
     targets: html, xhtml, tex, pdf
@@ -100,6 +120,33 @@ def env(tmpdir):
     return env
 
 
+@pytest.fixture
+def env(tmp_path):
+    """A build environment"""
+    return _create_env(tmp_path)
+
+
+@pytest.fixture(scope='module')
+def module_env(tmp_path_factory):
+    """A build environment shared by the tests of a module.
+
+    This environment should only be used by tests that do not write files.
+    Tests that modify the environment's context should reset the entries
+    they use.
+    """
+    return _create_env(tmp_path_factory.mktemp('module_env'))
+
+
+@pytest.fixture(scope='module')
+def module_context(module_env):
+    """The context of a test document shared by the tests of a module.
+
+    Like the module_env, this context should only be used by tests that do
+    not modify the context or write files.
+    """
+    return module_env.root_document.context
+
+
 @pytest.fixture(scope='function')
 def doc(env):
     """Returns a test document"""
@@ -151,15 +198,14 @@ def context_cls():
 
 
 @pytest.fixture
-def load_example(env_cls, tmpdir):
+def load_example(env_cls, tmp_path):
     """Return a function that returns a document from an example path"""
     # Setup the paths
-    tmpdir = pathlib.Path(tmpdir)
-    target_root = TargetPath(target_root=tmpdir)
+    target_root = TargetPath(target_root=tmp_path)
 
     def _load_example(example_path, cp_src=False):
         if cp_src:
-            src_dir = tmpdir / 'src'
+            src_dir = tmp_path / 'src'
             src_dir.mkdir()
             shutil.copy(example_path, src_dir)
             example_path = src_dir / example_path.name
@@ -169,6 +215,37 @@ def load_example(env_cls, tmpdir):
     return _load_example
 
 
+@pytest.fixture(scope='session')
+def built_example(tmp_path_factory):
+    """Return a function that returns a document from an example path that
+    has been built for all of its targets.
+
+    Each example is copied and built once per session. The returned
+    documents are shared between tests, so these should only be used by
+    tests that read the built targets.
+    """
+    cache = dict()
+
+    def _built_example(example_path):
+        example_path = pathlib.Path(example_path)
+        if example_path not in cache:
+            tmp_path = tmp_path_factory.mktemp('built_example')
+            src_dir = tmp_path / 'src'
+            src_dir.mkdir()
+            shutil.copy(example_path, src_dir)
+
+            target_root = TargetPath(target_root=tmp_path)
+            env = Environment(src_dir / example_path.name,
+                              target_root=target_root)
+            doc = env.root_document
+            doc.build()
+
+            # Keep a reference to the environment with the document
+            cache[example_path] = (env, doc)
+        return cache[example_path][1]
+    return _built_example
+
+
 @pytest.fixture
 def url_request(monkeypatch):
     """Mock requests to url.requests so that responses inserted in the
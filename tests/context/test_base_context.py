@@ -40,6 +40,24 @@ def test_base_context_dict():
     assert context['g'] == 2
 
 
+def test_base_context_initial_values():
+    """Test the initial values of the base context class."""
+
+    # 1. Initial values from positional arguments and keyword arguments
+    parent = dict(a=1)
+    context = BaseContext({'b': 2}, c=3, parent_context=parent)
+    assert context.initial_values == {'b': 2, 'c': 3}
+    assert context.parent_context is parent
+
+    # 2. The parent context and protected keys are not initial values, even
+    #    when these are specified as positional arguments
+    context = BaseContext({'b': 2, 'parent_context': parent,
+                           '_initial_values': dict()})
+    assert context.initial_values == {'b': 2}
+    assert context.parent_context is parent
+    assert context == {'a': 1, 'b': 2}
+
+
 def test_base_context_inheritance(context_cls):
     """Test the BaseContext inheritance with the parent dict."""
 
@@ -44,3 +44,10 @@ def test_load_from_string():
     assert context == {'name': 'Justin L Lorieau',
                        'contact': ('  address: 1,2,3 lane\n'
                                    '  phone: 333-333-4123.')}
+
+    # 2. The parsed header is cached, and the returned dicts are copies
+    context['name'] = 'Other name'
+    rest, context2 = load_from_string(test)
+
+    assert context2 is not context
+    assert context2['name'] == 'Justin L Lorieau'
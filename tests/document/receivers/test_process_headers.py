@@ -3,7 +3,7 @@ Test the process_header processors.
 """
 from disseminate.document.receivers.process_headers import process_headers, \
     find_template_paths, find_jinja2_parent_templates, \
-    find_additional_context_filepaths
+    find_additional_context_filepaths, find_template_context_paths
 from disseminate import settings
 
 
@@ -57,6 +57,23 @@ def test_find_additional_context_filepaths():
             settings.module_template_paths[0] / 'default' / 'context.txt')
 
 
+def test_find_template_context_paths():
+    """Test the find_template_context_paths helper function."""
+    template_root = settings.module_template_paths[0]
+
+    template_paths, context_paths = find_template_context_paths('books/tufte')
+    assert template_paths == (template_root / 'books' / 'tufte',
+                              template_root / 'default')
+    assert context_paths == (template_root / 'default' / 'context.txt',
+                             template_root / 'books' / 'tufte' /
+                             'context.txt')
+
+    # The paths are cached
+    paths = find_template_context_paths('books/tufte')
+    assert paths == (template_paths, context_paths)
+    assert find_template_context_paths.cache_info().hits > 0
+
+
 # The process_header receiver
 
 def test_process_context_header_basic(context_cls):
@@ -199,6 +199,12 @@ def test_document_target_filepath(load_example):
     assert (subdoc.target_filepath('.html').subpath ==
             Path("sub2") / "index.html")
 
+    # 4. The target filepaths follow changes to the target builders'
+    #    outfilepaths
+    builder = doc.context['builders']['.html']
+    builder.outfilepath = target_root / 'html' / 'other.html'
+    assert doc.target_filepath('.html') == target_root / 'html' / 'other.html'
+
     subdoc = list(subdoc.subdocuments.values())[0]
     assert isinstance(subdoc.target_root, TargetPath)
     assert subdoc.target_root == target_root
@@ -439,12 +445,12 @@ def test_document_load_on_render(doc):
     assert doc.targets.keys() == {'.html', '.tex'}
 
 
-def test_document_recursion(env_cls, tmpdir):
+def test_document_recursion(env_cls, tmp_path):
     """Test the loading of a document with itself as the subdocument
     (recursion)."""
 
     # 1. Create a test document that references itself
-    src_filepath1 = SourcePath(project_root=tmpdir, subpath='test1.dm')
+    src_filepath1 = SourcePath(project_root=tmp_path, subpath='test1.dm')
 
     src_filepath1.write_text("""
     ---
@@ -453,15 +459,15 @@ def test_document_recursion(env_cls, tmpdir):
     @chapter{one}
     """)
 
-    env = env_cls(src_filepath1, target_root=tmpdir)
+    env = env_cls(src_filepath1, target_root=tmp_path)
     doc = env.root_document
 
     # The document should not have itself as a subdocument
     assert len(doc.subdocuments) == 0
 
     # 2. Create 2 test documents that reference each other
-    src_filepath1 = SourcePath(project_root=tmpdir, subpath='test-a.dm')
-    src_filepath2 = SourcePath(project_root=tmpdir, subpath='test-b.dm')
+    src_filepath1 = SourcePath(project_root=tmp_path, subpath='test-a.dm')
+    src_filepath2 = SourcePath(project_root=tmp_path, subpath='test-b.dm')
 
     src_filepath1.write_text("""
     ---
@@ -475,9 +481,9 @@ def test_document_recursion(env_cls, tmpdir):
     ---
     @chapter{one}
     """)
-    env1 = env_cls(src_filepath1, target_root=tmpdir)
+    env1 = env_cls(src_filepath1, target_root=tmp_path)
     doc1 = env1.root_document
-    env2 = env_cls(src_filepath2, target_root=tmpdir)
+    env2 = env_cls(src_filepath2, target_root=tmp_path)
     doc2 = env2.root_document
 
     # The document should not have itself as a subdocument, but it can have
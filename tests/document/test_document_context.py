@@ -15,14 +15,8 @@ ex7_root = Path("tests") / "document" / "examples" / "ex7" / "src"
 ex7_subpath = Path("file1.dm")
 
 
-# A DummyDocument class
-class DummyDocument(object):
-    src_filepath = SourcePath()
-    project_root = SourcePath()
-    target_root = TargetPath()
-
-
-def test_document_context_basic_inheritence(context_cls, tmpdir):
+def test_document_context_basic_inheritence(context_cls, mockdoc_cls,
+                                            tmp_path):
     """Test the proper inheritence of the document context."""
     class Mock(object):
         """Mock object without a 'copy' method."""
@@ -34,12 +28,12 @@ def test_document_context_basic_inheritence(context_cls, tmpdir):
                       'src_filepath': SourcePath('tests/document/example1',
                                                  'dummy.dm'),
                       'project_root': SourcePath('tests/document/example1'),
-                      'target_root': TargetPath(tmpdir),
+                      'target_root': TargetPath(tmp_path),
                       'label_manager': Mock(),
                       }
     parent_context = context_cls(**parent_context)
 
-    doc = DummyDocument()
+    doc = mockdoc_cls()
     context = DocumentContext(document=doc, parent_context=parent_context,
                               doc_id='dummy.dm', mtime=1)
 
@@ -313,6 +307,13 @@ def test_document_context_reset(doc):
     doc.load()
     assert doc.context['template'] == 'articles/basic'
 
+    # Reset the context with an mtime that was already retrieved
+    doc.context.reset(src_mtime=1.0)
+    assert doc.context['mtime'] == 1.0
+    doc.context.reset()
+    assert doc.context['mtime'] == doc.src_filepath.stat().st_mtime
+    doc.load(reload=True)
+
     all_keys = doc.context.keys() | context_article.keys()
     assert id(doc.context) != id(context_article)  # different context objs
     assert doc.context.keys() == all_keys  # keys match
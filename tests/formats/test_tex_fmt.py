@@ -50,6 +50,20 @@ def test_tex_environment(attributes_cls):
                          formatted_content='\\item 1')
     assert return_str == key
 
+    # 3. Test environments with contents that have leading or trailing
+    #    newlines, or that are empty
+    key = ('\n'
+           '\\begin{enumerate}\n'
+           '\\item 1\n'
+           '\\end{enumerate}\n')
+    assert tex_env('enumerate', '', formatted_content='\n\\item 1') == key
+    assert tex_env('enumerate', '', formatted_content='\\item 1\n') == key
+
+    key = ('\n'
+           '\\begin{enumerate}\n'
+           '\\end{enumerate}\n')
+    assert tex_env('enumerate', '', formatted_content='') == key
+
 
 def test_tex_command(attributes_cls):
     """Tests the formatting of tex commands."""
@@ -102,6 +116,12 @@ def test_tex_command(attributes_cls):
     assert (tex_cmd('setcounter', attributes_cls('counter 3')) ==
             '\\setcounter{counter}{3}')
 
+    # 7. Try empty attributes. Required arguments are still needed
+    assert tex_cmd('textbf', None, 'bold') == '\\textbf{bold}'
+    assert tex_cmd('textbf', attributes_cls(), 'bold') == '\\textbf{bold}'
+    with pytest.raises(TexFormatError):
+        tex_cmd('setcounter')
+
 
 def test_tag_verb():
     """Test the tag_verb function"""
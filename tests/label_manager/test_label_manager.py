@@ -95,6 +95,13 @@ def test_label_manager_get_label(doctree):
         with pytest.raises(LabelNotFound):
             label_man.get_label(id)
 
+    # Labels without a doc_id are found after the labels are changed
+    label_man.reset(doc_ids='test.dm')
+    assert label_man.get_label('fig:one') == label3
+    label4 = label_man.add_content_label(id='fig:three', kind='figures',
+                                         title='third fig', context=context)
+    assert label_man.get_label('fig:three') == label4
+
 
 def test_label_manager_get_labels_by_id(doctree):
     """Test the get_labels_by_id method."""
@@ -259,3 +266,26 @@ def test_label_manager_doc_updates(doc, wait):
     assert new_label.doc_id == 'test.dm'
     assert new_label.id == 'fig:one'
     assert new_label.title == 'figure one'
+
+
+def test_label_manager_reload(doctree, monkeypatch):
+    """Test that reloading documents reuses the label manager."""
+    import disseminate.label_manager.receivers as receivers
+
+    label_man = doctree.context['label_manager']
+
+    # Count new label managers
+    created = []
+
+    class CountLabelManager(LabelManager):
+        def __init__(self, *args, **kwargs):
+            created.append(self)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(receivers, 'LabelManager', CountLabelManager)
+
+    # Reload the documents
+    for doc in doctree.documents_list(recursive=True):
+        doc.load(reload=True)
+        assert doc.context['label_manager'] is label_man
+    assert len(created) == 0
@@ -39,7 +39,7 @@ def test_find_files_example1(doc):
     assert len(filepaths) == 0
 
 
-def test_find_files_example2(doc_cls, env, tmpdir):
+def test_find_files_example2(doc_cls, env):
     """Test the find_files function with the find_files_example2"""
     # tests/paths/find_files_example2/
     # └── src
@@ -41,9 +41,9 @@ def test_path_immutability():
     assert a == (1, src_path, 3)
 
 
-def test_path_filesystem(tmpdir):
+def test_path_filesystem(tmp_path):
     """Tests the filesystem behavior of the new path objects."""
-    src_path = SourcePath(tmpdir.join('src'), 'main.dm')
+    src_path = SourcePath(tmp_path / 'src', 'main.dm')
 
     # Create missing sub-directories
     subdir = src_path.parent
@@ -0,0 +1,80 @@
+"""
+Test the processing of tag contents
+"""
+import pytest
+
+from disseminate.tags import Tag, TagError
+from disseminate.tags.receivers.content import (tokenize_tags,
+                                                tokenize_tags_cached,
+                                                find_closing_brace)
+
+
+def test_tokenize_tags():
+    """Test the tokenize_tags function."""
+
+    # 1. Test strings without tags
+    assert tokenize_tags('') == ()
+    assert tokenize_tags('my text') == ('my text',)
+
+    # 2. Test nested tags and tags with attributes. The contents of tags are
+    #    not tokenized
+    tokens = tokenize_tags("My @b{bold @i{and} italic} text @img[width=2]{a}")
+    assert tokens == ('My ', ('b', None, 'bold @i{and} italic'), ' text ',
+                      ('img', '[width=2]', 'a'))
+
+    # 3. Test tags with nested braces
+    tokens = tokenize_tags("@eq{\\frac{1}{2}} and @b{{x}}{y}")
+    assert tokens == (('eq', None, '\\frac{1}{2}'), ' and ',
+                      ('b', None, '{x}'), '{y}')
+
+    # 4. Test a tag that isn't closed
+    with pytest.raises(TagError):
+        tokenize_tags("My @b{bold")
+    with pytest.raises(TagError):
+        tokenize_tags("My @b{bold {text}")
+
+    # 5. Test empty tags and tags without content
+    tokens = tokenize_tags("@b{} @i{x{}} @br")
+    assert tokens == (('b', None, ''), ' ', ('i', None, 'x{}'), ' ',
+                      ('br', None, ''))
+
+
+def test_find_closing_brace():
+    """Test the find_closing_brace function."""
+
+    # 1. Test unnested and nested braces
+    assert find_closing_brace("@b{bold}", 3) == 8
+    assert find_closing_brace("@b{a {b {c}} d} e", 3) == 15
+
+    # 2. Test braces that aren't closed
+    assert find_closing_brace("@b{bold", 3) == -1
+    assert find_closing_brace("@b{bold {a}", 3) == -1
+
+    # 3. Test the maximum level of nested braces
+    assert find_closing_brace("{{{}}}}", 0, max_level=5) == 7
+    assert find_closing_brace("{{{}}}}", 0, max_level=4) == -1
+
+
+def test_tokenize_tags_cached(context):
+    """Test that cached tokens still create new tags."""
+    tokenize_tags_cached.cache_clear()
+
+    text = "My @b{bold} text"
+    tag1 = Tag(name='root', content=text, attributes='', context=context)
+    tag2 = Tag(name='root', content=text, attributes='', context=context)
+
+    assert tokenize_tags_cached.cache_info().hits > 0
+    assert tag1.content[1] is not tag2.content[1]
+    assert tag1.content[1].name == tag2.content[1].name == 'b'
+    assert tag1.content[1].content == tag2.content[1].content == 'bold'
+
+
+def test_parse_tags_without_tags(context):
+    """Test that strings without tags aren't tokenized."""
+    tokenize_tags_cached.cache_clear()
+
+    text = "My text without tags"
+    tag = Tag(name='root', content=text, attributes='', context=context)
+
+    assert tag.content == text
+    assert tokenize_tags_cached.cache_info().currsize == 0
@@ -3,6 +3,8 @@ Test the processing of hashes in tags
 """
 
 from disseminate.tags import Tag
+from disseminate.tags.receivers.hash import hashtxt_cached
+from disseminate import settings
 
 
 test = """
@@ -33,3 +35,25 @@ def test_process_hash(context):
 
     body = Tag(name='body', content=test + 'a', attributes='', context=context)
     assert body.hash == '25a686d9f0'
+
+
+def test_process_hash_cached(context):
+    """Test that the hashes of tag contents are cached."""
+    hashtxt_cached.cache_clear()
+
+    # Tags with the same contents have the same hash, and the hash is only
+    # calculated once
+    tag1 = Tag(name='b', content='bolded', attributes='', context=context)
+    tag2 = Tag(name='i', content='bolded', attributes='', context=context)
+    assert tag1.hash == tag2.hash
+    assert hashtxt_cached.cache_info().hits > 0
+
+
+def test_process_hash_cached_algorithm(context, monkeypatch):
+    """Test that the cached hashes of tag contents follow the hash
+    algorithm setting."""
+    tag1 = Tag(name='b', content='bolded', attributes='', context=context)
+
+    monkeypatch.setattr(settings, 'hash_algo', 'sha1')
+    tag2 = Tag(name='b', content='bolded', attributes='', context=context)
+    assert tag1.hash != tag2.hash
@@ -1,6 +1,8 @@
 """
 Test the proces_paragraphs function.
 """
+import sys
+
 from disseminate.tags.receivers.paragraphs import (
     group_paragraphs, clean_paragraphs, assign_paragraph_roles,
     process_paragraph_tags)
@@ -52,7 +54,7 @@ def test_group_paragraphs():
     assert group == [[1, 2, 'three', 'four'], ['five', 6, 'seven'], ['eight']]
 
     # Running it again will not change the result
-    group = group_paragraphs(group)
+    assert group_paragraphs(group) is group
     assert group == [[1, 2, 'three', 'four'], ['five', 6, 'seven'], ['eight']]
 
     # 2. Test a basic string with newlines
@@ -67,6 +69,21 @@ def test_group_paragraphs():
     assert group == [[1, 2, 'three', 'four'], ['five', 6], ['seven'],
                      ['eight']]
 
+    # Paragraphs with only spaces are not included
+    group = group_paragraphs(['one\n\n', '  ', '\n\ntwo'])
+    assert group == [['one'], ['two']]
+
+    # Empty paragraph sublists from a previous grouping are not included
+    group = group_paragraphs(['\t', '\n \n', [], ''])
+    assert group == []
+
+    group = group_paragraphs(['a\n\nb c', [], 6, ''])
+    assert group == [['a'], ['b c'], [6]]
+
+    group = [['a'], ['\n\n'], [], ['b']]
+    assert group_paragraphs(group) is group
+    assert group == [['a'], ['b']]
+
     # 3. Test string objects with 'include_paragraphs' attributes
     class AltInt(int):
         include_paragraphs = True
@@ -92,6 +109,39 @@ def test_group_paragraphs():
                      ['eight']]
 
 
+def test_group_paragraphs_interned():
+    """Test that group_paragraphs interns short strings."""
+    short = ''.join(['\n', ' ' * 4])
+    long = 'long ' * 10
+
+    group = group_paragraphs(['one' + short + '\n\n' + long])
+    assert group == [['one'], [long]]
+    assert group[0][0] is sys.intern('one')
+    assert group[1][0] is not sys.intern(long)
+
+    # String subclasses cannot be interned, and these are kept as is
+    class AltStr(str):
+        pass
+
+    item = AltStr('one')
+    group = group_paragraphs([item, AltStr('two\n\nthree')])
+    assert group == [['one', 'two'], ['three']]
+    assert group[0][0] is item
+
+
+def test_group_paragraphs_unchanged_strings():
+    """Test that group_paragraphs does not copy or join strings without
+    paragraph breaks."""
+    first = "This is my first paragraph. It has a multiple\nlines."
+    second = " It continues after a tag with multiple\n\tlines."
+    item = object()
+
+    group = group_paragraphs([first, item, second, 'third\n\nfourth'])
+    assert group == [[first, item, second, 'third'], ['fourth']]
+    assert group[0][0] is first
+    assert group[0][2] is second
+
+
 def test_group_paragraphs_with_tags(doc):
     """Test the group_paragraphs function with a tag."""
 
@@ -8,55 +8,85 @@ from disseminate.formats import TexFormatError
 from disseminate.tags.eqs import Eq
 
 
-def test_inline_equation(context):
+@pytest.fixture
+def paragraphs_context(module_context, monkeypatch):
+    """The module context with paragraphs processed for 'root' tags.
+
+    The 'process_paragraphs' entry of the shared context is restored after
+    each test.
+    """
+    monkeypatch.setitem(module_context, 'process_paragraphs', ['root'])
+    return module_context
+
+
+def test_inline_equation(module_context):
     """Test the tex rendering of simple inline equations."""
 
     # Example 1 - simple inline equation
-    eq1 = Eq(name='eq', content='y=x', attributes='', context=context)
+    eq1 = Eq(name='eq', content='y=x', attributes='', context=module_context)
     assert eq1.tex == "\\ensuremath{y=x}"
 
     # Example 2 - nested inline equation with subtag as content
-    eq2 = Eq(name='eq', content=eq1, attributes='', context=context)
+    eq2 = Eq(name='eq', content=eq1, attributes='', context=module_context)
     assert eq2.tex == "\\ensuremath{y=x}"
 
     # Example 3 - nested inline equation with subtag as list
     eq3 = Eq(name='eq', content=['test is my ', eq2], attributes='',
-             context=context)
+             context=module_context)
     assert eq3.tex == "\\ensuremath{test is my y=x}"
 
     # Example 4 - a bold equation
-    eq4 = Eq(name='eq', content="y=x", attributes='bold', context=context)
+    eq4 = Eq(name='eq', content="y=x", attributes='bold',
+             context=module_context)
     assert eq4.tex == "\\ensuremath{\\boldsymbol{y=x}}"
 
     # Example 5 - an equation with a bold equation subtag
-    eq5 = Eq(name='eq', content=eq4, attributes='', context=context)
+    eq5 = Eq(name='eq', content=eq4, attributes='', context=module_context)
     assert eq5.tex == "\\ensuremath{\\boldsymbol{y=x}}"
 
     # Example 6 - an equation with a  bold equation subtag in a list
     eq6 = Eq(name='eq', content=['this is my ', eq4], attributes='',
-             context=context)
+             context=module_context)
     assert eq6.tex == "\\ensuremath{this is my \\boldsymbol{y=x}}"
 
     # Example 7 - a bold equation with an equation subtag in a list
     eq7 = Eq(name='eq', content=['this is my ', eq1], attributes='bold',
-             context=context)
+             context=module_context)
     assert eq7.tex == "\\ensuremath{\\boldsymbol{this is my y=x}}"
 
 
-def test_equation_typography(context):
+def test_inline_equation_tex_cached(module_context):
+    """Test the cached tex of equations."""
+    eq = Eq(name='eq', content='y=x', attributes='', context=module_context)
+    assert eq.tex == "\\ensuremath{y=x}"
+    assert eq.tex is eq.tex
+
+    # Changing the content, attributes or block_equation formats the tex again
+    eq.content = 'y=2x'
+    assert eq.tex == "\\ensuremath{y=2x}"
+
+    eq.attributes['bold'] = None
+    assert eq.tex == "\\ensuremath{\\boldsymbol{y=2x}}"
+
+    eq.block_equation = True
+    assert eq.tex.startswith("\\begin{align*}")
+    assert eq.tex == eq.tex_fmt()
+
+
+def test_equation_typography(module_context):
     """Test the tex rendering of equations with text typography (i.e. it
     shouldn't be replaced)."""
 
     # Example 1 - simple equation
-    eq1 = Eq(name='eq', content='y---x', attributes='', context=context)
+    eq1 = Eq(name='eq', content='y---x', attributes='', context=module_context)
     assert eq1.tex == "\\ensuremath{y---x}"
 
 
-def test_block_equation(context):
+def test_block_equation(module_context):
     """Test the tex rendering of a simple block equations."""
 
     # 1. simple block equation
-    eq1 = Eq(name='eq', content='y=x', attributes='', context=context,
+    eq1 = Eq(name='eq', content='y=x', attributes='', context=module_context,
              block_equation=True)
 
     assert eq1.tex == '\\begin{align*} %\ny=x\n\\end{align*}'
@@ -65,24 +95,23 @@ def test_block_equation(context):
     #    requires an integer parameter for the number of columns, so this
     #    show raise a TagError
     eq2 = Eq(name='eq', content='y=x', attributes='env=alignat*',
-             context=context, block_equation=True)
+             context=module_context, block_equation=True)
     with pytest.raises(TexFormatError):
         eq2.tex
 
     # 3. simple block equation with alternative environment and
     #    positional arguments
     eq3 = Eq(name='eq', content='y=x', attributes='env=alignat* 3',
-             context=context, block_equation=True)
+             context=module_context, block_equation=True)
     assert eq3.tex == '\\begin{alignat*}{3} %\ny=x\n\\end{alignat*}'
 
 
-def test_block_equation_paragraph(context):
+def test_block_equation_paragraph(paragraphs_context):
     """Test the tex rendering of a simple block equations that are identified
     from paragraphs."""
+    context = paragraphs_context
 
     # 1. a simple block equation.
-    context['process_paragraphs'] = ['root']  # process paragraphs for 'root'
-
     test1 = "\n\n@eq{y=x}\n\n"
     root = Tag(name='root', content=test1, attributes='', context=context)
 
@@ -110,7 +139,6 @@ def test_block_equation_paragraph(context):
                         '\\end{align*}')
 
     # 3. a simple inline equation
-    context['process_paragraphs'] = ['root']  # process paragraphs for 'root'
     test2 = "@eq{y=x}"
     root = Tag(name='root', content=test2, attributes='', context=context)
     eq = root.content
@@ -121,18 +149,20 @@ def test_block_equation_paragraph(context):
 
 # tex targets
 
-def test_simple_inline_equation_tex(context):
+def test_simple_inline_equation_tex(module_context):
     """Test the rendering of simple inline equations for tex."""
 
     # Setup the equation tag
-    eq = Eq(name='eq', content='y = x', attributes=tuple(), context=context)
+    eq = Eq(name='eq', content='y = x', attributes=tuple(),
+            context=module_context)
 
     assert eq.tex == "\\ensuremath{y = x}"
 
 
-def test_block_equation_tex(context):
+def test_block_equation_tex(paragraphs_context):
     """Test the rendering of block equations for tex to ensure that the tex
     text is well-formed."""
+    context = paragraphs_context
 
     # 1. A basic block equation
     test = """
@@ -141,7 +171,6 @@ def test_block_equation_tex(context):
     &= x + a
     }
     """
-    context['process_paragraphs'] = ['root']  # process paragraphs for 'root'
     root = Tag(name='root', content=test, attributes='', context=context)
     p = root.content
 
@@ -158,7 +187,6 @@ def test_block_equation_tex(context):
     &= x + a
     }
     """
-    context['process_paragraphs'] = ['root']  # process paragraphs for 'root'
     root = Tag(name='root', content=test, attributes='', context=context)
     p = root.content
 
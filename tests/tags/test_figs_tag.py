@@ -6,6 +6,12 @@ import pytest
 from disseminate.tags import Tag
 from disseminate.formats.tex import TexFormatError
 
+#: Figures with an id specified in the figure tag and in the caption tag
+with_id_srcs = pytest.mark.parametrize('src', [
+    "@marginfig[id=fig-1]{@caption{This is my caption}}",
+    "@marginfig{@caption[id=fig-1]{This is my caption}}",
+], ids=['figure_id', 'caption_id'])
+
 
 # Tag tests
 
@@ -57,35 +63,26 @@ def test_figure_caption_no_id(doc, attributes_cls):
                                'It has multiple lines')
 
 
-def test_figure_caption_with_id(doc):
-    """Tests the parsing of captions in figure tags when an id is specified."""
-    label_man = doc.context['label_manager']
-
+@with_id_srcs
+def test_figure_caption_with_id(doc, src):
+    """Tests the parsing of captions in figure tags when an id is specified
+    in the figure tag or in the caption tag."""
     # Set the label format for the caption figure
     label_fmts = doc.context['label_fmts']
     label_fmts['caption_figure'] = "My Fig. @label.number. "
 
-    # Test two cases: one in which the id is in the figure tag, and one in
-    # which the id is in the caption tag
-    for src in ("@marginfig[id=fig-1]{@caption{This is my caption}}",
-                "@marginfig{@caption[id=fig-1]{This is my caption}}"):
-
-        # Reset label manager to prevent duplicate labels
-        label_man.reset()
-
-        # Generate a tag and compare the generated tex to the answer key
-        root = Tag(name='root', content=src, attributes='',
-                   context=doc.context)
-        fig = root.content
-        caption = fig.content
+    # Generate a tag and compare the generated tex to the answer key
+    root = Tag(name='root', content=src, attributes='', context=doc.context)
+    fig = root.content
+    caption = fig.content
 
-        assert fig.name == 'marginfig'
-        assert caption.name == 'caption'
-        assert caption.label_id == 'fig-1'
+    assert fig.name == 'marginfig'
+    assert caption.name == 'caption'
+    assert caption.label_id == 'fig-1'
 
-        # Check the formatted caption. In order to use the 'caption_figure'
-        # label format, a label must have been created in the label_manager
-        assert caption.default == 'My Fig. 1. This is my caption'
+    # Check the formatted caption. In order to use the 'caption_figure'
+    # label format, a label must have been created in the label_manager
+    assert caption.default == 'My Fig. 1. This is my caption'
 
 
 # tex tests
@@ -113,33 +110,23 @@ def test_marginfig_caption_no_id_tex(doc):
     assert fig.tex == key
 
 
-def test_marginfig_caption_with_id_tex(doc):
+@with_id_srcs
+def test_marginfig_caption_with_id_tex(doc, src):
     """Tests the tex generation of captions in figure tags when an id is
-    specified."""
-    label_man = doc.context['label_manager']
-
+    specified in the figure tag or in the caption tag."""
     # Set the label format for the caption figure
     label_fmts = doc.context['label_fmts']
     label_fmts['caption_figure'] = "My Fig. @label.number. "
 
-    # Test two cases: one in which the id is in the figure tag, and one in
-    # which the id is in the caption tag
-    srcs = ("@marginfig[id=fig-1]{@caption{This is my caption}}",
-            "@marginfig{@caption[id=fig-1]{This is my caption}}")
-    for count, src in enumerate(srcs):
-        # Reset the labels to avoid creating a duplicate label
-        label_man.reset()
-
-        # Generate a tag and compare the generated tex to the answer key
-        root = Tag(name='root', content=src, attributes='',
-                   context=doc.context)
-        fig = root.content
+    # Generate a tag and compare the generated tex to the answer key
+    root = Tag(name='root', content=src, attributes='', context=doc.context)
+    fig = root.content
 
-        assert fig.tex == ('\n'
-                           '\\begin{marginfigure}\n'
-                           '\\caption{My Fig. 1. This is my caption} '
-                           '\\label{fig-1}\n'
-                           '\\end{marginfigure}\n')
+    assert fig.tex == ('\n'
+                       '\\begin{marginfigure}\n'
+                       '\\caption{My Fig. 1. This is my caption} '
+                       '\\label{fig-1}\n'
+                       '\\end{marginfigure}\n')
 
 
 def test_figure_tex(doc):
@@ -238,35 +225,24 @@ def test_marginfig_caption_no_id_html(doc):
     assert marginfig.html == key
 
 
-def test_marginfig_caption_with_id_html(doc):
+@with_id_srcs
+def test_marginfig_caption_with_id_html(doc, src):
     """Tests the html generation of captions in figure tags when an id is
-    specified."""
-    label_man = doc.context['label_manager']
-
+    specified in the figure tag or in the caption tag."""
     # Set the label format for the caption figure
     label_fmts = doc.context['label_fmts']
     label_fmts['caption_figure'] = "My Fig. @label.number. "
 
-    # Test two cases: one in which the id is in the figure tag, and one in
-    # which the id is in the caption tag
-    srcs = ("@marginfig[id=fig-1]{@caption{This is my caption}}",
-            "@marginfig{@caption[id=fig-1]{This is my caption}}")
+    # Generate a tag and compare the generated html to the answer key
+    root = Tag(name='root', content=src, attributes='', context=doc.context)
+    fig = root.content
 
     key = ('<figure class="marginfig">'
            '<figcaption id="fig-1" class="caption">'
            '<span class="label">My Fig. 1. </span>'
            'This is my caption</figcaption>'
            '</figure>\n')
-
-    for count, src in enumerate(srcs):
-        # Reset the label manager to avoid duplicate labels
-        label_man.reset()
-
-        # Generate a tag and compare the generated tex to the answer key
-        root = Tag(name='root', content=src, attributes='',
-                   context=doc.context)
-        fig = root.content
-        assert fig.html == key
+    assert fig.html == key
 
 
 def test_figure_html(doc):
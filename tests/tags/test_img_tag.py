@@ -46,6 +46,46 @@ def test_img_attribute(load_example):
     assert img.attributes == {'width': '100'}
 
 
+def test_img_add_file_cache(load_example):
+    """Test the caching of outfilepaths by the @img tag's add_file method."""
+    doc = load_example('tests/tags/examples/img_ex1/test.dm')
+    context = doc.context
+
+    src = "@img[width.tex=50%]{sample.pdf}"
+    root = Tag(name='root', content=src, attributes='', context=context)
+    img = root.content
+
+    # 1. The cache is only created when a file is first added. Repeated calls
+    #    with the same arguments return the cached outfilepath
+    assert img._outfilepaths is None
+    outfilepath = img.add_file(target='.tex')
+    assert len(img._outfilepaths) == 1
+    assert img.add_file(target='.tex') is outfilepath
+    assert img.add_file(target='.tex', content='sample.pdf',
+                        attributes=img.attributes) is outfilepath
+    assert len(img._outfilepaths) == 1
+
+    # 2. Different attributes for the target are cached separately
+    attrs = img.attributes.copy()
+    attrs['width.tex'] = '25%'
+    img.add_file(target='.tex', attributes=attrs)
+    assert len(img._outfilepaths) == 2
+
+    # 3. Attributes for other targets don't change the cache entry
+    attrs = img.attributes.copy()
+    attrs['width.html'] = '25%'
+    assert img.add_file(target='.tex', attributes=attrs) is outfilepath
+    assert len(img._outfilepaths) == 2
+
+    # 4. The target-specific attributes are filtered again when the
+    #    attributes are changed
+    attrs['width.tex'] = '25%'
+    img.add_file(target='.tex', attributes=attrs)
+    assert len(img._outfilepaths) == 2
+    attrs['width.tex'] = '50%'
+    assert img.add_file(target='.tex', attributes=attrs) is outfilepath
+
+
 # tex targets
 
 def test_img_tex(load_example, is_pdf):
@@ -72,8 +112,8 @@ def test_img_tex(load_example, is_pdf):
 
     assert img.tex == "\\includegraphics{{{}}}".format(filepath)
 
-    # Build the file
-    assert env.build() == 'done'
+    # Build the file. Only the tex target builder is needed for the image.
+    assert context['builders']['.tex'].build(complete=True) == 'done'
     assert img_filepath.exists()
 
     # 2. Test attributes
@@ -124,13 +164,13 @@ def test_img_html(load_example):
     img = root.content
     assert img.html == '<img src="media/sample.svg" class="w100">\n'
 
-    # Check the build
-    env = doc.context['environment']
+    # Check the build. Only the html target builder is needed for the image.
+    builder = context['builders']['.html']
     img_filepath = TargetPath(target_root=doc.target_root, target='html',
                               subpath="media/sample.svg")
     assert not img_filepath.exists()
 
-    assert env.build() == 'done'
+    assert builder.build(complete=True) == 'done'
     assert img_filepath.exists()
     assert '<svg' in img_filepath.read_text()
 
@@ -162,12 +202,12 @@ def test_img_xhtml(load_example, is_xml, is_svg):
     assert img.xhtml == '<img src="media/sample.svg" class="w100"/>\n'
     assert is_xml(img.xhtml)
 
-    # Check the build
-    env = doc.context['environment']
+    # Check the build. Only the xhtml target builder is needed for the image.
+    builder = context['builders']['.xhtml']
     img_filepath = TargetPath(target_root=doc.target_root, target='xhtml',
                               subpath="media/sample.svg")
     assert not img_filepath.exists()
 
-    assert env.build() == 'done'
+    assert builder.build(complete=True) == 'done'
     assert img_filepath.exists()
     assert is_svg(img_filepath)
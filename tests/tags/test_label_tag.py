@@ -189,6 +189,29 @@ def test_labeltag_html(context, mocktag_cls):
     assert labeltag2.html == '<span class="label">Chapter 1 </span>\n'
 
 
+def test_labeltag_processed_tag(context, mocktag_cls):
+    """Test that the LabelTag reuses processed tags for its format string."""
+    context['label_fmts']['heading'] = '@label.title'
+    kind = ('heading',)
+    tag = mocktag_cls(name='label', content='My title', attributes='',
+                      context=context)
+    label_id = create_label(tag=tag, kind=kind)
+
+    labeltag = LabelTag(name='label', content=label_id, attributes='',
+                        context=context)
+    assert labeltag.html == '<span class="label">My title</span>\n'
+    processed_tag = labeltag.processed_tag('My title', target='.html')
+    assert labeltag.html == '<span class="label">My title</span>\n'
+    assert (labeltag.processed_tag('My title', target='.html') is
+            processed_tag)
+
+    # Changing the format string creates a new processed tag
+    context['label_fmts']['heading'] = 'Title: @label.title'
+    assert labeltag.html == '<span class="label">Title: My title</span>\n'
+    assert (labeltag.processed_tag('Title: My title', target='.html') is not
+            processed_tag)
+
+
 # Test xhtml targets
 
 def test_labelanchor_xhtml(context, mocktag_cls, is_xml):
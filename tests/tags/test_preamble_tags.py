@@ -1,22 +1,26 @@
 """
 Test the preamble tags.
 """
+from types import MappingProxyType
+
 from disseminate.tags.preamble import Authors, Titlepage
 
 
+# The context entries for the authors tag tests. These are read-only so that
+# the same entries are shared by the tests of each target.
+author_entries = (MappingProxyType({'author': 'Justin L Lorieau'}),
+                  MappingProxyType({'authors': 'Fred Kay, D Smith'}),
+                  MappingProxyType({'authors': ['A', 'B', 'C']}))
+
+
 # tex targets
 
 def test_authors_tag_tex(context_cls):
     """Test the rendering of the authors tag in tex."""
     # setup the tag
-    for context, key in [({'author': 'Justin L Lorieau'},
-                          'Justin L Lorieau'),
-                         ({'authors': 'Fred Kay, D Smith'},
-                          'Fred Kay and D Smith'),
-                         ({'authors': ['A', 'B', 'C']},
-                          'A, B and C'),
-                         ]:
-        context = context_cls(**context)
+    keys = ('Justin L Lorieau', 'Fred Kay and D Smith', 'A, B and C')
+    for entries, key in zip(author_entries, keys):
+        context = context_cls(**entries)
 
         tag = Authors(name='authors', content='', attributes=tuple(),
                       context=context)
@@ -47,14 +51,11 @@ def test_titlepage_tag_tex(doc):
 def test_authors_tag_html(context_cls):
     """Test the rendering of the authors tag in html."""
     # setup the tag
-    for context, key in [({'author': 'Justin L Lorieau'},
-                          '<span class="authors">Justin L Lorieau</span>'),
-                         ({'authors': 'Fred Kay, D Smith'},
-                          '<span class="authors">Fred Kay and D Smith</span>'),
-                         ({'authors': ['A', 'B', 'C']},
-                          '<span class="authors">A, B and C</span>'),
-                         ]:
-        context = context_cls(**context)
+    keys = ('<span class="authors">Justin L Lorieau</span>',
+            '<span class="authors">Fred Kay and D Smith</span>',
+            '<span class="authors">A, B and C</span>')
+    for entries, key in zip(author_entries, keys):
+        context = context_cls(**entries)
         tag = Authors(name='authors', content='', attributes=tuple(),
                       context=context)
         tag.html == key
@@ -80,15 +81,11 @@ def test_titlepage_tag_html(doc):
 def test_authors_tag_xhtml(context_cls, is_xml):
     """Test the rendering of the authors tag in xhtml."""
     # setup the tag
-    for context, key in [({'author': 'Justin L Lorieau'},
-                          '<span class="authors">Justin L Lorieau</span>\n'),
-                         ({'authors': 'Fred Kay, D Smith'},
-                          '<span class="authors">Fred Kay and D Smith'
-                          '</span>\n'),
-                         ({'authors': ['A', 'B', 'C']},
-                          '<span class="authors">A, B and C</span>\n'),
-                         ]:
-        context = context_cls(**context)
+    keys = ('<span class="authors">Justin L Lorieau</span>\n',
+            '<span class="authors">Fred Kay and D Smith</span>\n',
+            '<span class="authors">A, B and C</span>\n')
+    for entries, key in zip(author_entries, keys):
+        context = context_cls(**entries)
         tag = Authors(name='authors', content='', attributes=tuple(),
                       context=context)
         assert tag.xhtml == key
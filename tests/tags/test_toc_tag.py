@@ -78,6 +78,20 @@ def test_toc_get_labels(load_example):
     assert labels[2].kind == ('heading', 'section')
     assert labels[2].order == (4, 3)
 
+    # 2. The labels are cached until labels are added to or removed from the
+    #    label manager
+    label_manager = doc.context['label_manager']
+    assert toc.get_labels() == labels
+    assert toc._labels_cache[0][-1] == label_manager.version
+
+    label_manager.add_content_label(id='heading-new',
+                                    kind=('heading', 'section'),
+                                    title='New Heading', context=doc.context)
+    labels = toc.get_labels()
+    assert len(labels) == 4
+    assert 'heading-new' in [label.id for label in labels]
+    assert toc._labels_cache[0][-1] == label_manager.version
+
 
 def test_toc_reference_tags(load_example):
     """Test the get_labels_by_kind method."""
@@ -340,6 +354,16 @@ def test_toc_heading_html(load_example):
            '</ol>\n')
     assert toc.html == key
 
+    # 2.3. The formatted html is cached until labels are added or removed
+    html = toc.html
+    assert toc.html is html
+
+    label_manager = doc.context['label_manager']
+    label_manager.add_content_label(id='heading-new',
+                                    kind=('heading', 'section'),
+                                    title='New Heading', context=doc.context)
+    assert 'New Heading' in toc.html
+
 
 # xhtml target
 
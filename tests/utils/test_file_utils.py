@@ -1,18 +1,15 @@
 """
 Test file utilities
 """
-import pathlib
-
 import pytest
 
 from disseminate.utils.file import link_or_copy
 
 
-def test_link_or_copy(tmpdir):
+def test_link_or_copy(tmp_path):
     """Test the link_or_copy function"""
-    tmpdir = pathlib.Path(tmpdir)
-    src = tmpdir / "source_file.txt"
-    dst = tmpdir / "destination_file.txt"
+    src = tmp_path / "source_file.txt"
+    dst = tmp_path / "destination_file.txt"
 
     # 1. Try an example with no source file. A FileNotFoundError is raised.
     assert not src.exists()  # Not created yet
@@ -1,18 +1,17 @@
 """
 Test string utilities.
 """
-import pathlib
-
+import sys
 from collections import namedtuple
 
-from disseminate.utils.string import (hashtxt, titlelize, strip_end_quotes,
-                                      str_to_dict, str_to_list, group_strings,
-                                      replace_macros)
+from disseminate.utils.string import (hashtxt, fasthash, titlelize,
+                                      strip_end_quotes, str_to_dict,
+                                      str_to_list, group_strings,
+                                      replace_macros, macro_tokens_cached)
 
 
-def test_hashtxt(tmpdir):
+def test_hashtxt(tmp_path):
     """Test the hashtxt function."""
-    tmpdir = pathlib.Path(tmpdir)
 
     # 1. Test a simple string
     assert 'b44117d75a' == hashtxt("My test hash")  # default truncate to 10
@@ -20,11 +19,37 @@ def test_hashtxt(tmpdir):
             hashtxt("My test hash", truncate=None))
 
     # 2. Test a binary file
-    test = tmpdir / 'test.bin'
+    test = tmp_path / 'test.bin'
     test.write_bytes(b'test')
     assert (hashtxt(test.read_bytes(), truncate=None) ==
             '098f6bcd4621d373cade4e832627b4f6')
 
+    # 3. Test the blake2b algorithm, which is generated at the truncated size
+    assert 'f04c0d07b0' == hashtxt("My test hash", algorithm='blake2b')
+    assert 'f04c0d07b' == hashtxt("My test hash", truncate=9,
+                                  algorithm='blake2b')
+
+    # Truncate values outside of the blake2b digest sizes use the full digest
+    full = hashtxt("My test hash", truncate=None, algorithm='blake2b')
+    assert len(full) == 128
+    assert hashtxt("My test hash", truncate=0, algorithm='blake2b') == ''
+    assert hashtxt("My test hash", truncate=200, algorithm='blake2b') == full
+
+    # 4. Test other algorithms
+    assert 'd528e83e03' == hashtxt("My test hash", algorithm='sha256')
+
+
+def test_fasthash():
+    """Test the fasthash function."""
+    # 1. Test that strings and bytes give the same 64-bit hash
+    h = fasthash("My test hash")
+    assert isinstance(h, int)
+    assert 0 <= h < 2 ** 64
+    assert h == fasthash(b"My test hash")
+
+    # 2. Test different strings
+    assert h != fasthash("My test hash2")
+
 
 def test_titlelize():
     """The the titlelize function."""
@@ -162,6 +187,11 @@ def test_str_to_dict():
     assert d == {'targets': 'pdf, tex'}
     assert str_to_list(d['targets']) == ['pdf', 'tex']
 
+    # Keys are interned
+    key = ''.join(['tar', 'gets'])
+    assert all(k is sys.intern(k) for k in d)
+    assert sys.intern(key) is list(d)[0]
+
 
 def test_str_to_dict_with_quotes():
     """Tests the parsing of strings into dicts including quotes."""
@@ -302,3 +332,16 @@ def test_replace_macros_submatches(context_cls):
             'My {y} component.')
     assert (replace_macros('My @vec component.', {'@vec': vec}) ==
             "My Vector(x='x', y='y', z='z') component.")
+
+
+def test_replace_macros_cached():
+    """Test replace_macros with the cached macro tokens of strings."""
+    macro_tokens_cached.cache_clear()
+
+    # The cached tokens are substituted with the current values of the
+    # macros
+    Label = namedtuple('Label', 'number')
+    s = "@b{Fig. @label.number}. "
+    assert replace_macros(s, {'@label': Label(1)}) == "@b{Fig. 1}. "
+    assert replace_macros(s, {'@label': Label(2)}) == "@b{Fig. 2}. "
+    assert macro_tokens_cached.cache_info().hits == 1